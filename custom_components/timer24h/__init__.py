@@ -1,8 +1,9 @@
 """
 Timer 24H Custom Integration for Home Assistant.
 
-This integration provides server-side timer scheduling with 24-hour (48 half-hour slots)
-precision, condition-based automation, and comprehensive state management.
+This integration provides server-side timer scheduling over 24-hour days (48
+half-hour slots by default, down to 5-minute slots), condition-based
+automation, and comprehensive state management.
 """
 
 import logging
@@ -13,10 +14,22 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.typing import ConfigType
-
-from .const import DOMAIN, PLATFORMS
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_FIRE_EVENTS,
+    CONF_MAX_CONCURRENCY,
+    CONF_SAVE_DELAY,
+    DEFAULT_FIRE_EVENTS,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_RESOLUTION,
+    DEFAULT_SAVE_DELAY,
+    DOMAIN,
+    PLATFORMS,
+)
 from .coordinator import Timer24HCoordinator
 from .initial_setup import async_create_initial_schedule_if_needed
+from .models import Schedule, SlotMask, slots_per_day
 from .storage import Timer24HStorage
 from .websocket_api import async_register_websocket_handlers
 
@@ -36,10 +49,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Setting up Timer 24H integration")
 
     # Initialize storage
-    storage = Timer24HStorage(hass)
+    storage = Timer24HStorage(
+        hass, save_delay=entry.options.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY)
+    )
 
     # Initialize coordinator
-    coordinator = Timer24HCoordinator(hass, storage)
+    coordinator = Timer24HCoordinator(
+        hass,
+        storage,
+        max_concurrency=entry.options.get(
+            CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY
+        ),
+        fire_events=entry.options.get(CONF_FIRE_EVENTS, DEFAULT_FIRE_EVENTS),
+    )
 
     # Store in hass.data
     if DOMAIN not in hass.data:
@@ -90,6 +112,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator = data["coordinator"]
         await coordinator.async_shutdown()
 
+        # Write any coalesced changes that are still pending
+        await data["storage"].async_flush()
+
     return bool(unload_ok)
 
 
@@ -133,16 +158,37 @@ async def _async_register_services(
         """Service to set a schedule."""
         schedule_id = call.data.get("schedule_id")
         target_entity_id = call.data.get("target_entity_id")
-        slots = call.data.get("slots", [False] * 48)
         enabled = call.data.get("enabled", True)
-        timezone = call.data.get("timezone")
+        timezone = call.data.get("timezone") or None
+        resolution = call.data.get("resolution", DEFAULT_RESOLUTION)
 
         if not schedule_id or not target_entity_id:
             _LOGGER.error("schedule_id and target_entity_id are required")
             return
 
-        if len(slots) != 48:
-            _LOGGER.error("slots must contain exactly 48 boolean values")
+        try:
+            # The service UI selector passes the resolution as a string
+            resolution = int(resolution)
+            size = slots_per_day(resolution)
+            if "intervals" in call.data:
+                slots = SlotMask.from_intervals(call.data["intervals"], size)
+            else:
+                slots = SlotMask.coerce(call.data.get("slots", SlotMask(0, size)), size)
+
+            # Optional per-weekday patterns; days not given use the slots
+            week = None
+            if call.data.get("week"):
+                week = Schedule.parse_week(call.data["week"], slots, size)
+        except ValueError as err:
+            _LOGGER.error("Invalid slots: %s", err)
+            return
+
+        if len(slots) != size:
+            _LOGGER.error("slots must contain exactly %d boolean values", size)
+            return
+
+        if timezone is not None and dt_util.get_time_zone(timezone) is None:
+            _LOGGER.error("Unknown timezone %s", timezone)
             return
 
         # Validate target entity exists
@@ -156,6 +202,8 @@ async def _async_register_services(
             slots=slots,
             enabled=enabled,
             timezone=timezone,
+            resolution=resolution,
+            week=week,
         )
 
     async def async_enable_schedule(call: Any) -> None:
@@ -196,6 +244,22 @@ async def _async_register_services(
 
         await coordinator.async_remove_schedule(schedule_id)
 
+    async def async_bulk_set(call: Any) -> None:
+        """Service to create, update and remove many schedules at once."""
+        items = call.data.get("schedules", [])
+        if not isinstance(items, list):
+            _LOGGER.error("schedules must be a list of schedule objects")
+            return
+
+        results = await coordinator.async_bulk_set(items)
+        for result in results:
+            if not result["success"]:
+                _LOGGER.error(
+                    "Bulk set failed for %s: %s",
+                    result["schedule_id"],
+                    result["error"],
+                )
+
     async def async_reconcile(call: Any) -> None:
         """Service to manually trigger reconciliation."""
         schedule_id = call.data.get("schedule_id")
@@ -210,6 +274,7 @@ async def _async_register_services(
     hass.services.async_register(DOMAIN, "disable", async_disable_schedule)
     hass.services.async_register(DOMAIN, "set_conditions", async_set_conditions)
     hass.services.async_register(DOMAIN, "remove", async_remove_schedule)
+    hass.services.async_register(DOMAIN, "bulk_set", async_bulk_set)
     hass.services.async_register(DOMAIN, "reconcile", async_reconcile)
 
     _LOGGER.info("Timer 24H services registered")
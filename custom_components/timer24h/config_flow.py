@@ -13,9 +13,15 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
 from .const import (
+    CONF_FIRE_EVENTS,
+    CONF_MAX_CONCURRENCY,
+    CONF_SAVE_DELAY,
     CONF_SCHEDULE_ID,
     CONF_TARGET_ENTITY_ID,
     CONF_TIMEZONE,
+    DEFAULT_FIRE_EVENTS,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_SAVE_DELAY,
     DOMAIN,
 )
 
@@ -229,6 +235,20 @@ class Timer24HOptionsFlow(config_entries.OptionsFlow):
                     "reconcile_on_startup",
                     default=current_options.get("reconcile_on_startup", True),
                 ): bool,
+                vol.Optional(
+                    CONF_SAVE_DELAY,
+                    default=current_options.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=300)),
+                vol.Optional(
+                    CONF_MAX_CONCURRENCY,
+                    default=current_options.get(
+                        CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=64)),
+                vol.Optional(
+                    CONF_FIRE_EVENTS,
+                    default=current_options.get(CONF_FIRE_EVENTS, DEFAULT_FIRE_EVENTS),
+                ): bool,
             }
         )
 
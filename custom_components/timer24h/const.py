@@ -12,12 +12,37 @@ CONF_SCHEDULES = "schedules"
 CONF_SCHEDULE_ID = "schedule_id"
 CONF_TARGET_ENTITY_ID = "target_entity_id"
 CONF_SLOTS = "slots"
+CONF_INTERVALS = "intervals"
+CONF_RESOLUTION = "resolution"
+CONF_WEEK = "week"
+CONF_SLOT_FORMAT = "slot_format"
 CONF_ENABLED = "enabled"
 CONF_TIMEZONE = "timezone"
 CONF_CONDITIONS = "conditions"
 CONF_ENTITY_ID = "entity_id"
 CONF_EXPECTED = "expected"
 CONF_POLICY = "policy"
+CONF_ACTION = "action"
+
+# Bulk actions
+BULK_ACTION_CREATE = "create"
+BULK_ACTION_UPDATE = "update"
+BULK_ACTION_REMOVE = "remove"
+
+BULK_ACTIONS = [BULK_ACTION_CREATE, BULK_ACTION_UPDATE, BULK_ACTION_REMOVE]
+
+# Preview formats
+PREVIEW_FORMAT_INTERVALS = "intervals"
+PREVIEW_FORMAT_SLOTS = "slots"
+
+PREVIEW_FORMATS = [PREVIEW_FORMAT_INTERVALS, PREVIEW_FORMAT_SLOTS]
+
+# Slot formats of serialized schedules
+SLOT_FORMAT_LIST = "list"
+SLOT_FORMAT_HEX = "hex"
+SLOT_FORMAT_INTERVALS = "intervals"
+
+SLOT_FORMATS = [SLOT_FORMAT_LIST, SLOT_FORMAT_HEX, SLOT_FORMAT_INTERVALS]
 
 # Condition policies
 POLICY_SKIP = "skip"
@@ -26,17 +51,50 @@ POLICY_DEFER = "defer"
 
 CONDITION_POLICIES = [POLICY_SKIP, POLICY_FORCE_OFF, POLICY_DEFER]
 
-# Storage
-STORAGE_VERSION = 1
+# Storage; version 2 stores slots as hex strings instead of boolean lists
+STORAGE_VERSION = 2
 STORAGE_KEY = "timer24h"
 
+# Options
+CONF_SAVE_DELAY = "save_delay"
+CONF_MAX_CONCURRENCY = "max_concurrency"
+CONF_FIRE_EVENTS = "fire_events"
+
 # Time constants
 SLOTS_PER_DAY = 48
 MINUTES_PER_SLOT = 30
+MINUTES_PER_DAY = 24 * 60
+
+# Slot resolutions a schedule can use, in minutes per slot
+DEFAULT_RESOLUTION = MINUTES_PER_SLOT
+RESOLUTIONS = [5, 10, 15, 30, 60]
+
+# Days of a weekly schedule (Monday first, matching datetime.weekday()) and
+# the day groups that can set several days at once
+DAYS_PER_WEEK = 7
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+WEEK_GROUPS = {
+    "weekdays": WEEKDAYS[:5],
+    "weekend": WEEKDAYS[5:],
+}
 
 # Default values
 DEFAULT_ENABLED = True
 DEFAULT_POLICY = POLICY_SKIP
+DEFAULT_SAVE_DELAY = 10  # Seconds to coalesce storage writes
+DEFAULT_MAX_CONCURRENCY = 4  # Service calls in flight per reconcile pass
+DEFAULT_FIRE_EVENTS = True
+
+# Schedules evaluated between event loop yields in large reconcile passes
+RECONCILE_CHUNK_SIZE = 500
+
+# Seconds between retries of schedules whose target entity was missing or
+# whose service call failed (they are also retried when the target changes)
+RETRY_DELAY = 60
+
+# Domains controlled through their own turn_on/turn_off services; other
+# targets go through the homeassistant domain
+DIRECT_SERVICE_DOMAINS = ["light", "switch", "fan", "climate"]
 
 # Entity states
 STATE_ON = "on"
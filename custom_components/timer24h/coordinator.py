@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
-from datetime import datetime, timedelta
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import AsyncExitStack
+from datetime import date, datetime, timedelta, tzinfo
+from time import perf_counter
 from typing import Any
 
-from homeassistant.core import HomeAssistant, callback
+import voluptuous as vol
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import (
     async_track_point_in_time,
     async_track_state_change_event,
@@ -15,36 +21,204 @@ from homeassistant.helpers.event import (
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    BULK_ACTION_CREATE,
+    BULK_ACTION_REMOVE,
+    BULK_ACTION_UPDATE,
+    BULK_ACTIONS,
+    CONDITION_POLICIES,
+    CONF_ACTION,
+    CONF_CONDITIONS,
+    CONF_ENABLED,
+    CONF_ENTITY_ID,
+    CONF_EXPECTED,
+    CONF_INTERVALS,
+    CONF_POLICY,
+    CONF_RESOLUTION,
+    CONF_SCHEDULE_ID,
+    CONF_SLOTS,
+    CONF_TARGET_ENTITY_ID,
+    CONF_TIMEZONE,
+    CONF_WEEK,
+    DEFAULT_FIRE_EVENTS,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_RESOLUTION,
+    DIRECT_SERVICE_DOMAINS,
     EVENT_SCHEDULE_UPDATED,
-    MINUTES_PER_SLOT,
-    SLOTS_PER_DAY,
+    MINUTES_PER_DAY,
+    RECONCILE_CHUNK_SIZE,
+    RESOLUTIONS,
+    RETRY_DELAY,
+    SLOT_FORMAT_HEX,
+    SLOT_FORMAT_INTERVALS,
+    SLOT_FORMAT_LIST,
+    WEEK_GROUPS,
+    WEEKDAYS,
+)
+from .metrics import Metrics
+from .models import (
+    Schedule,
+    ScheduleState,
+    SlotChange,
+    SlotMask,
+    SlotTimeline,
+    slots_per_day,
 )
-from .models import Schedule, ScheduleState
 from .storage import Timer24HStorage
 
 _LOGGER = logging.getLogger(__name__)
 
+# Slots as a hex string, a list of booleans or ["HH:MM", "HH:MM"] intervals
+INTERVALS_SCHEMA = [vol.ExactSequence([cv.string, cv.string])]
+SLOTS_SCHEMA = vol.Any(cv.string, [bool], INTERVALS_SCHEMA)
+
+CONDITION_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ENTITY_ID): cv.entity_id,
+        vol.Optional(CONF_EXPECTED): vol.Maybe(cv.string),
+        vol.Optional(CONF_POLICY): vol.In(CONDITION_POLICIES),
+    }
+)
+
+# One item of bulk_set, shared by the service and the websocket command
+BULK_ITEM_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SCHEDULE_ID): vol.All(cv.string, vol.Length(min=1)),
+        vol.Optional(CONF_ACTION): vol.In(BULK_ACTIONS),
+        vol.Optional(CONF_TARGET_ENTITY_ID): cv.entity_id,
+        vol.Exclusive(CONF_SLOTS, "slots"): SLOTS_SCHEMA,
+        vol.Exclusive(CONF_INTERVALS, "slots"): INTERVALS_SCHEMA,
+        vol.Optional(CONF_WEEK): vol.Maybe(
+            {vol.In([*WEEKDAYS, *WEEK_GROUPS]): SLOTS_SCHEMA}
+        ),
+        vol.Optional(CONF_ENABLED): cv.boolean,
+        vol.Optional(CONF_TIMEZONE): vol.Maybe(cv.time_zone),
+        vol.Optional(CONF_CONDITIONS): [CONDITION_SCHEMA],
+        vol.Optional(CONF_RESOLUTION): vol.All(vol.Coerce(int), vol.In(RESOLUTIONS)),
+    }
+)
+
+
+class StateSnapshot(Mapping[str, str]):
+    """Condition entity states captured for a single reconcile pass.
+
+    States are read from the state machine the first time an entity is looked
+    up and reused for the rest of the pass, so each schedule only pays for its
+    own condition entities and shared entities are read once.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty snapshot."""
+        self._hass = hass
+        self._states: dict[str, str] = {}
+
+    def __getitem__(self, entity_id: str) -> str:
+        """Return the captured state of an entity, capturing it if needed."""
+        state = self._states.get(entity_id)
+        if state is None:
+            entity = self._hass.states.get(entity_id)
+            state = entity.state if entity else "unknown"
+            self._states[entity_id] = state
+        return state
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over captured entity IDs."""
+        return iter(self._states)
+
+    def __len__(self) -> int:
+        """Return the number of captured entities."""
+        return len(self._states)
+
 
 class Timer24HCoordinator:
     """Coordinates all Timer 24H scheduling and state management."""
 
-    def __init__(self, hass: HomeAssistant, storage: Timer24HStorage) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        storage: Timer24HStorage,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        fire_events: bool = DEFAULT_FIRE_EVENTS,
+    ) -> None:
         """Initialize coordinator."""
         self.hass = hass
         self.storage = storage
 
+        # Whether EVENT_SCHEDULE_UPDATED is fired on the bus for automations
+        self._fire_events = fire_events
+
         # Schedule states
         self._schedule_states: dict[str, ScheduleState] = {}
         self._last_applied_states: dict[str, bool] = {}
 
-        # Timer queue (min-heap of (datetime, schedule_id))
-        self._timer_queue: list[tuple[datetime, str]] = []
+        # Actuation limits: at most max_concurrency service calls in flight,
+        # and one pass at a time per target entity
+        self._call_semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._target_locks: dict[str, asyncio.Lock] = {}
+
+        # Sequence number of the latest reconcile pass that evaluated each
+        # target; a pass only applies its decision while it is still the latest
+        self._pass_seq = 0
+        self._target_passes: dict[str, int] = {}
+
+        # Schedules whose change could not be applied because the target was
+        # missing or the service call failed (schedule_id -> target). They
+        # are reconciled again when the target's state changes and on a slow
+        # timer until a reconcile no longer needs them.
+        self._retry_schedules: dict[str, str] = {}
+        self._retry_targets: set[str] = set()
+        self._retry_state_unsub: CALLBACK_TYPE | None = None
+        self._retry_timer_unsub: CALLBACK_TYPE | None = None
+
+        # Timer queue (min-heap of transition times, each mapping to the
+        # schedules that flip at that instant)
+        self._timer_queue: list[datetime] = []
+        self._transition_groups: dict[datetime, set[str]] = {}
+        self._next_transitions: dict[str, datetime] = {}
         self._next_timer_handle = None
+        self._next_timer_time: datetime | None = None
 
-        # Condition tracking
+        # Condition tracking (entity_id -> schedule_ids, plus the reverse so a
+        # schedule can be unindexed after its conditions were edited in place)
+        self._condition_index: dict[str, set[str]] = {}
+        self._schedule_condition_entities: dict[str, frozenset[str]] = {}
         self._condition_entities: set[str] = set()
         self._condition_unsub = None
 
+        # Slot boundary dispatcher (schedule_id -> listeners, plus the slot
+        # data each schedule's listeners were last notified about)
+        self._slot_listeners: dict[str, list[Callable[[], None]]] = {}
+        self._slot_fingerprints: dict[str, tuple[int, int | None]] = {}
+        self._boundary_unsub: CALLBACK_TYPE | None = None
+        self._boundary_time: datetime | None = None
+
+        # Time zones by name (None for unknown names), the slot timelines of
+        # each (timezone, resolution) from the current local day on and that
+        # local day, plus the slot position of each at the instant last looked
+        # up, so a pass over many schedules computes it once per zone
+        self._zones: dict[str, tzinfo | None] = {}
+        self._timelines: dict[tuple[str | None, int, date], SlotTimeline] = {}
+        self._timeline_days: dict[tuple[str | None, int], date] = {}
+        self._zone_slots: dict[tuple[str | None, int], tuple[int, date, datetime]] = {}
+        self._zone_slots_now: datetime | None = None
+
+        # Per-schedule update listeners (schedule_id -> listeners)
+        self._update_listeners: dict[str, list[Callable[[], None]]] = {}
+
+        # Listeners for updates of any schedule
+        self._change_listeners: list[Callable[[str], None]] = []
+
+        # Listeners for schedules being added or removed
+        self._schedules_listeners: list[Callable[[set[str], set[str]], None]] = []
+
+        # Data version, bumped whenever a schedule or its evaluated state
+        # changes, plus the serialized form of each schedule until it changes
+        self._data_version = 0
+        self._state_keys: dict[str, tuple[Any, ...]] = {}
+        self._serialized: dict[str, dict[str, dict[str, Any]]] = {}
+
+        # Counters and duration histograms (see get_metrics)
+        self.metrics = Metrics()
+
         # Setup flag
         self._setup_complete = False
 
@@ -58,6 +232,7 @@ class Timer24HCoordinator:
             self._schedule_states[schedule.schedule_id] = ScheduleState(
                 schedule=schedule
             )
+            self._index_conditions(schedule)
 
         # Set up condition tracking
         await self._async_setup_condition_tracking()
@@ -75,27 +250,128 @@ class Timer24HCoordinator:
         """Shut down the coordinator."""
         _LOGGER.info("Shutting down Timer 24H coordinator")
 
-        # Cancel timer
-        if self._next_timer_handle:
-            self._next_timer_handle()
-            self._next_timer_handle = None
+        # Cancel timers
+        self._cancel_timer()
+        if self._boundary_unsub:
+            self._boundary_unsub()
+            self._boundary_unsub = None
+            self._boundary_time = None
 
         # Unsubscribe from condition changes
         if self._condition_unsub:
             self._condition_unsub()
             self._condition_unsub = None
 
+        # Stop retrying
+        self._retry_schedules.clear()
+        self._async_update_retry_tracking()
+
         # Clear state
         self._schedule_states.clear()
         self._last_applied_states.clear()
+        self._target_locks.clear()
+        self._target_passes.clear()
         self._timer_queue.clear()
+        self._transition_groups.clear()
+        self._next_transitions.clear()
+        self._condition_index.clear()
+        self._schedule_condition_entities.clear()
         self._condition_entities.clear()
+        self._slot_listeners.clear()
+        self._slot_fingerprints.clear()
+        self._timelines.clear()
+        self._timeline_days.clear()
+        self._zone_slots.clear()
+        self._zone_slots_now = None
+        self._update_listeners.clear()
+        self._change_listeners.clear()
+        self._schedules_listeners.clear()
+        self._state_keys.clear()
+        self._serialized.clear()
 
         self._setup_complete = False
         _LOGGER.info("Timer 24H coordinator shutdown complete")
 
-    def _get_current_slot_index(self, now: datetime | None = None) -> int:
-        """Get the current slot index (0-47)."""
+    def _get_zone(self, timezone: str | None) -> tzinfo:
+        """Get the time zone of a schedule, falling back to Home Assistant's."""
+        default_zone: tzinfo = dt_util.DEFAULT_TIME_ZONE
+        if timezone is None:
+            return default_zone
+
+        if timezone not in self._zones:
+            self._zones[timezone] = dt_util.get_time_zone(timezone)
+            if self._zones[timezone] is None:
+                _LOGGER.warning(
+                    "Unknown timezone %s, using the Home Assistant timezone",
+                    timezone,
+                )
+
+        return self._zones[timezone] or default_zone
+
+    def _get_timeline(
+        self, timezone: str | None, resolution: int, day: date
+    ) -> SlotTimeline:
+        """Get the slot timeline of a local day, building it on first use."""
+        key = (timezone, resolution, day)
+        timeline = self._timelines.get(key)
+        if timeline is None:
+            timeline = self._timelines[key] = SlotTimeline.build(
+                day, self._get_zone(timezone), resolution
+            )
+        return timeline
+
+    def _get_zone_slot(
+        self, now: datetime, timezone: str | None, resolution: int
+    ) -> tuple[int, date, datetime]:
+        """Get the slot index, local day and next slot boundary in a time zone.
+
+        Results are kept for the instant last asked about, so evaluating many
+        schedules at one tick does the calendar work once per zone.
+        """
+        if now != self._zone_slots_now:
+            self._zone_slots.clear()
+            self._zone_slots_now = now
+
+        key = (timezone, resolution)
+        zone_slot = self._zone_slots.get(key)
+        if zone_slot is not None:
+            return zone_slot
+
+        zone = self._get_zone(timezone)
+        day = now.astimezone(zone).date()
+        if self._timeline_days.get(key) != day:
+            # A new local day: drop the timelines of days that have passed,
+            # including ones built ahead of time for next-change lookups
+            self._timeline_days[key] = day
+            for stale in [k for k in self._timelines if k[:2] == key and k[2] < day]:
+                del self._timelines[stale]
+
+        timeline = self._get_timeline(timezone, resolution, day)
+        zone_slot = self._zone_slots[key] = (
+            timeline.slot_at(now),
+            day,
+            timeline.next_start(now).astimezone(zone),
+        )
+        return zone_slot
+
+    def _get_slot_start(
+        self, timezone: str | None, resolution: int, day: date, slot: int
+    ) -> datetime:
+        """Get when a slot counted from the start of a local day begins.
+
+        Slots past the end of the day continue into the following days.
+        """
+        days, slot = divmod(slot, MINUTES_PER_DAY // resolution)
+        timeline = self._get_timeline(timezone, resolution, day + timedelta(days=days))
+        return timeline.start_of(slot).astimezone(self._get_zone(timezone))
+
+    def _get_current_slot_index(
+        self,
+        now: datetime | None = None,
+        resolution: int = DEFAULT_RESOLUTION,
+        timezone: str | None = None,
+    ) -> int:
+        """Get the current slot index at a resolution in minutes per slot."""
         if now is None:
             now = dt_util.now()
 
@@ -103,14 +379,32 @@ class Timer24HCoordinator:
         if now.tzinfo is None:
             now = dt_util.as_local(now)
 
-        # Calculate slot index
-        total_minutes = now.hour * 60 + now.minute
-        slot_index = (total_minutes // MINUTES_PER_SLOT) % SLOTS_PER_DAY
+        return self._get_zone_slot(now, timezone, resolution)[0]
 
+    def _get_schedule_slot(self, schedule: Schedule, now: datetime) -> int:
+        """Get the index of the current slot in a schedule's mask.
+
+        Slots are counted in the schedule's own timezone. Weekly schedules
+        count them from Monday 00:00, so the transition table of the week
+        mask answers cross-midnight and cross-week flips.
+        """
+        if now.tzinfo is None:
+            now = dt_util.as_local(now)
+
+        slot_index, day, _ = self._get_zone_slot(
+            now, schedule.timezone, schedule.resolution
+        )
+        if schedule.is_weekly:
+            slot_index += day.weekday() * schedule.slots_per_day
         return slot_index
 
-    def _get_next_slot_time(self, now: datetime | None = None) -> datetime:
-        """Get the datetime of the next slot boundary."""
+    def _get_next_slot_time(
+        self,
+        now: datetime | None = None,
+        resolution: int = DEFAULT_RESOLUTION,
+        timezone: str | None = None,
+    ) -> datetime:
+        """Get the datetime of the next slot boundary at a resolution."""
         if now is None:
             now = dt_util.now()
 
@@ -118,37 +412,57 @@ class Timer24HCoordinator:
         if now.tzinfo is None:
             now = dt_util.as_local(now)
 
-        # Calculate next slot time
-        current_slot = self._get_current_slot_index(now)
-        next_slot = (current_slot + 1) % SLOTS_PER_DAY
+        return self._get_zone_slot(now, timezone, resolution)[2]
 
-        # If next slot is 0, it's tomorrow
-        if next_slot == 0:
-            next_day = now.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            ) + timedelta(days=1)
-            return next_day
-        else:
-            # Same day, calculate hour and minute
-            slot_minutes = next_slot * MINUTES_PER_SLOT
-            hour = slot_minutes // 60
-            minute = slot_minutes % 60
+    def get_next_change_time(
+        self,
+        change: SlotChange,
+        now: datetime | None = None,
+        resolution: int = DEFAULT_RESOLUTION,
+        timezone: str | None = None,
+    ) -> datetime:
+        """Get the datetime at which a schedule transition takes effect."""
+        if now is None:
+            now = dt_util.now()
 
-            next_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        # Convert to local time if needed
+        if now.tzinfo is None:
+            now = dt_util.as_local(now)
 
-            # If calculated time is in the past, add a day
-            if next_time <= now:
-                next_time += timedelta(days=1)
+        slot_index, day, _ = self._get_zone_slot(now, timezone, resolution)
+        return self._get_slot_start(
+            timezone, resolution, day, slot_index + change.slots_ahead
+        )
+
+    def _index_conditions(self, schedule: Schedule) -> None:
+        """Index a schedule under each of its condition entities."""
+        self._unindex_conditions(schedule.schedule_id)
+
+        entity_ids = frozenset(c.entity_id for c in schedule.conditions)
+        if not entity_ids:
+            return
 
-            return next_time
+        self._schedule_condition_entities[schedule.schedule_id] = entity_ids
+        for entity_id in entity_ids:
+            self._condition_index.setdefault(entity_id, set()).add(schedule.schedule_id)
+
+    def _unindex_conditions(self, schedule_id: str) -> None:
+        """Remove a schedule from the condition index."""
+        entity_ids = self._schedule_condition_entities.pop(schedule_id, frozenset())
+        for entity_id in entity_ids:
+            schedule_ids = self._condition_index.get(entity_id)
+            if schedule_ids is None:
+                continue
+            schedule_ids.discard(schedule_id)
+            if not schedule_ids:
+                del self._condition_index[entity_id]
 
     async def _async_setup_condition_tracking(self) -> None:
         """Set up tracking for condition entities."""
-        # Get all condition entities
-        new_entities = self.storage.get_all_condition_entities()
-
-        if new_entities == self._condition_entities:
+        # Condition entities are the keys of the index
+        if self._condition_index.keys() == self._condition_entities:
             return  # No changes needed
+        new_entities = set(self._condition_index)
 
         # Unsubscribe from old entities
         if self._condition_unsub:
@@ -166,6 +480,7 @@ class Timer24HCoordinator:
             """Handle condition entity state change."""
             entity_id = event.data.get("entity_id")
             if entity_id in self._condition_entities:
+                self.metrics.increment("condition_changes")
                 _LOGGER.debug(
                     "Condition entity %s changed, reconciling affected schedules",
                     entity_id,
@@ -184,174 +499,661 @@ class Timer24HCoordinator:
 
     async def _async_reconcile_schedules_with_condition(self, entity_id: str) -> None:
         """Reconcile all schedules that have conditions involving the given entity."""
-        for schedule_state in self._schedule_states.values():
-            schedule = schedule_state.schedule
-            for condition in schedule.conditions:
-                if condition.entity_id == entity_id:
-                    await self.async_reconcile_schedule(schedule.schedule_id)
-                    break
+        schedule_ids = self._condition_index.get(entity_id)
+        if schedule_ids:
+            await self.async_reconcile_schedules(list(schedule_ids))
 
     async def _async_rebuild_timer_queue(self) -> None:
-        """Rebuild the timer queue with upcoming slot boundaries."""
+        """Rebuild the timer queue with every schedule's next transition."""
         self._timer_queue.clear()
+        self._transition_groups.clear()
+        self._next_transitions.clear()
+
+        now = dt_util.now()
+        for schedule_id in self._schedule_states:
+            self._queue_next_transition(schedule_id, now)
+
+        self._arm_timer()
+
+    def _queue_next_transition(self, schedule_id: str, now: datetime) -> None:
+        """Queue the next on/off transition of a schedule, replacing any old one."""
+        self._unqueue_transition(schedule_id)
+
+        schedule_state = self._schedule_states.get(schedule_id)
+        if not schedule_state:
+            return
+
+        schedule = schedule_state.schedule
+        current_slot = self._get_schedule_slot(schedule, now)
+        change = schedule.get_next_change(current_slot)
+        if change is None:
+            return  # Disabled or never flips
 
-        if not self._schedule_states:
+        transition_time = self.get_next_change_time(
+            change, now, schedule.resolution, schedule.timezone
+        )
+        group = self._transition_groups.get(transition_time)
+        if group is None:
+            group = self._transition_groups[transition_time] = set()
+            heapq.heappush(self._timer_queue, transition_time)
+        group.add(schedule_id)
+        self._next_transitions[schedule_id] = transition_time
+
+    def _unqueue_transition(self, schedule_id: str) -> None:
+        """Drop a schedule's queued transition.
+
+        Emptied groups stay in the heap and are discarded when they surface.
+        """
+        transition_time = self._next_transitions.pop(schedule_id, None)
+        if transition_time is None:
             return
 
-        # Cancel existing timer
-        if self._next_timer_handle:
-            self._next_timer_handle()
-            self._next_timer_handle = None
+        group = self._transition_groups.get(transition_time)
+        if group is not None:
+            group.discard(schedule_id)
 
-        # Schedule next slot boundary
-        now = dt_util.now()
-        next_time = self._get_next_slot_time(now)
+    def _arm_timer(self) -> None:
+        """Point the timer at the earliest queued transition."""
+        queue = self._timer_queue
+        while queue and not self._transition_groups.get(queue[0]):
+            self._transition_groups.pop(heapq.heappop(queue), None)
+
+        next_time = queue[0] if queue else None
+        if next_time == self._next_timer_time and self._next_timer_handle:
+            return  # Already armed for this instant
+
+        self._cancel_timer()
+        if next_time is None:
+            _LOGGER.debug("No upcoming schedule transitions")
+            return
 
         self._next_timer_handle = async_track_point_in_time(
             self.hass, self._async_timer_tick, next_time
         )
+        self._next_timer_time = next_time
+
+        _LOGGER.debug(
+            "Scheduled next timer tick at %s for %d schedules",
+            next_time,
+            len(self._transition_groups[next_time]),
+        )
 
-        _LOGGER.debug("Scheduled next timer tick at %s", next_time)
+    def _cancel_timer(self) -> None:
+        """Cancel the pending timer, if any."""
+        if self._next_timer_handle:
+            self._next_timer_handle()
+            self._next_timer_handle = None
+        self._next_timer_time = None
 
     @callback
     def _async_timer_tick(self, now: datetime) -> None:
-        """Handle timer tick (slot boundary reached)."""
-        _LOGGER.debug("Timer tick at %s", now)
+        """Handle timer tick (one or more schedules reach a transition)."""
+        self._next_timer_handle = None
+        self._next_timer_time = None
+
+        # Collect every schedule whose transition is due
+        due: set[str] = set()
+        queue = self._timer_queue
+        while queue and queue[0] <= now:
+            due.update(self._transition_groups.pop(heapq.heappop(queue), ()))
+
+        _LOGGER.debug("Timer tick at %s, %d schedules flip", now, len(due))
+
+        # Queue the following transition of each flipped schedule
+        for schedule_id in due:
+            self._next_transitions.pop(schedule_id, None)
+            self._queue_next_transition(schedule_id, now)
+        self._arm_timer()
+
+        # Process only the schedules that flipped
+        if due:
+            self.metrics.increment("transition_ticks")
+            self.hass.async_create_task(self._async_reconcile_due(due, now))
+
+    async def _async_reconcile_due(self, schedule_ids: set[str], due: datetime) -> None:
+        """Reconcile schedules at their transition and record how late it ended."""
+        await self.async_reconcile_schedules(schedule_ids)
+        self.metrics.observe(
+            "transition_delay", (dt_util.utcnow() - due).total_seconds()
+        )
+
+    @callback
+    def async_add_listener(
+        self, schedule_id: str, update_callback: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for updates of a single schedule.
+
+        The callback runs whenever the schedule is reconciled, so an update
+        wakes only the listeners of that schedule. Returns a function that
+        removes the listener.
+        """
+        self._update_listeners.setdefault(schedule_id, []).append(update_callback)
+
+        @callback
+        def _remove_listener() -> None:
+            """Remove the update listener."""
+            callbacks = self._update_listeners.get(schedule_id)
+            if callbacks is None or update_callback not in callbacks:
+                return
+            callbacks.remove(update_callback)
+            if not callbacks:
+                del self._update_listeners[schedule_id]
+
+        return _remove_listener
+
+    @callback
+    def async_add_change_listener(
+        self, change_callback: Callable[[str], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for updates of any schedule.
+
+        The callback receives the ID of each reconciled schedule. Returns a
+        function that removes the listener.
+        """
+        self._change_listeners.append(change_callback)
+
+        @callback
+        def _remove_listener() -> None:
+            """Remove the change listener."""
+            if change_callback in self._change_listeners:
+                self._change_listeners.remove(change_callback)
+
+        return _remove_listener
+
+    @callback
+    def async_add_schedules_listener(
+        self, schedules_callback: Callable[[set[str], set[str]], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for schedules being added or removed.
+
+        The callback receives the sets of added and removed schedule IDs.
+        Returns a function that removes the listener.
+        """
+        self._schedules_listeners.append(schedules_callback)
+
+        @callback
+        def _remove_listener() -> None:
+            """Remove the schedules listener."""
+            if schedules_callback in self._schedules_listeners:
+                self._schedules_listeners.remove(schedules_callback)
+
+        return _remove_listener
+
+    @callback
+    def _async_notify_schedules_changed(
+        self, added: set[str], removed: set[str]
+    ) -> None:
+        """Tell listeners which schedules were added or removed."""
+        for schedules_callback in list(self._schedules_listeners):
+            schedules_callback(added, removed)
+
+    @callback
+    def async_add_slot_listener(
+        self, schedule_id: str, update_callback: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for slot boundaries that change a schedule's slot data.
+
+        The callback runs only when the schedule's current slot or next change
+        differs from what was last dispatched. Returns a function that removes
+        the listener.
+        """
+        listeners = self._slot_listeners.setdefault(schedule_id, [])
+        listeners.append(update_callback)
+        if schedule_id not in self._slot_fingerprints:
+            self._slot_fingerprints[schedule_id] = self._get_slot_fingerprint(
+                schedule_id, dt_util.now()
+            )
+
+        # Only this schedule's slots can bring the next boundary forward
+        self._arm_boundary_timer(schedule_ids=[schedule_id])
+
+        @callback
+        def _remove_listener() -> None:
+            """Remove the slot listener."""
+            callbacks = self._slot_listeners.get(schedule_id)
+            if callbacks is None or update_callback not in callbacks:
+                return
+            callbacks.remove(update_callback)
+            if not callbacks:
+                del self._slot_listeners[schedule_id]
+                self._slot_fingerprints.pop(schedule_id, None)
+
+        return _remove_listener
+
+    def _get_slot_fingerprint(
+        self, schedule_id: str, now: datetime
+    ) -> tuple[int, int | None]:
+        """Get the slot data a schedule's listeners are interested in."""
+        schedule_state = self._schedule_states.get(schedule_id)
+        if not schedule_state:
+            return self._get_current_slot_index(now), None
+
+        schedule = schedule_state.schedule
+        current_slot = self._get_schedule_slot(schedule, now)
+        change = schedule.get_next_change(current_slot)
+        return current_slot, change.slot_index if change else None
+
+    def _arm_boundary_timer(
+        self,
+        now: datetime | None = None,
+        schedule_ids: Iterable[str] | None = None,
+    ) -> None:
+        """Schedule the shared slot boundary tick if anyone is listening.
+
+        Slot boundaries of every timezone and resolution with listeners are
+        merged into one timeline, and the earliest one is armed, so the tick
+        follows the finest resolution in use. Pass schedule_ids to only
+        consider those schedules against the armed tick.
+        """
+        if not self._slot_listeners:
+            return
+
+        if now is None:
+            now = dt_util.now()
+        if schedule_ids is None:
+            schedule_ids = self._slot_listeners
+        grids = {
+            (schedule_state.schedule.timezone, schedule_state.schedule.resolution)
+            for schedule_id in schedule_ids
+            if (schedule_state := self._schedule_states.get(schedule_id))
+        } or {(None, DEFAULT_RESOLUTION)}
+
+        boundary = min(
+            self._get_next_slot_time(now, resolution, timezone)
+            for timezone, resolution in grids
+        )
+        if self._boundary_unsub:
+            if self._boundary_time is not None and self._boundary_time <= boundary:
+                return
+            self._boundary_unsub()
 
-        # Schedule next tick first
-        self.hass.async_create_task(self._async_rebuild_timer_queue())
+        self._boundary_unsub = async_track_point_in_time(
+            self.hass, self._async_boundary_tick, boundary
+        )
+        self._boundary_time = boundary
 
-        # Process all schedules for current slot
-        self.hass.async_create_task(self.async_reconcile_all())
+    @callback
+    def _async_boundary_tick(self, now: datetime) -> None:
+        """Notify listeners whose slot data changed at this boundary."""
+        self._boundary_unsub = None
+        self._boundary_time = None
+        started = perf_counter()
+
+        notified = 0
+        for schedule_id, listeners in list(self._slot_listeners.items()):
+            fingerprint = self._get_slot_fingerprint(schedule_id, now)
+            if self._slot_fingerprints.get(schedule_id) == fingerprint:
+                continue
+
+            self._slot_fingerprints[schedule_id] = fingerprint
+            notified += 1
+            for update_callback in list(listeners):
+                update_callback()
+
+        _LOGGER.debug("Slot boundary at %s, notified %d schedules", now, notified)
+        self._arm_boundary_timer(now)
+        self.metrics.observe("slot_boundary", perf_counter() - started)
 
     async def async_reconcile_all(self) -> None:
         """Reconcile all schedules to current state."""
         _LOGGER.debug("Reconciling all schedules")
+        await self.async_reconcile_schedules(list(self._schedule_states))
 
-        tasks = [
-            self.async_reconcile_schedule(schedule_id)
-            for schedule_id in list(self._schedule_states)
-        ]
+    async def async_reconcile_schedules(
+        self, schedule_ids: Iterable[str], states: StateSnapshot | None = None
+    ) -> None:
+        """Reconcile the given schedules to current state.
+
+        All schedules are evaluated against one state snapshot first, in
+        schedule ID order so that schedules sharing a target resolve the same
+        way every time. Large passes yield to the event loop between chunks.
+        The resulting changes are then actuated together as a single batch.
+        """
+        started = perf_counter()
+        if states is None:
+            states = StateSnapshot(self.hass)
+        now = dt_util.now()
+        self._pass_seq += 1
+        pass_seq = self._pass_seq
+
+        reconciled: list[str] = []
+        evaluated: list[ScheduleState] = []
+        for count, schedule_id in enumerate(sorted(schedule_ids), 1):
+            # Reconciling settles any pending retry; actuation queues it again
+            # if the change still cannot be applied
+            self._retry_schedules.pop(schedule_id, None)
+            schedule_state = self._evaluate_schedule(schedule_id, states, now)
+            if schedule_state:
+                # Only a decided state claims the target; a skip or defer must
+                # not supersede what another schedule decided for it
+                evaluated.append(schedule_state)
+                self._target_passes[schedule_state.schedule.target_entity_id] = (
+                    pass_seq
+                )
+            if schedule_id in self._schedule_states:
+                reconciled.append(schedule_id)
+            if count % RECONCILE_CHUNK_SIZE == 0:
+                await asyncio.sleep(0)
+
+        # Apply states that differ from last applied
+        if evaluated:
+            await self._async_actuate(evaluated, pass_seq)
+        self._async_update_retry_tracking()
+
+        # Notify listeners of every reconciled schedule, including ones whose
+        # conditions skipped or deferred, since their evaluation reason changed
+        change_listeners = list(self._change_listeners)
+        for schedule_id in reconciled:
+            self._update_state_key(schedule_id)
+            for update_callback in list(self._update_listeners.get(schedule_id, ())):
+                update_callback()
+            for change_callback in change_listeners:
+                change_callback(schedule_id)
+
+        # Fire bus events for schedules with a decided state
+        if self._fire_events:
+            for schedule_state in evaluated:
+                self.hass.bus.async_fire(
+                    EVENT_SCHEDULE_UPDATED,
+                    {
+                        "schedule_id": schedule_state.schedule.schedule_id,
+                        "desired_state": schedule_state.desired_state,
+                        "last_condition_evaluation": (
+                            schedule_state.last_condition_evaluation
+                        ),
+                    },
+                )
 
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        self.metrics.increment("reconcile_passes")
+        self.metrics.increment("schedules_reconciled", len(reconciled))
+        self.metrics.observe("reconcile", perf_counter() - started)
 
-    async def async_reconcile_schedule(self, schedule_id: str) -> None:
+    async def async_reconcile_schedule(
+        self, schedule_id: str, states: StateSnapshot | None = None
+    ) -> None:
         """Reconcile a specific schedule to current state."""
+        await self.async_reconcile_schedules([schedule_id], states)
+
+    def _evaluate_schedule(
+        self, schedule_id: str, states: StateSnapshot, now: datetime
+    ) -> ScheduleState | None:
+        """Work out the desired state of a schedule.
+
+        Returns None when the schedule is unknown or its conditions skip/defer,
+        in which case nothing should be applied.
+        """
         schedule_state = self._schedule_states.get(schedule_id)
         if not schedule_state:
             _LOGGER.warning("Cannot reconcile unknown schedule: %s", schedule_id)
-            return
+            return None
 
         schedule = schedule_state.schedule
 
         if not schedule.enabled:
             schedule_state.desired_state = False
             schedule_state.last_condition_evaluation = "Schedule disabled"
-        else:
-            # Get current slot
-            now = dt_util.now()
-            current_slot = self._get_current_slot_index(now)
+            return schedule_state
 
-            # Check if current slot is active
-            slot_active = schedule.is_active_at_slot(current_slot)
-
-            if not slot_active:
-                schedule_state.desired_state = False
-                schedule_state.last_condition_evaluation = (
-                    f"Slot {current_slot} inactive"
-                )
-            else:
-                # Evaluate conditions
-                states = {
-                    entity_id: self.hass.states.get(entity_id, default=None).state
-                    if self.hass.states.get(entity_id)
-                    else "unknown"
-                    for entity_id in self.storage.get_all_condition_entities()
-                }
+        # Check if current slot is active
+        current_slot = self._get_schedule_slot(schedule, now)
+        if not schedule.is_active_at_slot(current_slot):
+            schedule_state.desired_state = False
+            schedule_state.last_condition_evaluation = f"Slot {current_slot} inactive"
+            return schedule_state
+
+        # Evaluate conditions
+        condition_result, reason = schedule.evaluate_conditions(states)
+        schedule_state.last_condition_evaluation = reason
+
+        if condition_result is None:
+            # Skip or defer - don't change state
+            _LOGGER.debug("Schedule %s: %s", schedule_id, reason)
+            self.metrics.increment(
+                "deferred" if reason.startswith("Defer") else "skipped"
+            )
+            return None
 
-                condition_result, reason = schedule.evaluate_conditions(states)
-                schedule_state.last_condition_evaluation = reason
-
-                if condition_result is None:
-                    # Skip or defer - don't change state
-                    _LOGGER.debug("Schedule %s: %s", schedule_id, reason)
-                    return
-                elif condition_result:
-                    schedule_state.desired_state = True
-                else:
-                    schedule_state.desired_state = False
-
-        # Apply state if it differs from last applied
-        await self._async_apply_schedule_state(schedule_state)
-
-        # Fire event
-        self.hass.bus.async_fire(
-            EVENT_SCHEDULE_UPDATED,
-            {
-                "schedule_id": schedule_id,
-                "desired_state": schedule_state.desired_state,
-                "last_condition_evaluation": schedule_state.last_condition_evaluation,
-            },
-        )
+        if condition_result is False:
+            self.metrics.increment("forced_off")
 
-    async def _async_apply_schedule_state(self, schedule_state: ScheduleState) -> None:
-        """Apply the desired state for a schedule."""
-        schedule = schedule_state.schedule
-        desired = schedule_state.desired_state
-        last_applied = self._last_applied_states.get(schedule.target_entity_id)
+        schedule_state.desired_state = condition_result
+        return schedule_state
 
-        if desired is None or desired == last_applied:
-            return  # No change needed
+    async def _async_actuate(
+        self, schedule_states: list[ScheduleState], pass_seq: int
+    ) -> None:
+        """Apply desired states, batching service calls by domain and direction.
+
+        Each (service domain, turn_on/turn_off) pair results in one service call
+        carrying every target entity that needs that change. Targets are locked
+        for the duration so concurrent passes never race on the same entity,
+        and a target decided again by a later pass meanwhile is left to that
+        pass so a stale decision is never applied.
+        """
+        # Collect pending changes per target; later schedules in the pass win
+        pending: dict[str, tuple[bool, list[ScheduleState]]] = {}
+        for schedule_state in schedule_states:
+            desired = schedule_state.desired_state
+            if desired is None:
+                continue
+
+            target = schedule_state.schedule.target_entity_id
+            previous = pending.get(target)
+            if previous and previous[0] == desired:
+                previous[1].append(schedule_state)
+            else:
+                pending[target] = (desired, [schedule_state])
 
-        # Get target entity
-        entity = self.hass.states.get(schedule.target_entity_id)
-        if not entity:
-            _LOGGER.warning("Target entity %s not found", schedule.target_entity_id)
+        if not pending:
             return
 
-        # Determine service domain
-        domain = schedule.target_entity_id.split(".")[0]
-
-        try:
-            if desired:
-                await self.hass.services.async_call(
-                    domain
-                    if domain in ["light", "switch", "fan", "climate"]
-                    else "homeassistant",
-                    "turn_on",
-                    {"entity_id": schedule.target_entity_id},
+        async with AsyncExitStack() as stack:
+            # Lock targets in sorted order so overlapping passes cannot deadlock
+            for target in sorted(pending):
+                lock = self._target_locks.setdefault(target, asyncio.Lock())
+                await stack.enter_async_context(lock)
+
+            # Group changes by service domain and direction
+            batches: dict[tuple[str, str], dict[str, list[ScheduleState]]] = {}
+            for target, (desired, target_states) in pending.items():
+                if self._target_passes.get(target, pass_seq) != pass_seq:
+                    # A later pass decides this target; queue a retry in case
+                    # that pass ends up applying nothing
+                    self.metrics.increment("superseded_changes")
+                    self._queue_retry(target, target_states)
+                    continue
+
+                if desired == self._last_applied_states.get(target):
+                    continue  # No change needed
+
+                if self.hass.states.get(target) is None:
+                    _LOGGER.warning(
+                        "Target entity %s not found, retrying when it appears",
+                        target,
+                    )
+                    self.metrics.increment("targets_missing")
+                    self._queue_retry(target, target_states)
+                    continue
+
+                domain = target.split(".")[0]
+                service_domain = (
+                    domain if domain in DIRECT_SERVICE_DOMAINS else "homeassistant"
                 )
-                _LOGGER.info(
-                    "Turned on %s (schedule: %s)",
-                    schedule.target_entity_id,
-                    schedule.schedule_id,
+                service = "turn_on" if desired else "turn_off"
+                batches.setdefault((service_domain, service), {})[target] = (
+                    target_states
                 )
-            else:
-                await self.hass.services.async_call(
-                    domain
-                    if domain in ["light", "switch", "fan", "climate"]
-                    else "homeassistant",
-                    "turn_off",
-                    {"entity_id": schedule.target_entity_id},
+
+            await asyncio.gather(
+                *(
+                    self._async_call_batch(service_domain, service, targets)
+                    for (service_domain, service), targets in batches.items()
                 )
-                _LOGGER.info(
-                    "Turned off %s (schedule: %s)",
-                    schedule.target_entity_id,
-                    schedule.schedule_id,
+            )
+
+    async def _async_call_batch(
+        self,
+        service_domain: str,
+        service: str,
+        targets: dict[str, list[ScheduleState]],
+    ) -> None:
+        """Issue one batched service call, bounded by the concurrency limit.
+
+        If the batched call fails, each target gets a call of its own so one
+        failing entity cannot hold back the rest; only targets that still fail
+        are queued for retry.
+        """
+        desired = service == "turn_on"
+        entity_ids = list(targets)
+
+        if await self._async_call_service(service_domain, service, entity_ids):
+            applied = targets
+        elif len(entity_ids) == 1:
+            applied = {}
+        else:
+            results = await asyncio.gather(
+                *(
+                    self._async_call_service(service_domain, service, [target])
+                    for target in entity_ids
                 )
+            )
+            applied = {
+                target: targets[target]
+                for target, success in zip(entity_ids, results, strict=True)
+                if success
+            }
+
+        for target, target_states in targets.items():
+            if target not in applied:
+                self._queue_retry(target, target_states)
+
+        if not applied:
+            return
+
+        _LOGGER.info(
+            "Turned %s %d entities via %s.%s",
+            "on" if desired else "off",
+            len(applied),
+            service_domain,
+            service,
+        )
 
-            # Remember what we applied
-            self._last_applied_states[schedule.target_entity_id] = desired
-            schedule_state.last_applied_state = desired
+        self.metrics.increment(
+            "entities_turned_on" if desired else "entities_turned_off",
+            len(applied),
+        )
 
+        # Remember what we applied
+        for target, target_states in applied.items():
+            self._last_applied_states[target] = desired
+            for schedule_state in target_states:
+                schedule_state.last_applied_state = desired
+                _LOGGER.debug(
+                    "Turned %s %s (schedule: %s)",
+                    "on" if desired else "off",
+                    target,
+                    schedule_state.schedule.schedule_id,
+                )
+
+    async def _async_call_service(
+        self, service_domain: str, service: str, entity_ids: list[str]
+    ) -> bool:
+        """Call a service for the given entities and report whether it worked."""
+        self.metrics.increment("service_calls")
+        try:
+            async with self._call_semaphore:
+                with self.metrics.timer("service_call"):
+                    await self.hass.services.async_call(
+                        service_domain, service, {"entity_id": entity_ids}
+                    )
         except Exception as err:
+            self.metrics.increment("service_call_errors")
             _LOGGER.error(
-                "Failed to control %s for schedule %s: %s",
-                schedule.target_entity_id,
-                schedule.schedule_id,
+                "Failed to call %s.%s for %s: %s",
+                service_domain,
+                service,
+                ", ".join(entity_ids),
                 err,
             )
+            return False
+        return True
+
+    def _queue_retry(self, target: str, schedule_states: list[ScheduleState]) -> None:
+        """Queue schedules whose change could not be applied to a target."""
+        for schedule_state in schedule_states:
+            self._retry_schedules[schedule_state.schedule.schedule_id] = target
+
+    def _release_targets(self, targets: set[str]) -> None:
+        """Drop the bookkeeping of targets no schedule points at any more.
+
+        Locks still held by an actuation in progress are left alone.
+        """
+        in_use = {
+            schedule_state.schedule.target_entity_id
+            for schedule_state in self._schedule_states.values()
+        }
+        for target in targets - in_use:
+            lock = self._target_locks.get(target)
+            if lock is not None and not lock.locked():
+                del self._target_locks[target]
+            self._target_passes.pop(target, None)
+
+    @callback
+    def _async_update_retry_tracking(self) -> None:
+        """Follow the targets of queued retries and arm the retry timer."""
+        targets = set(self._retry_schedules.values())
+        if targets != self._retry_targets:
+            if self._retry_state_unsub:
+                self._retry_state_unsub()
+                self._retry_state_unsub = None
+
+            self._retry_targets = targets
+            if targets:
+                self._retry_state_unsub = async_track_state_change_event(
+                    self.hass, list(targets), self._async_retry_target_changed
+                )
+
+        if not targets:
+            if self._retry_timer_unsub:
+                self._retry_timer_unsub()
+                self._retry_timer_unsub = None
+        elif self._retry_timer_unsub is None:
+            self._retry_timer_unsub = async_track_point_in_time(
+                self.hass,
+                self._async_retry_tick,
+                dt_util.utcnow() + timedelta(seconds=RETRY_DELAY),
+            )
+
+    @callback
+    def _async_retry_target_changed(self, event: Any) -> None:
+        """Retry a target's schedules as soon as it appears or changes."""
+        if event.data.get("new_state") is None:
+            return  # Removed, keep waiting
+
+        entity_id = event.data.get("entity_id")
+        schedule_ids = [
+            schedule_id
+            for schedule_id, target in self._retry_schedules.items()
+            if target == entity_id
+        ]
+        if schedule_ids:
+            _LOGGER.debug("Target %s changed, retrying its schedules", entity_id)
+            self.metrics.increment("retries")
+            self.hass.async_create_task(self.async_reconcile_schedules(schedule_ids))
+
+    @callback
+    def _async_retry_tick(self, now: datetime) -> None:
+        """Retry every schedule whose change has not been applied yet."""
+        self._retry_timer_unsub = None
+        if not self._retry_schedules:
+            self._async_update_retry_tracking()
+            return
+
+        _LOGGER.debug("Retrying %d schedules", len(self._retry_schedules))
+        self.metrics.increment("retries")
+        self.hass.async_create_task(
+            self.async_reconcile_schedules(list(self._retry_schedules))
+        )
 
     # Schedule management methods
 
@@ -359,23 +1161,41 @@ class Timer24HCoordinator:
         self,
         schedule_id: str,
         target_entity_id: str,
-        slots: list[bool],
+        slots: SlotMask | list[bool],
         enabled: bool = True,
         timezone: str | None = None,
+        resolution: int = DEFAULT_RESOLUTION,
+        week: SlotMask | None = None,
     ) -> None:
         """Set a schedule."""
         schedule = Schedule(
             schedule_id=schedule_id,
             target_entity_id=target_entity_id,
-            slots=slots,
+            slots=SlotMask.coerce(slots, slots_per_day(resolution)),
             enabled=enabled,
             timezone=timezone,
+            resolution=resolution,
+            week=week,
         )
 
         await self.storage.async_add_schedule(schedule)
 
         # Update state
+        previous = self._schedule_states.get(schedule_id)
+        is_new = previous is None
         self._schedule_states[schedule_id] = ScheduleState(schedule=schedule)
+        if previous and previous.schedule.target_entity_id != target_entity_id:
+            self._release_targets({previous.schedule.target_entity_id})
+        self._mark_changed(schedule_id)
+        self._index_conditions(schedule)
+        self._queue_next_transition(schedule_id, dt_util.now())
+        self._arm_timer()
+        if schedule_id in self._slot_listeners:
+            # A finer resolution or another timezone can bring it forward
+            self._arm_boundary_timer(schedule_ids=[schedule_id])
+
+        if is_new:
+            self._async_notify_schedules_changed({schedule_id}, set())
 
         # Update condition tracking
         await self._async_setup_condition_tracking()
@@ -392,6 +1212,9 @@ class Timer24HCoordinator:
             schedule = await self.storage.async_get_schedule(schedule_id)
             if schedule:
                 self._schedule_states[schedule_id].schedule = schedule
+                self._mark_changed(schedule_id)
+                self._queue_next_transition(schedule_id, dt_util.now())
+                self._arm_timer()
                 await self.async_reconcile_schedule(schedule_id)
                 _LOGGER.info("Enabled schedule: %s", schedule_id)
 
@@ -402,6 +1225,9 @@ class Timer24HCoordinator:
             schedule = await self.storage.async_get_schedule(schedule_id)
             if schedule:
                 self._schedule_states[schedule_id].schedule = schedule
+                self._mark_changed(schedule_id)
+                self._queue_next_transition(schedule_id, dt_util.now())
+                self._arm_timer()
                 await self.async_reconcile_schedule(schedule_id)
                 _LOGGER.info("Disabled schedule: %s", schedule_id)
 
@@ -414,6 +1240,8 @@ class Timer24HCoordinator:
             schedule = await self.storage.async_get_schedule(schedule_id)
             if schedule:
                 self._schedule_states[schedule_id].schedule = schedule
+                self._mark_changed(schedule_id)
+                self._index_conditions(schedule)
 
                 # Update condition tracking
                 await self._async_setup_condition_tracking()
@@ -426,15 +1254,281 @@ class Timer24HCoordinator:
         """Remove a schedule."""
         if await self.storage.async_remove_schedule(schedule_id):
             # Remove from state
-            self._schedule_states.pop(schedule_id, None)
+            schedule_state = self._schedule_states.pop(schedule_id, None)
+            if schedule_state:
+                self._release_targets({schedule_state.schedule.target_entity_id})
+            self._mark_removed(schedule_id)
+            self._unindex_conditions(schedule_id)
+            self._unqueue_transition(schedule_id)
+            self._retry_schedules.pop(schedule_id, None)
+            self._arm_timer()
+            self._async_update_retry_tracking()
+            self._async_notify_schedules_changed(set(), {schedule_id})
 
             # Update condition tracking
             await self._async_setup_condition_tracking()
 
             _LOGGER.info("Removed schedule: %s", schedule_id)
 
+    async def async_bulk_set(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create, update and remove many schedules as one batch.
+
+        Each item is validated on its own against BULK_ITEM_SCHEMA and
+        reported in the returned result list. All valid items are then
+        committed together: one storage save, one condition tracking update
+        and one reconcile pass over the schedules that were created or
+        updated.
+        """
+        results: list[dict[str, Any]] = []
+        # Working copy of touched schedules; None marks a removal
+        pending: dict[str, Schedule | None] = {}
+
+        for raw_item in items:
+            try:
+                item = BULK_ITEM_SCHEMA(raw_item)
+            except vol.Invalid as err:
+                raw = raw_item if isinstance(raw_item, dict) else {}
+                results.append(
+                    {
+                        CONF_SCHEDULE_ID: raw.get(CONF_SCHEDULE_ID),
+                        CONF_ACTION: raw.get(CONF_ACTION),
+                        "success": False,
+                        "error": str(err),
+                    }
+                )
+                continue
+
+            schedule_id: str = item[CONF_SCHEDULE_ID]
+            current = (
+                pending[schedule_id]
+                if schedule_id in pending
+                else self.storage.data.get_schedule(schedule_id)
+            )
+            action = item.get(CONF_ACTION) or (
+                BULK_ACTION_UPDATE if current else BULK_ACTION_CREATE
+            )
+
+            try:
+                pending[schedule_id] = self._build_bulk_schedule(action, item, current)
+            except (KeyError, TypeError, ValueError) as err:
+                results.append(
+                    {
+                        CONF_SCHEDULE_ID: schedule_id,
+                        CONF_ACTION: action,
+                        "success": False,
+                        "error": str(err),
+                    }
+                )
+                continue
+
+            results.append(
+                {
+                    CONF_SCHEDULE_ID: schedule_id,
+                    CONF_ACTION: action,
+                    "success": True,
+                    "error": None,
+                }
+            )
+
+        upserts = [schedule for schedule in pending.values() if schedule]
+        removed_ids = [
+            schedule_id for schedule_id, schedule in pending.items() if not schedule
+        ]
+        if not upserts and not removed_ids:
+            return results
+
+        await self.storage.async_bulk_update(upserts, removed_ids)
+
+        # Update state, indexes and timers for everything at once
+        now = dt_util.now()
+        added: set[str] = set()
+        removed: set[str] = set()
+        old_targets: set[str] = set()
+        for schedule_id in removed_ids:
+            if schedule_state := self._schedule_states.pop(schedule_id, None):
+                removed.add(schedule_id)
+                old_targets.add(schedule_state.schedule.target_entity_id)
+            self._mark_removed(schedule_id)
+            self._unindex_conditions(schedule_id)
+            self._unqueue_transition(schedule_id)
+            self._retry_schedules.pop(schedule_id, None)
+
+        for schedule in upserts:
+            schedule_state = self._schedule_states.get(schedule.schedule_id)
+            if schedule_state:
+                old_targets.add(schedule_state.schedule.target_entity_id)
+                schedule_state.schedule = schedule
+            else:
+                self._schedule_states[schedule.schedule_id] = ScheduleState(
+                    schedule=schedule
+                )
+                added.add(schedule.schedule_id)
+            self._mark_changed(schedule.schedule_id)
+            self._index_conditions(schedule)
+            self._queue_next_transition(schedule.schedule_id, now)
+
+        self._release_targets(old_targets)
+        self._arm_timer()
+        if listened := [
+            schedule.schedule_id
+            for schedule in upserts
+            if schedule.schedule_id in self._slot_listeners
+        ]:
+            self._arm_boundary_timer(now, listened)
+        if added or removed:
+            self._async_notify_schedules_changed(added, removed)
+        await self._async_setup_condition_tracking()
+
+        # Reconcile only the schedules that were created or updated
+        await self.async_reconcile_schedules(
+            [schedule.schedule_id for schedule in upserts]
+        )
+
+        _LOGGER.info(
+            "Bulk set %d schedules, removed %d", len(upserts), len(removed_ids)
+        )
+        return results
+
+    def _build_bulk_schedule(
+        self, action: str, item: dict[str, Any], current: Schedule | None
+    ) -> Schedule | None:
+        """Build the resulting schedule for one bulk item (None for removal).
+
+        The item has already been validated against BULK_ITEM_SCHEMA.
+        """
+        schedule_id = item[CONF_SCHEDULE_ID]
+
+        if action == BULK_ACTION_REMOVE:
+            if current is None:
+                raise ValueError(f"Schedule {schedule_id} does not exist")
+            return None
+
+        if action == BULK_ACTION_CREATE:
+            if current is not None:
+                raise ValueError(f"Schedule {schedule_id} already exists")
+            data: dict[str, Any] = {CONF_SCHEDULE_ID: schedule_id}
+        elif action == BULK_ACTION_UPDATE:
+            if current is None:
+                raise ValueError(f"Schedule {schedule_id} does not exist")
+            data = current.to_dict()
+        else:
+            raise ValueError(f"Invalid action: {action}")
+
+        for key in (
+            CONF_TARGET_ENTITY_ID,
+            CONF_SLOTS,
+            CONF_ENABLED,
+            CONF_TIMEZONE,
+            CONF_CONDITIONS,
+            CONF_RESOLUTION,
+            CONF_WEEK,
+        ):
+            if key in item:
+                data[key] = item[key]
+
+        size = slots_per_day(data.get(CONF_RESOLUTION, DEFAULT_RESOLUTION))
+        if CONF_INTERVALS in item:
+            data[CONF_SLOTS] = SlotMask.from_intervals(item[CONF_INTERVALS], size)
+        elif current is not None and CONF_SLOTS not in item:
+            # Keep the current slots when only the resolution changes
+            data[CONF_SLOTS] = current.slots.resample(size)
+
+        if current is not None and current.is_weekly and CONF_WEEK not in item:
+            # Days that followed the slots follow the new ones; the rest keep
+            # their own pattern
+            data[CONF_WEEK] = {
+                day: data[CONF_SLOTS]
+                if (pattern := current.get_day_slots(index)) == current.slots
+                else pattern.resample(size)
+                for index, day in enumerate(WEEKDAYS)
+            }
+
+        target_entity_id = data.get(CONF_TARGET_ENTITY_ID)
+        if not target_entity_id:
+            raise ValueError("target_entity_id is required")
+        if (
+            CONF_TARGET_ENTITY_ID in item
+            and self.hass.states.get(target_entity_id) is None
+        ):
+            raise ValueError(f"Target entity {target_entity_id} does not exist")
+
+        return Schedule.from_dict(data)
+
+    # Data versioning
+
+    @property
+    def data_version(self) -> int:
+        """Return the version of all schedule data and states."""
+        return self._data_version
+
+    def _mark_changed(self, schedule_id: str) -> None:
+        """Record that a schedule was edited."""
+        self._data_version += 1
+        self._serialized.pop(schedule_id, None)
+
+    def _mark_removed(self, schedule_id: str) -> None:
+        """Record that a schedule was removed."""
+        self._data_version += 1
+        self._serialized.pop(schedule_id, None)
+        self._state_keys.pop(schedule_id, None)
+
+    def _update_state_key(self, schedule_id: str) -> None:
+        """Bump the data version if the evaluated state of a schedule changed."""
+        schedule_state = self._schedule_states[schedule_id]
+        state_key = (
+            schedule_state.desired_state,
+            schedule_state.last_applied_state,
+            schedule_state.last_condition_evaluation,
+            self._next_transitions.get(schedule_id),
+        )
+        if self._state_keys.get(schedule_id) != state_key:
+            self._state_keys[schedule_id] = state_key
+            self._data_version += 1
+
+    def get_serialized_schedule(
+        self, schedule_id: str, slot_format: str = SLOT_FORMAT_LIST
+    ) -> dict[str, Any] | None:
+        """Get the dictionary form of a schedule, cached until it changes.
+
+        The returned dictionary is shared between callers and must not be
+        modified.
+        """
+        schedule_state = self._schedule_states.get(schedule_id)
+        if schedule_state is None:
+            return None
+
+        formats = self._serialized.setdefault(schedule_id, {})
+        serialized = formats.get(slot_format)
+        if serialized is None:
+            serialized = formats[slot_format] = schedule_state.schedule.to_dict(
+                compact=slot_format == SLOT_FORMAT_HEX,
+                intervals=slot_format == SLOT_FORMAT_INTERVALS,
+            )
+        return serialized
+
     # API methods for WebSocket and services
 
+    def get_metrics(self) -> dict[str, Any]:
+        """Get the coordinator and storage metrics, plus current sizes.
+
+        Durations are in seconds.
+        """
+        return {
+            **self.metrics.as_dict(),
+            "gauges": {
+                "schedules": len(self._schedule_states),
+                "queued_transitions": len(self._next_transitions),
+                "retry_schedules": len(self._retry_schedules),
+                "condition_entities": len(self._condition_entities),
+                "update_listeners": sum(map(len, self._update_listeners.values())),
+                "slot_listeners": sum(map(len, self._slot_listeners.values())),
+                "change_listeners": len(self._change_listeners),
+                "schedules_listeners": len(self._schedules_listeners),
+                "data_version": self._data_version,
+            },
+            "storage": self.storage.get_metrics(),
+        }
+
     def get_schedule_state(self, schedule_id: str) -> ScheduleState | None:
         """Get the current state of a schedule."""
         return self._schedule_states.get(schedule_id)
@@ -443,41 +1537,112 @@ class Timer24HCoordinator:
         """Get all schedule states."""
         return self._schedule_states.copy()
 
-    def get_schedule_preview(self, schedule_id: str, hours: int = 24) -> list[bool]:
-        """Get a preview of schedule activation for the next N hours."""
+    def get_schedule_preview(
+        self,
+        schedule_id: str,
+        hours: int = 24,
+        states: StateSnapshot | None = None,
+    ) -> list[bool]:
+        """Get a preview of schedule activation for the next N hours.
+
+        There is one entry per slot at the schedule's resolution.
+        """
         schedule_state = self._schedule_states.get(schedule_id)
         if not schedule_state:
-            return [False] * (hours * 2)  # 2 slots per hour
+            return [False] * (hours * 60 // DEFAULT_RESOLUTION)
 
         schedule = schedule_state.schedule
+        slot_count = hours * 60 // schedule.resolution
         if not schedule.enabled:
-            return [False] * (hours * 2)
+            return [False] * slot_count
 
         # Get current conditions
-        states = {
-            entity_id: self.hass.states.get(entity_id, default=None).state
-            if self.hass.states.get(entity_id)
-            else "unknown"
-            for entity_id in self.storage.get_all_condition_entities()
-        }
+        if states is None:
+            states = StateSnapshot(self.hass)
 
         condition_result, _ = schedule.evaluate_conditions(states)
 
         # If conditions would prevent activation, return all False
         if condition_result is False:
-            return [False] * (hours * 2)
+            return [False] * slot_count
 
-        # Build preview based on schedule slots
+        # Build preview from the schedule's transition table, one run at a time.
+        # Skipped/deferred conditions still show the schedule as planned.
         now = dt_util.now()
-        current_slot = self._get_current_slot_index(now)
-
-        preview = []
-        for i in range(hours * 2):
-            slot_index = (current_slot + i) % SLOTS_PER_DAY
-            if condition_result is None:
-                # Conditions would skip/defer - show schedule but indicate it won't apply
-                preview.append(schedule.is_active_at_slot(slot_index))
-            else:
-                preview.append(schedule.is_active_at_slot(slot_index))
+        slot_index = self._get_schedule_slot(schedule, now)
+        active = schedule.is_active_at_slot(slot_index)
+
+        preview: list[bool] = []
+        remaining = slot_count
+        while remaining > 0:
+            change = schedule.get_next_change(slot_index)
+            run = min(change.slots_ahead if change else remaining, remaining)
+            preview.extend([active] * run)
+            remaining -= run
+            slot_index = (slot_index + run) % len(schedule.mask)
+            active = not active
 
         return preview
+
+    def get_schedule_intervals(
+        self,
+        schedule_id: str,
+        hours: int = 24,
+        states: StateSnapshot | None = None,
+        now: datetime | None = None,
+    ) -> list[tuple[datetime, datetime]] | None:
+        """Get the [start, end) intervals a schedule is on in the next N hours.
+
+        Intervals are read straight from the schedule's transitions, so the
+        work depends on the number of flips rather than the number of slots.
+        Returns None if the schedule does not exist.
+        """
+        schedule_state = self._schedule_states.get(schedule_id)
+        if not schedule_state:
+            return None
+
+        schedule = schedule_state.schedule
+        if not schedule.enabled:
+            return []
+
+        if states is None:
+            states = StateSnapshot(self.hass)
+
+        condition_result, _ = schedule.evaluate_conditions(states)
+        if condition_result is False:
+            return []
+
+        if now is None:
+            now = dt_util.now()
+        end = (dt_util.as_utc(now) + timedelta(hours=hours)).astimezone(now.tzinfo)
+
+        # Flips are looked up by slot in the day timelines, so intervals keep
+        # their real length across DST changes; skipped slots give no interval
+        timezone = schedule.timezone
+        resolution = schedule.resolution
+        slot_index = self._get_schedule_slot(schedule, now)
+        day_slot, day, _ = self._get_zone_slot(now, timezone, resolution)
+        active = schedule.is_active_at_slot(slot_index)
+
+        intervals: list[tuple[datetime, datetime]] = []
+        start = now
+        while start < end:
+            change = schedule.get_next_change(slot_index)
+            if change is None:
+                flip = end
+            else:
+                day_slot += change.slots_ahead
+                slot_index = change.slot_index
+                flip = min(
+                    self._get_slot_start(timezone, resolution, day, day_slot),
+                    end,
+                )
+            if active and flip > start:
+                if intervals and intervals[-1][1] == start:
+                    # An off run skipped by a DST gap joins its neighbours
+                    start = intervals.pop()[0]
+                intervals.append((start, flip))
+            start = flip
+            active = not active
+
+        return intervals
@@ -5,15 +5,21 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTime
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, EVENT_SCHEDULE_UPDATED, STATE_DISABLED, STATE_OFF, STATE_ON
+from .const import DOMAIN, STATE_DISABLED, STATE_OFF, STATE_ON
 from .coordinator import Timer24HCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,38 +34,57 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     storage = hass.data[DOMAIN][entry.entry_id]["storage"]
 
-    # Create sensor entities for existing schedules
-    schedules = await storage.async_get_all_schedules()
-    entities = []
-
-    for schedule_id, _schedule in schedules.items():
-        entities.append(Timer24HScheduleEntity(coordinator, schedule_id))
+    # Entities of this entry, keyed by schedule ID
+    entities: dict[str, Timer24HScheduleEntity] = {}
+    hass.data[DOMAIN][entry.entry_id]["entities"] = entities
 
-    async_add_entities(entities)
-
-    # Listen for new schedules
     @callback
-    def _schedule_updated(event: Any) -> None:
-        schedule_id = event.data.get("schedule_id")
-        if schedule_id:
-            # Check if entity already exists
-            existing_entities = [
-                entity
-                for entity in hass.data[DOMAIN].get("entities", [])
-                if hasattr(entity, "schedule_id") and entity.schedule_id == schedule_id
-            ]
+    def _async_create_entity(schedule_id: str) -> Timer24HScheduleEntity:
+        """Create and track an entity for a schedule."""
+        entity = Timer24HScheduleEntity(coordinator, schedule_id)
+        entities[schedule_id] = entity
 
-            if not existing_entities:
-                # Create new entity
-                entity = Timer24HScheduleEntity(coordinator, schedule_id)
-                async_add_entities([entity])
+        @callback
+        def _async_untrack() -> None:
+            if entities.get(schedule_id) is entity:
+                del entities[schedule_id]
 
-                # Store reference
-                if "entities" not in hass.data[DOMAIN]:
-                    hass.data[DOMAIN]["entities"] = []
-                hass.data[DOMAIN]["entities"].append(entity)
+        entity.async_on_remove(_async_untrack)
+        return entity
 
-    hass.bus.async_listen(EVENT_SCHEDULE_UPDATED, _schedule_updated)
+    # Create sensor entities for existing schedules, plus the metrics sensor
+    schedules = await storage.async_get_all_schedules()
+    async_add_entities(
+        [
+            *(_async_create_entity(schedule_id) for schedule_id in schedules),
+            Timer24HMetricsEntity(coordinator, entry.entry_id),
+        ]
+    )
+
+    # Follow schedules being added and removed
+    @callback
+    def _schedules_changed(added: set[str], removed: set[str]) -> None:
+        new_entities = [
+            _async_create_entity(schedule_id)
+            for schedule_id in added
+            if schedule_id not in entities
+        ]
+        if new_entities:
+            async_add_entities(new_entities)
+
+        entity_registry = er.async_get(hass)
+        for schedule_id in removed:
+            entity = entities.pop(schedule_id, None)
+            if entity is None or entity.entity_id is None:
+                continue
+
+            if entity_registry.async_get(entity.entity_id):
+                # Removing the registry entry also removes the entity
+                entity_registry.async_remove(entity.entity_id)
+            else:
+                hass.async_create_task(entity.async_remove())
+
+    entry.async_on_unload(coordinator.async_add_schedules_listener(_schedules_changed))
 
 
 class Timer24HScheduleEntity(SensorEntity, RestoreEntity):
@@ -89,6 +114,9 @@ class Timer24HScheduleEntity(SensorEntity, RestoreEntity):
         self._attrs: dict[str, Any] = {}
         self._available = True
 
+        # Computed attributes, rebuilt only after an invalidating update
+        self._attrs_cache: dict[str, Any] | None = None
+
     @property
     def schedule_id(self) -> str:
         """Return the schedule ID."""
@@ -112,7 +140,18 @@ class Timer24HScheduleEntity(SensorEntity, RestoreEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
+        """Return additional state attributes.
+
+        The attributes are cached until the schedule is reconciled (which
+        covers schedule edits and condition entity changes) or a slot boundary
+        changes its slot data.
+        """
+        if self._attrs_cache is None:
+            self._attrs_cache = self._build_state_attributes()
+        return self._attrs_cache
+
+    def _build_state_attributes(self) -> dict[str, Any]:
+        """Compute the state attributes."""
         schedule_state = self._coordinator.get_schedule_state(self._schedule_id)
         if not schedule_state:
             return {}
@@ -121,46 +160,44 @@ class Timer24HScheduleEntity(SensorEntity, RestoreEntity):
 
         # Get current slot info
         now = dt_util.now()
-        current_slot = self._coordinator._get_current_slot_index(now)
-        next_slot_time = self._coordinator._get_next_slot_time(now)
-
-        # Calculate next state change
-        next_change_slot = None
-        next_change_state = None
-        current_state = schedule.is_active_at_slot(current_slot)
-
-        for i in range(1, 48):  # Check next 47 slots (47.5 hours)
-            slot_index = (current_slot + i) % 48
-            slot_state = schedule.is_active_at_slot(slot_index)
-            if slot_state != current_state:
-                next_change_slot = slot_index
-                next_change_state = slot_state
-                break
-
-        next_change_time = None
-        if next_change_slot is not None:
-            # Calculate time for next change
-            slots_ahead = next_change_slot - current_slot
-            if slots_ahead <= 0:
-                slots_ahead += 48  # Next day
-            next_change_time = now + dt_util.dt.timedelta(minutes=slots_ahead * 30)
+        resolution = schedule.resolution
+        timezone = schedule.timezone
+        current_slot = self._coordinator._get_current_slot_index(
+            now, resolution, timezone
+        )
+        schedule_slot = self._coordinator._get_schedule_slot(schedule, now)
+        next_slot_time = self._coordinator._get_next_slot_time(
+            now, resolution, timezone
+        )
+
+        # Look up next state change in the schedule's transition table
+        change = schedule.get_next_change(schedule_slot)
+        next_change_time = (
+            self._coordinator.get_next_change_time(change, now, resolution, timezone)
+            if change
+            else None
+        )
 
         attrs = {
             "schedule_id": self._schedule_id,
             "target_entity_id": schedule.target_entity_id,
             "enabled": schedule.enabled,
             "timezone": schedule.timezone,
+            "resolution": resolution,
+            "weekly": schedule.is_weekly,
             "current_slot": current_slot,
-            "current_slot_active": schedule.is_active_at_slot(current_slot),
+            "current_slot_active": schedule.is_active_at_slot(schedule_slot),
             "next_slot_time": next_slot_time.isoformat() if next_slot_time else None,
             "desired_state": schedule_state.desired_state,
             "last_applied_state": schedule_state.last_applied_state,
             "last_condition_evaluation": schedule_state.last_condition_evaluation,
-            "active_slots_count": sum(schedule.slots),
-            "total_slots": len(schedule.slots),
+            "active_slots_count": schedule.active_slots_count,
+            "total_slots": len(schedule.mask),
             "conditions_count": len(schedule.conditions),
-            "next_change_slot": next_change_slot,
-            "next_change_state": next_change_state,
+            "next_change_slot": change.slot_index % schedule.slots_per_day
+            if change
+            else None,
+            "next_change_state": change.state if change else None,
             "next_change_time": next_change_time.isoformat()
             if next_change_time
             else None,
@@ -181,8 +218,10 @@ class Timer24HScheduleEntity(SensorEntity, RestoreEntity):
                 }
             attrs["condition_states"] = condition_states
 
-        # Add schedule slots for visualization
-        attrs["slots"] = schedule.slots
+        # Add today's slots for visualization, today being the local day in
+        # the schedule's timezone
+        _, day, _ = self._coordinator._get_zone_slot(now, timezone, resolution)
+        attrs["slots"] = schedule.get_day_slots(day.weekday()).to_list()
 
         return attrs
 
@@ -212,31 +251,73 @@ class Timer24HScheduleEntity(SensorEntity, RestoreEntity):
             self._state = last_state.state
             self._attrs = dict(last_state.attributes)
 
-        # Listen for schedule updates
-        @callback
-        def _schedule_updated(event: Any) -> None:
-            if event.data.get("schedule_id") == self._schedule_id:
-                self.async_write_ha_state()
-
+        # Listen for updates of this schedule only
         self.async_on_remove(
-            self.hass.bus.async_listen(EVENT_SCHEDULE_UPDATED, _schedule_updated)
+            self._coordinator.async_add_listener(
+                self._schedule_id, self._async_handle_update
+            )
         )
 
-        # Schedule periodic updates
-        @callback
-        def _periodic_update() -> None:
-            self.async_write_ha_state()
-
-        # Update every minute to reflect current slot changes
+        # Update when a slot boundary changes this schedule's slot data
         self.async_on_remove(
-            self.hass.helpers.event.async_track_time_interval(
-                _periodic_update, dt_util.dt.timedelta(minutes=1)
+            self._coordinator.async_add_slot_listener(
+                self._schedule_id, self._async_handle_update
             )
         )
 
-    async def async_will_remove_from_hass(self) -> None:
-        """When entity will be removed from hass."""
-        # Clean up any references
-        entities = self.hass.data[DOMAIN].get("entities", [])
-        if self in entities:
-            entities.remove(self)
+    @callback
+    def _async_handle_update(self) -> None:
+        """Drop cached attributes and write the new state."""
+        self._attrs_cache = None
+        self.async_write_ha_state()
+
+
+class Timer24HMetricsEntity(SensorEntity):
+    """Diagnostic sensor exposing the coordinator's internal metrics.
+
+    The state is how late the last schedule transition finished, so slow
+    boundaries can be alerted on. Disabled by default, and polled rather than
+    pushed so it adds nothing to the reconcile path.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 1
+    _attr_icon = "mdi:chart-timeline-variant"
+
+    def __init__(self, coordinator: Timer24HCoordinator, entry_id: str) -> None:
+        """Initialize the metrics entity."""
+        self._coordinator = coordinator
+        # Derived from the config entry so it cannot clash with a schedule ID
+        self._attr_unique_id = f"{entry_id}_metrics"
+        self._attr_name = "Timer 24H Metrics"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, "timer24h")},
+            "name": "Timer 24H",
+            "manufacturer": "Timer 24H Integration",
+            "model": "Schedule Controller",
+            "sw_version": "1.0.0",
+        }
+
+    async def async_update(self) -> None:
+        """Take a snapshot of the metrics."""
+        metrics = self._coordinator.get_metrics()
+        histograms = metrics["histograms"]
+
+        delay = histograms.get("transition_delay")
+        self._attr_native_value = delay["last"] * 1000 if delay else None
+
+        attrs: dict[str, Any] = {**metrics["counters"], **metrics["gauges"]}
+        for name, histogram in histograms.items():
+            attrs[f"{name}_count"] = histogram["count"]
+            attrs[f"{name}_mean_ms"] = round(histogram["mean"] * 1000, 3)
+            attrs[f"{name}_max_ms"] = round(histogram["max"] * 1000, 3)
+        storage = metrics["storage"]
+        for name, histogram in storage["histograms"].items():
+            attrs[f"storage_{name}_max_ms"] = round(histogram["max"] * 1000, 3)
+        for name, count in storage["counters"].items():
+            attrs[f"storage_{name}"] = count
+        self._attr_extra_state_attributes = attrs
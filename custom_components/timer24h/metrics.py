@@ -0,0 +1,97 @@
+"""Internal metrics for Timer 24H integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any
+
+# Upper bounds in seconds of the duration histogram buckets; one more bucket
+# holds everything slower
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class Histogram:
+    """Duration histogram with fixed buckets.
+
+    Observing is a bisect and a few additions, so it is cheap enough for the
+    reconcile and actuation paths.
+    """
+
+    __slots__ = ("_buckets", "count", "total", "max", "last")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._buckets = [0] * (len(DURATION_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record a duration."""
+        self._buckets[bisect_left(DURATION_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram with cumulative bucket counts."""
+        buckets: dict[str, int] = {}
+        cumulative = 0
+        for bound, count in zip(
+            (*DURATION_BUCKETS, "+Inf"), self._buckets, strict=True
+        ):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "last": self.last,
+            "buckets": buckets,
+        }
+
+
+class Metrics:
+    """Named counters and duration histograms."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.counters: dict[str, int] = {}
+        self.histograms: dict[str, Histogram] = {}
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Add to a counter."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record a duration in a histogram."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Record how long the block takes in a histogram."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, perf_counter() - start)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all counters and histograms."""
+        return {
+            "counters": dict(self.counters),
+            "histograms": {
+                name: histogram.as_dict() for name, histogram in self.histograms.items()
+            },
+        }
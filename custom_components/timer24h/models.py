@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time, timedelta, tzinfo
 from typing import Any
 
 from .const import (
@@ -12,14 +15,23 @@ from .const import (
     CONF_ENABLED,
     CONF_ENTITY_ID,
     CONF_EXPECTED,
+    CONF_INTERVALS,
     CONF_POLICY,
+    CONF_RESOLUTION,
     CONF_SCHEDULE_ID,
     CONF_SLOTS,
     CONF_TARGET_ENTITY_ID,
     CONF_TIMEZONE,
+    CONF_WEEK,
+    DAYS_PER_WEEK,
     DEFAULT_ENABLED,
     DEFAULT_POLICY,
+    DEFAULT_RESOLUTION,
+    MINUTES_PER_DAY,
+    RESOLUTIONS,
     SLOTS_PER_DAY,
+    WEEK_GROUPS,
+    WEEKDAYS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -71,21 +83,400 @@ class Condition:
             return state == self.expected
 
 
+def slots_per_day(resolution: int) -> int:
+    """Return the number of slots in a day at a resolution in minutes."""
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"Invalid resolution: {resolution}")
+    return MINUTES_PER_DAY // resolution
+
+
+def _time_to_boundary(value: str, size: int) -> int:
+    """Convert an "HH:MM" slot boundary into a slot index ("24:00" is size)."""
+    try:
+        hours, _, minutes = value.partition(":")
+        total = int(hours) * 60 + int(minutes)
+    except (AttributeError, ValueError) as err:
+        raise ValueError(f"Invalid interval time: {value}") from err
+
+    minutes_per_slot = MINUTES_PER_DAY // size
+    if not 0 <= total <= MINUTES_PER_DAY or total % minutes_per_slot:
+        raise ValueError(f"Interval time {value} is not on a slot boundary")
+    return total // minutes_per_slot
+
+
+def _boundary_to_time(index: int, size: int) -> str:
+    """Convert a slot boundary index into "HH:MM"."""
+    minutes = index * (MINUTES_PER_DAY // size)
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+class SlotMask(Sequence[bool]):
+    """Immutable bitset of schedule slots.
+
+    Bit ``i`` of the underlying integer is set when slot ``i`` is active, so
+    slot tests are a shift and a mask and counting active slots is a popcount.
+    The mask behaves like a read-only ``list[bool]`` for existing callers.
+
+    Because a mask never changes, its transition table is built lazily on first
+    use and cached; replacing a schedule's slots naturally discards it.
+    """
+
+    __slots__ = ("_bits", "_size", "_next_change")
+
+    def __init__(self, bits: int = 0, size: int = SLOTS_PER_DAY) -> None:
+        """Initialize the mask from an integer bitset."""
+        if size <= 0:
+            raise ValueError("Slot mask size must be positive")
+        if bits < 0 or bits >> size:
+            raise ValueError(f"Slot bits do not fit in {size} slots")
+        self._bits = bits
+        self._size = size
+        self._next_change: tuple[int, ...] | None = None
+
+    @classmethod
+    def from_list(cls, slots: Iterable[bool]) -> SlotMask:
+        """Create a mask from an iterable of booleans."""
+        bits = 0
+        size = 0
+        for index, active in enumerate(slots):
+            if active:
+                bits |= 1 << index
+            size = index + 1
+        return cls(bits, size or SLOTS_PER_DAY)
+
+    @classmethod
+    def from_hex(cls, value: str, size: int = SLOTS_PER_DAY) -> SlotMask:
+        """Create a mask from its compact hex wire form."""
+        try:
+            bits = int(value, 16)
+        except ValueError as err:
+            raise ValueError(f"Invalid slot hex string: {value}") from err
+        return cls(bits, size)
+
+    @classmethod
+    def from_intervals(
+        cls, intervals: Iterable[Sequence[str]], size: int = SLOTS_PER_DAY
+    ) -> SlotMask:
+        """Create a mask from ["HH:MM", "HH:MM"] on-intervals.
+
+        Each interval covers [start, end). An end before the start wraps past
+        midnight and "24:00" is the end of the day. Every interval is set as
+        one shifted bit run, so no per-slot list is built.
+        """
+        full = (1 << size) - 1
+        bits = 0
+        for interval in intervals:
+            try:
+                start_time, end_time = interval
+            except (TypeError, ValueError) as err:
+                raise ValueError(f"Invalid interval: {interval}") from err
+
+            start = _time_to_boundary(start_time, size) % size
+            end = _time_to_boundary(end_time, size)
+            if end == start:
+                raise ValueError(f"Empty interval: {interval}")
+            if end > start:
+                bits |= ((1 << (end - start)) - 1) << start
+            else:
+                bits |= (full >> start << start) | ((1 << end) - 1)
+        return cls(bits, size)
+
+    @classmethod
+    def from_days(cls, days: Sequence[SlotMask]) -> SlotMask:
+        """Join day masks into one mask covering all of them in order."""
+        size = len(days[0])
+        bits = 0
+        for index, day in enumerate(days):
+            if len(day) != size:
+                raise ValueError("All days must have the same number of slots")
+            bits |= day.bits << (index * size)
+        return cls(bits, size * len(days))
+
+    @classmethod
+    def coerce(
+        cls,
+        value: SlotMask | str | Iterable[bool] | Iterable[Sequence[str]],
+        size: int = SLOTS_PER_DAY,
+    ) -> SlotMask:
+        """Convert any accepted slot representation into a mask.
+
+        Accepts a mask, a hex string, a list of booleans or a list of
+        ["HH:MM", "HH:MM"] intervals. ``size`` is the number of slots for the
+        forms that do not carry it.
+        """
+        if isinstance(value, SlotMask):
+            return value
+        if isinstance(value, str):
+            return cls.from_hex(value, size)
+
+        # Booleans or intervals, told apart by the first item
+        items: list[Any] = list(value)
+        if not items:
+            return cls(0, size)
+        if isinstance(items[0], (list, tuple)):
+            return cls.from_intervals(items, size)
+        return cls.from_list(items)
+
+    @property
+    def bits(self) -> int:
+        """Return the raw integer bitset."""
+        return self._bits
+
+    @property
+    def size(self) -> int:
+        """Return the number of slots in the mask."""
+        return self._size
+
+    @property
+    def active_count(self) -> int:
+        """Return the number of active slots."""
+        return self._bits.bit_count()
+
+    def is_active(self, index: int) -> bool:
+        """Check if the slot at the given index is active."""
+        if index < 0 or index >= self._size:
+            return False
+        return bool(self._bits >> index & 1)
+
+    @property
+    def edges(self) -> int:
+        """Return a bitset of slots whose state differs from the previous slot.
+
+        The comparison wraps around, so slot 0 is compared with the last slot.
+        """
+        bits = self._bits
+        size = self._size
+        rotated = ((bits << 1) | (bits >> (size - 1))) & ((1 << size) - 1)
+        return bits ^ rotated
+
+    def slots_until_change(self, index: int) -> int | None:
+        """Return how many slots after ``index`` the state next flips.
+
+        Returns None when every slot has the same state.
+        """
+        if self._next_change is None:
+            self._next_change = self._build_next_change()
+        ahead = self._next_change[index % self._size]
+        return ahead or None
+
+    def _build_next_change(self) -> tuple[int, ...]:
+        """Build the per-slot distance to the next transition."""
+        size = self._size
+        edges = self.edges
+        table = [0] * size
+        if not edges:
+            return tuple(table)
+
+        # Walk backwards over two laps so every slot sees the first edge after
+        # it, including edges that are only reached by wrapping around.
+        next_edge: int | None = None
+        for position in range(2 * size - 1, -1, -1):
+            index = position % size
+            if next_edge is not None:
+                table[index] = next_edge - position
+            if edges >> index & 1:
+                next_edge = position
+        return tuple(table)
+
+    def day(self, index: int, size: int) -> SlotMask:
+        """Return the ``size`` slots of day ``index`` of a multi-day mask."""
+        return SlotMask(self._bits >> (index * size) & ((1 << size) - 1), size)
+
+    def resample(self, size: int) -> SlotMask:
+        """Convert the mask to another number of slots per day.
+
+        Runs are carried over as intervals, so refining always works while
+        coarsening requires every transition to fall on the coarser grid.
+        """
+        if size == self._size:
+            return self
+        return SlotMask.from_intervals(self.to_intervals(), size)
+
+    def to_list(self) -> list[bool]:
+        """Convert the mask to a list of booleans."""
+        bits = self._bits
+        return [bool(bits >> index & 1) for index in range(self._size)]
+
+    def to_hex(self) -> str:
+        """Convert the mask to its compact hex wire form."""
+        return f"{self._bits:0{(self._size + 3) // 4}x}"
+
+    def to_intervals(self) -> list[list[str]]:
+        """Convert the mask to merged ["HH:MM", "HH:MM"] on-intervals.
+
+        Runs are read from the edge bitset, so the work depends on the number
+        of transitions. A run crossing midnight is returned as one interval
+        whose end is before its start.
+        """
+        size = self._size
+        bits = self._bits
+        if not bits:
+            return []
+        if bits == (1 << size) - 1:
+            return [[_boundary_to_time(0, size), _boundary_to_time(size, size)]]
+
+        # An edge at an active slot starts a run, any other edge ends one
+        starts: list[int] = []
+        ends: list[int] = []
+        edges = self.edges
+        while edges:
+            lowest = edges & -edges
+            (starts if bits & lowest else ends).append(lowest.bit_length() - 1)
+            edges ^= lowest
+
+        # The first end belongs to the run that wraps from the previous day
+        if ends[0] < starts[0]:
+            ends.append(ends.pop(0))
+
+        return [
+            [_boundary_to_time(start, size), _boundary_to_time(end or size, size)]
+            for start, end in zip(starts, ends, strict=True)
+        ]
+
+    def __len__(self) -> int:
+        """Return the number of slots."""
+        return self._size
+
+    def __getitem__(self, index: Any) -> Any:
+        """Return a slot (or a list of slots for a slice)."""
+        if isinstance(index, slice):
+            return self.to_list()[index]
+        if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
+            raise IndexError("Slot index out of range")
+        return bool(self._bits >> index & 1)
+
+    def __iter__(self) -> Iterator[bool]:
+        """Iterate over slots."""
+        return iter(self.to_list())
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another mask or a sequence of booleans."""
+        if isinstance(other, SlotMask):
+            return self._bits == other._bits and self._size == other._size
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Return the hash of the mask."""
+        return hash((self._bits, self._size))
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return f"SlotMask(0x{self.to_hex()}, size={self._size})"
+
+
+def _serialize_mask(mask: SlotMask, compact: bool, intervals: bool) -> Any:
+    """Convert a day mask to its wire form."""
+    if intervals:
+        return mask.to_intervals()
+    return mask.to_hex() if compact else mask.to_list()
+
+
+@dataclass(frozen=True)
+class SlotChange:
+    """Represents the next on/off transition of a schedule."""
+
+    slot_index: int
+    slots_ahead: int
+    state: bool
+
+
+@dataclass(frozen=True)
+class SlotTimeline:
+    """UTC start instants of the local slots of one day in a time zone.
+
+    Each slot starts once: slots lying wholly in a DST gap are left out, and
+    the slot before clocks go back lasts until the next new wall-clock slot,
+    so no slot is repeated. Boundaries are then plain UTC comparisons.
+    """
+
+    day: date
+    starts: tuple[datetime, ...]
+    slots: tuple[int, ...]
+    end: datetime
+
+    @classmethod
+    def build(cls, day: date, zone: tzinfo, resolution: int) -> SlotTimeline:
+        """Build the timeline of a local day at a resolution in minutes."""
+        starts: list[datetime] = []
+        slots: list[int] = []
+        midnight = datetime.combine(day, time())
+        for slot in range(slots_per_day(resolution)):
+            wall = midnight + timedelta(minutes=slot * resolution)
+            # A start in a DST gap maps to the end of the gap
+            start = wall.replace(tzinfo=zone).astimezone(UTC)
+            if start.astimezone(zone).replace(tzinfo=None) >= wall + timedelta(
+                minutes=resolution
+            ):
+                continue  # Skipped by the clocks going forward
+            if starts and start <= starts[-1]:
+                continue  # Repeated after the clocks went back
+            starts.append(start)
+            slots.append(slot)
+
+        end = (
+            datetime.combine(day + timedelta(days=1), time(), tzinfo=zone)
+        ).astimezone(UTC)
+        return cls(day, tuple(starts), tuple(slots), end)
+
+    def _position(self, instant: datetime) -> int:
+        """Return the position of the slot an instant of this day falls in."""
+        return max(bisect_right(self.starts, instant) - 1, 0)
+
+    def slot_at(self, instant: datetime) -> int:
+        """Return the slot an instant of this day falls in."""
+        return self.slots[self._position(instant)]
+
+    def next_start(self, instant: datetime) -> datetime:
+        """Return the start of the slot after the one an instant falls in."""
+        position = self._position(instant) + 1
+        return self.starts[position] if position < len(self.starts) else self.end
+
+    def start_of(self, slot: int) -> datetime:
+        """Return when a slot starts, or the next slot if it is skipped."""
+        position = bisect_left(self.slots, slot)
+        return self.starts[position] if position < len(self.starts) else self.end
+
+
 @dataclass
 class Schedule:
-    """Represents a 24-hour schedule with conditions."""
+    """Represents a 24-hour schedule with conditions.
+
+    A schedule repeats ``slots`` every day unless ``week`` is set, in which
+    case ``week`` holds one day pattern per weekday (Monday first) as a
+    single mask, and slot indexes count from Monday 00:00.
+    """
 
     schedule_id: str
     target_entity_id: str
-    slots: list[bool] = field(default_factory=lambda: [False] * SLOTS_PER_DAY)
+    slots: SlotMask = field(default_factory=SlotMask)
     enabled: bool = DEFAULT_ENABLED
     timezone: str | None = None
     conditions: list[Condition] = field(default_factory=list)
+    resolution: int = DEFAULT_RESOLUTION
+    week: SlotMask | None = None
 
     def __post_init__(self) -> None:
-        """Validate schedule after initialization."""
-        if len(self.slots) != SLOTS_PER_DAY:
-            raise ValueError(f"Schedule must have exactly {SLOTS_PER_DAY} slots")
+        """Convert the slots now the resolution is known, and validate."""
+        size = slots_per_day(self.resolution)
+        self.slots = SlotMask.coerce(self.slots, size)
+        if self.week is not None:
+            self.week = SlotMask.coerce(self.week, size * DAYS_PER_WEEK)
+
+        # An empty mask (such as the default) fits any resolution
+        if not self.slots.bits and len(self.slots) != size:
+            self.slots = SlotMask(0, size)
+
+        if len(self.slots) != size:
+            raise ValueError(f"Schedule must have exactly {size} slots")
+
+        if self.week is not None and len(self.week) != size * DAYS_PER_WEEK:
+            raise ValueError(
+                f"Weekly schedule must have exactly {size * DAYS_PER_WEEK} slots"
+            )
 
         if not self.schedule_id:
             raise ValueError("Schedule ID cannot be empty")
@@ -93,43 +484,176 @@ class Schedule:
         if not self.target_entity_id:
             raise ValueError("Target entity ID cannot be empty")
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Store slots as a SlotMask whichever form they are assigned in.
+
+        Changing the resolution resamples the slots and week to it. The
+        dataclass __init__ sets the slots before the resolution, so the
+        initial values are left to __post_init__.
+        """
+        if "resolution" in self.__dict__:
+            size = MINUTES_PER_DAY // self.resolution
+            if name == "slots":
+                value = SlotMask.coerce(value, size)
+            elif name == "week" and value is not None:
+                value = SlotMask.coerce(value, size * DAYS_PER_WEEK)
+            elif name == "resolution" and value != self.resolution:
+                self._resample(slots_per_day(value))
+        super().__setattr__(name, value)
+
+    def _resample(self, size: int) -> None:
+        """Convert the slots and week to another number of slots per day.
+
+        Both are converted before either is stored, so a resolution the
+        slots do not fit leaves the schedule unchanged.
+        """
+        slots = self.slots.resample(size)
+        week = None
+        if self.week is not None:
+            week = SlotMask.from_days(
+                [
+                    self.get_day_slots(weekday).resample(size)
+                    for weekday in range(DAYS_PER_WEEK)
+                ]
+            )
+        super().__setattr__("slots", slots)
+        super().__setattr__("week", week)
+
+    @staticmethod
+    def parse_week(week_data: Mapping[str, Any], base: SlotMask, size: int) -> SlotMask:
+        """Build a week mask from day patterns keyed by day or day group.
+
+        Groups ("weekdays", "weekend") are applied before single days, and
+        days that are not mentioned use the ``base`` day pattern.
+        """
+        days = [base] * DAYS_PER_WEEK
+        for key in sorted(week_data, key=lambda key: key in WEEKDAYS):
+            if key in WEEK_GROUPS:
+                targets = WEEK_GROUPS[key]
+            elif key in WEEKDAYS:
+                targets = [key]
+            else:
+                raise ValueError(f"Invalid week day: {key}")
+
+            pattern = SlotMask.coerce(week_data[key], size)
+            if len(pattern) != size:
+                raise ValueError(f"Day {key} must have exactly {size} slots")
+            for day in targets:
+                days[WEEKDAYS.index(day)] = pattern
+        return SlotMask.from_days(days)
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Schedule:
         """Create Schedule from dictionary."""
         conditions_data = data.get(CONF_CONDITIONS, [])
         conditions = [Condition.from_dict(c) for c in conditions_data]
 
+        # Schedules stored before resolutions existed use the default one
+        resolution = data.get(CONF_RESOLUTION, DEFAULT_RESOLUTION)
+        size = slots_per_day(resolution)
+
+        if CONF_SLOTS in data:
+            slots = SlotMask.coerce(data[CONF_SLOTS], size)
+        elif CONF_INTERVALS in data:
+            slots = SlotMask.from_intervals(data[CONF_INTERVALS], size)
+        else:
+            slots = SlotMask(0, size)
+
+        week_data = data.get(CONF_WEEK)
+        week = cls.parse_week(week_data, slots, size) if week_data else None
+
         return cls(
             schedule_id=data[CONF_SCHEDULE_ID],
             target_entity_id=data[CONF_TARGET_ENTITY_ID],
-            slots=data.get(CONF_SLOTS, [False] * SLOTS_PER_DAY),
+            slots=slots,
             enabled=data.get(CONF_ENABLED, DEFAULT_ENABLED),
             timezone=data.get(CONF_TIMEZONE),
             conditions=conditions,
+            resolution=resolution,
+            week=week,
         )
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert Schedule to dictionary."""
+    def to_dict(self, compact: bool = False, intervals: bool = False) -> dict[str, Any]:
+        """Convert Schedule to dictionary.
+
+        With ``compact`` the slots are emitted as a hex string instead of a
+        list of booleans. With ``intervals`` they are replaced by an
+        ``intervals`` list of ["HH:MM", "HH:MM"] on-intervals. Weekly
+        schedules add a ``week`` mapping of each weekday to its day pattern
+        in the same form.
+        """
+        slot_key = CONF_INTERVALS if intervals else CONF_SLOTS
+        slot_data = {slot_key: _serialize_mask(self.slots, compact, intervals)}
+        if self.week is not None:
+            slot_data[CONF_WEEK] = {
+                day: _serialize_mask(self.get_day_slots(index), compact, intervals)
+                for index, day in enumerate(WEEKDAYS)
+            }
+
         return {
             CONF_SCHEDULE_ID: self.schedule_id,
             CONF_TARGET_ENTITY_ID: self.target_entity_id,
-            CONF_SLOTS: self.slots,
+            **slot_data,
             CONF_ENABLED: self.enabled,
             CONF_TIMEZONE: self.timezone,
             CONF_CONDITIONS: [c.to_dict() for c in self.conditions],
+            CONF_RESOLUTION: self.resolution,
         }
 
+    @property
+    def mask(self) -> SlotMask:
+        """Return the mask slot indexes refer to (the week or the day)."""
+        return self.week if self.week is not None else self.slots
+
+    @property
+    def is_weekly(self) -> bool:
+        """Return True if the schedule has a pattern per weekday."""
+        return self.week is not None
+
+    def get_day_slots(self, weekday: int) -> SlotMask:
+        """Return the day pattern used on a weekday (0 is Monday)."""
+        if self.week is None:
+            return self.slots
+        return self.week.day(weekday, len(self.slots))
+
     def is_active_at_slot(self, slot_index: int) -> bool:
         """Check if schedule is active at given slot index."""
         if not self.enabled:
             return False
 
-        if slot_index < 0 or slot_index >= SLOTS_PER_DAY:
-            return False
+        return self.mask.is_active(slot_index)
 
-        return self.slots[slot_index]
+    def get_next_change(self, slot_index: int) -> SlotChange | None:
+        """Get the first transition after the given slot index.
 
-    def evaluate_conditions(self, states: dict[str, str]) -> tuple[bool | None, str]:
+        Returns None for disabled schedules and for schedules that never flip.
+        """
+        if not self.enabled:
+            return None
+
+        mask = self.mask
+        ahead = mask.slots_until_change(slot_index)
+        if ahead is None:
+            return None
+
+        next_slot = (slot_index + ahead) % len(mask)
+        return SlotChange(
+            slot_index=next_slot,
+            slots_ahead=ahead,
+            state=mask.is_active(next_slot),
+        )
+
+    @property
+    def slots_per_day(self) -> int:
+        """Return the number of slots in a day at this schedule's resolution."""
+        return len(self.slots)
+
+    @property
+    def active_slots_count(self) -> int:
+        """Return the number of active slots (over the week if weekly)."""
+        return self.mask.active_count
+
+    def evaluate_conditions(self, states: Mapping[str, str]) -> tuple[bool | None, str]:
         """
         Evaluate all conditions and return (should_apply, reason).
 
@@ -210,11 +734,14 @@ class Timer24HData:
 
         return cls(schedules=schedules)
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert Timer24HData to dictionary."""
+    def to_dict(self, compact: bool = False) -> dict[str, Any]:
+        """Convert Timer24HData to dictionary.
+
+        With ``compact`` every schedule stores its slots as a hex string.
+        """
         return {
             "schedules": {
-                schedule_id: schedule.to_dict()
+                schedule_id: schedule.to_dict(compact=compact)
                 for schedule_id, schedule in self.schedules.items()
             }
         }
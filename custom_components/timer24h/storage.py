@@ -3,32 +3,61 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
+from time import perf_counter
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
-from .const import STORAGE_KEY, STORAGE_VERSION
-from .models import Schedule, Timer24HData
+from .const import DEFAULT_SAVE_DELAY, STORAGE_KEY, STORAGE_VERSION
+from .metrics import Metrics
+from .models import Schedule, SlotMask, Timer24HData
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class Timer24HStore(Store[dict[str, Any]]):
+    """Store that migrates data written by older versions."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Migrate stored data to the current version."""
+        if old_major_version > STORAGE_VERSION:
+            raise NotImplementedError
+
+        if old_major_version == 1:
+            # Version 1 stored slots as lists of booleans
+            old_data = Timer24HData.from_dict(old_data).to_dict(compact=True)
+
+        return old_data
+
+
 class Timer24HStorage:
     """Manages persistent storage for Timer 24H data."""
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(
+        self, hass: HomeAssistant, save_delay: float = DEFAULT_SAVE_DELAY
+    ) -> None:
         """Initialize storage."""
         self.hass = hass
-        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._store = Timer24HStore(hass, STORAGE_VERSION, STORAGE_KEY)
         self._data = Timer24HData()
         self._loaded = False
+        self._save_delay = save_delay
+        self._dirty = False
+        self.metrics = Metrics()
 
     async def async_load(self) -> None:
         """Load data from storage."""
         if self._loaded:
             return
 
+        started = perf_counter()
         try:
             stored_data = await self._store.async_load()
             if stored_data is not None:
@@ -43,6 +72,7 @@ class Timer24HStorage:
             _LOGGER.error("Failed to load Timer 24H data: %s", err)
             self._data = Timer24HData()
 
+        self.metrics.observe("load", perf_counter() - started)
         self._loaded = True
 
     async def async_save(self) -> None:
@@ -51,12 +81,59 @@ class Timer24HStorage:
             _LOGGER.warning("Attempting to save before loading")
             return
 
+        self.metrics.increment("saves")
         try:
-            await self._store.async_save(self._data.to_dict())
+            # Saving immediately also cancels any pending delayed save
+            self._dirty = False
+            with self.metrics.timer("save"):
+                await self._store.async_save(self._data.to_dict(compact=True))
             _LOGGER.debug("Saved Timer 24H data to storage")
         except Exception as err:
+            self._dirty = True
+            self.metrics.increment("save_errors")
             _LOGGER.error("Failed to save Timer 24H data: %s", err)
 
+    @callback
+    def async_schedule_save(self) -> None:
+        """Mark data dirty and schedule a coalesced save.
+
+        Every mutation within the save delay window results in a single write.
+        The store also writes pending data when Home Assistant shuts down.
+        """
+        if not self._loaded:
+            _LOGGER.warning("Attempting to save before loading")
+            return
+
+        self._dirty = True
+        self.metrics.increment("save_requests")
+        self._store.async_delay_save(self._data_to_save, self._save_delay)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Serialize data for a delayed save.
+
+        The store writes the result in the executor, so only serializing is
+        timed here.
+        """
+        self._dirty = False
+        self.metrics.increment("delayed_saves")
+        with self.metrics.timer("delayed_save_serialize"):
+            return self._data.to_dict(compact=True)
+
+    @property
+    def dirty(self) -> bool:
+        """Return True if there are changes not yet written to storage."""
+        return self._dirty
+
+    async def async_flush(self) -> None:
+        """Write pending changes to storage immediately."""
+        if self._dirty:
+            await self.async_save()
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get the storage metrics; durations are in seconds."""
+        return {**self.metrics.as_dict(), "dirty": self._dirty}
+
     @property
     def data(self) -> Timer24HData:
         """Get the data object."""
@@ -65,14 +142,14 @@ class Timer24HStorage:
     async def async_add_schedule(self, schedule: Schedule) -> None:
         """Add or update a schedule."""
         self._data.add_schedule(schedule)
-        await self.async_save()
+        self.async_schedule_save()
         _LOGGER.info("Added/updated schedule: %s", schedule.schedule_id)
 
     async def async_remove_schedule(self, schedule_id: str) -> bool:
         """Remove a schedule. Returns True if schedule existed."""
         existed = self._data.remove_schedule(schedule_id)
         if existed:
-            await self.async_save()
+            self.async_schedule_save()
             _LOGGER.info("Removed schedule: %s", schedule_id)
         else:
             _LOGGER.warning(
@@ -80,6 +157,23 @@ class Timer24HStorage:
             )
         return existed
 
+    async def async_bulk_update(
+        self, schedules: Iterable[Schedule], removed_ids: Iterable[str]
+    ) -> None:
+        """Add/replace and remove several schedules with a single save."""
+        added = 0
+        removed = 0
+        for schedule in schedules:
+            self._data.add_schedule(schedule)
+            added += 1
+        for schedule_id in removed_ids:
+            if self._data.remove_schedule(schedule_id):
+                removed += 1
+
+        if added or removed:
+            self.async_schedule_save()
+        _LOGGER.info("Bulk updated schedules: %d set, %d removed", added, removed)
+
     async def async_get_schedule(self, schedule_id: str) -> Schedule | None:
         """Get a schedule by ID."""
         return self._data.get_schedule(schedule_id)
@@ -92,7 +186,7 @@ class Timer24HStorage:
         self,
         schedule_id: str,
         target_entity_id: str | None = None,
-        slots: list[bool] | None = None,
+        slots: SlotMask | list[bool] | str | None = None,
         enabled: bool | None = None,
         timezone: str | None = None,
         conditions: list | None = None,
@@ -110,9 +204,12 @@ class Timer24HStorage:
             schedule.target_entity_id = target_entity_id
 
         if slots is not None:
-            if len(slots) != 48:
-                raise ValueError("Slots must contain exactly 48 boolean values")
-            schedule.slots = slots
+            mask = SlotMask.coerce(slots, schedule.slots_per_day)
+            if len(mask) != schedule.slots_per_day:
+                raise ValueError(
+                    f"Slots must contain exactly {schedule.slots_per_day} values"
+                )
+            schedule.slots = mask
 
         if enabled is not None:
             schedule.enabled = enabled
@@ -127,7 +224,7 @@ class Timer24HStorage:
                 Condition.from_dict(c) if isinstance(c, dict) else c for c in conditions
             ]
 
-        await self.async_save()
+        self.async_schedule_save()
         _LOGGER.info("Updated schedule: %s", schedule_id)
         return True
 
@@ -2,17 +2,61 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from bisect import bisect_right
+from datetime import datetime, timedelta
 from typing import Any
 
 import voluptuous as vol
 from homeassistant.components import websocket_api
-from homeassistant.core import HomeAssistant, callback
-
-from .const import DOMAIN
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_SLOT_FORMAT,
+    DOMAIN,
+    MINUTES_PER_DAY,
+    PREVIEW_FORMAT_INTERVALS,
+    PREVIEW_FORMAT_SLOTS,
+    PREVIEW_FORMATS,
+    SLOT_FORMAT_LIST,
+    SLOT_FORMATS,
+)
+from .coordinator import StateSnapshot, Timer24HCoordinator
+from .models import Schedule, ScheduleState
 
 _LOGGER = logging.getLogger(__name__)
 
+# Pagination, filters and field projection shared by the listing commands
+LISTING_SCHEMA = {
+    vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+    vol.Optional("cursor"): str,
+    vol.Optional("target_domain"): str,
+    vol.Optional("enabled"): bool,
+    vol.Optional("has_conditions"): bool,
+    vol.Optional("desired_state"): vol.Any(bool, None),
+    vol.Optional("fields"): [str],
+}
+
+# Options that turn the timer24h/list result from the plain list of schedules
+# into a versioned, paginated envelope; fields alone keeps the plain list
+LIST_ENVELOPE_OPTIONS = (
+    "if_version",
+    "limit",
+    "cursor",
+    "target_domain",
+    "enabled",
+    "has_conditions",
+    "desired_state",
+)
+
+# How the slots of returned schedules are serialized
+SLOT_FORMAT_SCHEMA = {
+    vol.Optional(CONF_SLOT_FORMAT, default=SLOT_FORMAT_LIST): vol.In(SLOT_FORMATS),
+}
+
 
 @callback
 def async_register_websocket_handlers(hass: HomeAssistant) -> None:
@@ -22,12 +66,94 @@ def async_register_websocket_handlers(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_preview_schedule)
     websocket_api.async_register_command(hass, ws_get_schedule_state)
     websocket_api.async_register_command(hass, ws_get_all_states)
+    websocket_api.async_register_command(hass, ws_bulk_set)
+    websocket_api.async_register_command(hass, ws_subscribe)
+    websocket_api.async_register_command(hass, ws_metrics)
+
+
+def _next_change_payload(
+    coordinator: Timer24HCoordinator,
+    schedule: Schedule,
+    now: datetime,
+) -> dict[str, Any]:
+    """Build the next-transition fields for a schedule."""
+    change = schedule.get_next_change(coordinator._get_schedule_slot(schedule, now))
+    if change is None:
+        return {
+            "next_change_slot": None,
+            "next_change_state": None,
+            "next_change_time": None,
+        }
+
+    return {
+        "next_change_slot": change.slot_index % schedule.slots_per_day,
+        "next_change_state": change.state,
+        "next_change_time": coordinator.get_next_change_time(
+            change, now, schedule.resolution, schedule.timezone
+        ).isoformat(),
+    }
+
+
+def _select_schedules(
+    coordinator: Timer24HCoordinator, msg: dict[str, Any]
+) -> tuple[list[tuple[str, ScheduleState]], str | None]:
+    """Pick the page of schedules matching the listing filters.
+
+    Schedules are ordered by schedule ID and the cursor is the last ID of the
+    previous page. Returns the page and the cursor of the next page, which is
+    None once no further schedules match.
+    """
+    all_states = coordinator.get_all_schedule_states()
+    schedule_ids = sorted(all_states)
+
+    cursor = msg.get("cursor")
+    if cursor is not None:
+        schedule_ids = schedule_ids[bisect_right(schedule_ids, cursor) :]
+
+    limit = msg.get("limit")
+    target_domain = msg.get("target_domain")
+    page: list[tuple[str, ScheduleState]] = []
+    for schedule_id in schedule_ids:
+        schedule_state = all_states[schedule_id]
+        schedule = schedule_state.schedule
+
+        if (
+            target_domain is not None
+            and schedule.target_entity_id.partition(".")[0] != target_domain
+        ):
+            continue
+        if "enabled" in msg and schedule.enabled != msg["enabled"]:
+            continue
+        if (
+            "has_conditions" in msg
+            and bool(schedule.conditions) != (msg["has_conditions"])
+        ):
+            continue
+        if (
+            "desired_state" in msg
+            and schedule_state.desired_state != msg["desired_state"]
+        ):
+            continue
+
+        if limit is not None and len(page) == limit:
+            return page, page[-1][0]
+        page.append((schedule_id, schedule_state))
+
+    return page, None
+
+
+def _project(row: dict[str, Any], fields: list[str] | None) -> dict[str, Any]:
+    """Keep only the requested fields of a listing row."""
+    if fields is None:
+        return row
+    return {key: value for key, value in row.items() if key in fields}
 
 
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "timer24h/get",
         vol.Required("schedule_id"): str,
+        **SLOT_FORMAT_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -60,7 +186,9 @@ async def ws_get_schedule(
     schedule_state = coordinator.get_schedule_state(schedule_id)
 
     result = {
-        "schedule": schedule.to_dict(),
+        "schedule": coordinator.get_serialized_schedule(
+            schedule_id, msg.get(CONF_SLOT_FORMAT, SLOT_FORMAT_LIST)
+        ),
         "state": {
             "desired_state": schedule_state.desired_state if schedule_state else None,
             "last_applied_state": schedule_state.last_applied_state
@@ -79,6 +207,8 @@ async def ws_get_schedule(
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "timer24h/list",
+        vol.Optional("if_version"): int,
+        **LISTING_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -87,7 +217,7 @@ async def ws_list_schedules(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """List all schedules."""
+    """List schedules, optionally filtered, paginated and projected."""
     # Get coordinator from first entry
     entries = hass.config_entries.async_entries(DOMAIN)
     if not entries:
@@ -97,47 +227,134 @@ async def ws_list_schedules(
         return
 
     coordinator = hass.data[DOMAIN][entries[0].entry_id]["coordinator"]
-    storage = hass.data[DOMAIN][entries[0].entry_id]["storage"]
 
-    schedules = await storage.async_get_all_schedules()
+    connection.send_result(msg["id"], _list_payload(coordinator, msg))
+
+
+def _list_payload(
+    coordinator: Timer24HCoordinator, msg: dict[str, Any]
+) -> dict[str, Any] | list[dict[str, Any]]:
+    """Build the timer24h/list result.
+
+    Without any of LIST_ENVELOPE_OPTIONS this is the plain list of schedules
+    older clients expect.
+    """
+    version = coordinator.data_version
+    envelope = any(option in msg for option in LIST_ENVELOPE_OPTIONS)
+    if envelope and msg.get("if_version") == version:
+        return {"version": version, "not_modified": True}
+
+    page, next_cursor = _select_schedules(coordinator, msg)
+    fields = msg.get("fields")
+
+    schedule_rows = []
+    for schedule_id, schedule_state in page:
+        schedule = schedule_state.schedule
+
+        row = {
+            "schedule_id": schedule_id,
+            "target_entity_id": schedule.target_entity_id,
+            "enabled": schedule.enabled,
+            "timezone": schedule.timezone,
+            "conditions_count": len(schedule.conditions),
+            "active_slots_count": schedule.active_slots_count,
+            "state": {
+                "desired_state": schedule_state.desired_state,
+                "last_applied_state": schedule_state.last_applied_state,
+                "last_condition_evaluation": schedule_state.last_condition_evaluation,
+            },
+        }
+        schedule_rows.append({"schedule_id": schedule_id, **_project(row, fields)})
+
+    if not envelope:
+        return schedule_rows
 
-    result = []
-    for schedule_id, schedule in schedules.items():
-        schedule_state = coordinator.get_schedule_state(schedule_id)
+    return {
+        "version": version,
+        "not_modified": False,
+        "next_cursor": next_cursor,
+        "schedules": schedule_rows,
+    }
+
+
+def _preview_slot_rows(
+    coordinator: Timer24HCoordinator,
+    preview: list[bool],
+    now: datetime,
+    schedule: Schedule,
+) -> list[dict[str, Any]]:
+    """Expand a per-slot preview into rows labeled in the schedule's timezone."""
+    resolution = schedule.resolution
+    current_slot = coordinator._get_current_slot_index(
+        now, resolution, schedule.timezone
+    )
+    now = now.astimezone(coordinator._get_zone(schedule.timezone))
+    slot_count = MINUTES_PER_DAY // resolution
+
+    rows = []
+    for i, active in enumerate(preview):
+        slot_time = now + timedelta(minutes=i * resolution)
+        slot_index = (current_slot + i) % slot_count
 
-        result.append(
+        rows.append(
             {
-                "schedule_id": schedule_id,
-                "target_entity_id": schedule.target_entity_id,
-                "enabled": schedule.enabled,
-                "timezone": schedule.timezone,
-                "conditions_count": len(schedule.conditions),
-                "active_slots_count": sum(schedule.slots),
-                "state": {
-                    "desired_state": schedule_state.desired_state
-                    if schedule_state
-                    else None,
-                    "last_applied_state": schedule_state.last_applied_state
-                    if schedule_state
-                    else None,
-                    "last_condition_evaluation": schedule_state.last_condition_evaluation
-                    if schedule_state
-                    else None,
-                },
+                "slot_index": slot_index,
+                "time": slot_time.isoformat(),
+                "hour": slot_time.hour,
+                "minute": slot_time.minute,
+                "active": active,
             }
         )
 
-    connection.send_result(msg["id"], result)
+    return rows
 
 
-@websocket_api.websocket_command(
-    {
-        vol.Required("type"): "timer24h/preview",
-        vol.Required("schedule_id"): str,
-        vol.Optional("hours", default=24): vol.All(
-            int, vol.Range(min=1, max=168)
-        ),  # 1 hour to 1 week
+def _preview_payload(
+    coordinator: Timer24HCoordinator,
+    schedule_id: str,
+    hours: int,
+    preview_format: str,
+    states: StateSnapshot,
+    now: datetime,
+) -> dict[str, Any] | None:
+    """Build the preview of one schedule, or None if it does not exist."""
+    schedule_state = coordinator.get_schedule_state(schedule_id)
+    if schedule_state is None:
+        return None
+
+    if preview_format == PREVIEW_FORMAT_SLOTS:
+        preview = coordinator.get_schedule_preview(schedule_id, hours, states)
+        return {
+            "slots": _preview_slot_rows(
+                coordinator, preview, now, schedule_state.schedule
+            )
+        }
+
+    intervals = coordinator.get_schedule_intervals(schedule_id, hours, states, now)
+    return {
+        "intervals": [
+            [start.isoformat(), end.isoformat()] for start, end in intervals or ()
+        ]
     }
+
+
+@websocket_api.websocket_command(
+    vol.All(
+        vol.Schema(
+            {
+                vol.Required("type"): "timer24h/preview",
+                vol.Exclusive("schedule_id", "schedules"): str,
+                vol.Exclusive("schedule_ids", "schedules"): [str],
+                vol.Optional("hours", default=24): vol.All(
+                    int, vol.Range(min=1, max=168)
+                ),  # 1 hour to 1 week
+                vol.Optional("format", default=PREVIEW_FORMAT_INTERVALS): vol.In(
+                    PREVIEW_FORMATS
+                ),
+            }
+        ),
+        cv.has_at_least_one_key("schedule_id", "schedule_ids"),
+    )
 )
 @websocket_api.async_response
 async def ws_preview_schedule(
@@ -145,9 +362,14 @@ async def ws_preview_schedule(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Get a preview of schedule activation for the next N hours."""
-    schedule_id = msg["schedule_id"]
+    """Get a preview of schedule activation for the next N hours.
+
+    By default the preview is a list of merged [start, end) on-intervals;
+    format "slots" returns one row per slot instead.
+    """
+    schedule_ids: list[str] | None = msg.get("schedule_ids")
     hours = msg.get("hours", 24)
+    preview_format = msg.get("format", PREVIEW_FORMAT_INTERVALS)
 
     # Get coordinator from first entry
     entries = hass.config_entries.async_entries(DOMAIN)
@@ -159,7 +381,30 @@ async def ws_preview_schedule(
 
     coordinator = hass.data[DOMAIN][entries[0].entry_id]["coordinator"]
 
-    preview = coordinator.get_schedule_preview(schedule_id, hours)
+    # One state snapshot and one "now" for every schedule in the request
+    states = StateSnapshot(hass)
+    now = dt_util.now()
+
+    if schedule_ids is not None:
+        result = {
+            "hours": hours,
+            "format": preview_format,
+            "start": now.isoformat(),
+            "schedules": {
+                preview_id: _preview_payload(
+                    coordinator, preview_id, hours, preview_format, states, now
+                )
+                for preview_id in schedule_ids
+            },
+        }
+        connection.send_result(msg["id"], result)
+        return
+
+    # The schema requires schedule_id when schedule_ids is not given
+    schedule_id: str = msg["schedule_id"]
+    preview = _preview_payload(
+        coordinator, schedule_id, hours, preview_format, states, now
+    )
 
     if preview is None:
         connection.send_error(
@@ -167,29 +412,13 @@ async def ws_preview_schedule(
         )
         return
 
-    # Convert to time-labeled format for easier consumption
-    from datetime import timedelta
-
-    from homeassistant.util import dt as dt_util
-
-    now = dt_util.now()
-    current_slot = coordinator._get_current_slot_index(now)
-
-    result = {"schedule_id": schedule_id, "hours": hours, "slots": []}
-
-    for i, active in enumerate(preview):
-        slot_time = now + timedelta(minutes=i * 30)
-        slot_index = (current_slot + i) % 48
-
-        result["slots"].append(
-            {
-                "slot_index": slot_index,
-                "time": slot_time.isoformat(),
-                "hour": slot_time.hour,
-                "minute": slot_time.minute,
-                "active": active,
-            }
-        )
+    result = {
+        "schedule_id": schedule_id,
+        "hours": hours,
+        "format": preview_format,
+        "start": now.isoformat(),
+        **preview,
+    }
 
     connection.send_result(msg["id"], result)
 
@@ -198,6 +427,7 @@ async def ws_preview_schedule(
     {
         vol.Required("type"): "timer24h/get_state",
         vol.Required("schedule_id"): str,
+        **SLOT_FORMAT_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -228,11 +458,14 @@ async def ws_get_schedule_state(
         return
 
     # Get current slot info
-    from homeassistant.util import dt as dt_util
-
     now = dt_util.now()
-    current_slot = coordinator._get_current_slot_index(now)
-    next_slot_time = coordinator._get_next_slot_time(now)
+    schedule = schedule_state.schedule
+    current_slot = coordinator._get_current_slot_index(
+        now, schedule.resolution, schedule.timezone
+    )
+    next_slot_time = coordinator._get_next_slot_time(
+        now, schedule.resolution, schedule.timezone
+    )
 
     result = {
         "schedule_id": schedule_id,
@@ -241,7 +474,10 @@ async def ws_get_schedule_state(
         "last_condition_evaluation": schedule_state.last_condition_evaluation,
         "current_slot": current_slot,
         "next_slot_time": next_slot_time.isoformat(),
-        "schedule": schedule_state.schedule.to_dict(),
+        **_next_change_payload(coordinator, schedule, now),
+        "schedule": coordinator.get_serialized_schedule(
+            schedule_id, msg.get(CONF_SLOT_FORMAT, SLOT_FORMAT_LIST)
+        ),
     }
 
     connection.send_result(msg["id"], result)
@@ -250,6 +486,9 @@ async def ws_get_schedule_state(
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "timer24h/get_all_states",
+        vol.Optional("if_version"): int,
+        **LISTING_SCHEMA,
+        **SLOT_FORMAT_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -258,7 +497,7 @@ async def ws_get_all_states(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Get the current state of all schedules."""
+    """Get the current state of schedules, optionally filtered and paginated."""
     # Get coordinator from first entry
     entries = hass.config_entries.async_entries(DOMAIN)
     if not entries:
@@ -269,27 +508,280 @@ async def ws_get_all_states(
 
     coordinator = hass.data[DOMAIN][entries[0].entry_id]["coordinator"]
 
-    all_states = coordinator.get_all_schedule_states()
+    connection.send_result(
+        msg["id"], _all_states_payload(coordinator, msg, dt_util.now())
+    )
 
-    # Get current slot info
-    from homeassistant.util import dt as dt_util
 
-    now = dt_util.now()
+def _all_states_payload(
+    coordinator: Timer24HCoordinator, msg: dict[str, Any], now: datetime
+) -> dict[str, Any]:
+    """Build the timer24h/get_all_states result."""
+    # Get current slot info
     current_slot = coordinator._get_current_slot_index(now)
     next_slot_time = coordinator._get_next_slot_time(now)
 
+    version = coordinator.data_version
+    if msg.get("if_version") == version:
+        return {
+            "version": version,
+            "not_modified": True,
+            "current_slot": current_slot,
+            "next_slot_time": next_slot_time.isoformat(),
+        }
+
+    page, next_cursor = _select_schedules(coordinator, msg)
+    fields = msg.get("fields")
+    slot_format = msg.get(CONF_SLOT_FORMAT, SLOT_FORMAT_LIST)
+
+    schedules: dict[str, dict[str, Any]] = {}
     result = {
+        "version": version,
+        "not_modified": False,
         "current_slot": current_slot,
         "next_slot_time": next_slot_time.isoformat(),
-        "schedules": {},
+        "next_cursor": next_cursor,
+        "schedules": schedules,
     }
 
-    for schedule_id, schedule_state in all_states.items():
-        result["schedules"][schedule_id] = {
+    for schedule_id, schedule_state in page:
+        row = {
             "desired_state": schedule_state.desired_state,
             "last_applied_state": schedule_state.last_applied_state,
             "last_condition_evaluation": schedule_state.last_condition_evaluation,
-            "schedule": schedule_state.schedule.to_dict(),
+            **_next_change_payload(coordinator, schedule_state.schedule, now),
+            "schedule": coordinator.get_serialized_schedule(schedule_id, slot_format),
         }
+        schedules[schedule_id] = _project(row, fields)
 
-    connection.send_result(msg["id"], result)
+    return result
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "timer24h/bulk_set",
+        vol.Required("schedules"): [dict],
+    }
+)
+@websocket_api.async_response
+async def ws_bulk_set(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Create, update and remove many schedules in one batch."""
+    # Get coordinator from first entry
+    entries = hass.config_entries.async_entries(DOMAIN)
+    if not entries:
+        connection.send_error(
+            msg["id"], "integration_not_setup", "Timer 24H integration not set up"
+        )
+        return
+
+    coordinator = hass.data[DOMAIN][entries[0].entry_id]["coordinator"]
+
+    results = await coordinator.async_bulk_set(msg["schedules"])
+
+    connection.send_result(msg["id"], {"results": results})
+
+
+def _schedule_state_payload(
+    coordinator: Timer24HCoordinator, schedule_state: ScheduleState, slot_format: str
+) -> dict[str, Any]:
+    """Build the subscription payload of a schedule."""
+    return {
+        "desired_state": schedule_state.desired_state,
+        "last_applied_state": schedule_state.last_applied_state,
+        "last_condition_evaluation": schedule_state.last_condition_evaluation,
+        "schedule": coordinator.get_serialized_schedule(
+            schedule_state.schedule.schedule_id, slot_format
+        ),
+    }
+
+
+class ScheduleSubscription:
+    """Streams schedule changes to one websocket subscriber.
+
+    The subscriber gets one snapshot of every schedule, then only the fields
+    that changed since they were last sent. Changes arriving in the same event
+    loop iteration are coalesced into a single message.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg_id: int,
+        coordinator: Timer24HCoordinator,
+        slot_format: str = SLOT_FORMAT_LIST,
+    ) -> None:
+        """Initialize the subscription."""
+        self._hass = hass
+        self._connection = connection
+        self._msg_id = msg_id
+        self._coordinator = coordinator
+        self._slot_format = slot_format
+        self._sent: dict[str, dict[str, Any]] = {}
+        self._changed: set[str] = set()
+        self._removed: set[str] = set()
+        self._flush_handle: asyncio.Handle | None = None
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Start listening and send the initial snapshot."""
+        self._unsubs.append(
+            self._coordinator.async_add_change_listener(self._async_changed)
+        )
+        self._unsubs.append(
+            self._coordinator.async_add_schedules_listener(
+                self._async_schedules_changed
+            )
+        )
+
+        self._sent = {
+            schedule_id: _schedule_state_payload(
+                self._coordinator, schedule_state, self._slot_format
+            )
+            for schedule_id, schedule_state in (
+                self._coordinator.get_all_schedule_states().items()
+            )
+        }
+        self._connection.send_message(
+            websocket_api.event_message(self._msg_id, {"snapshot": self._sent})
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    @callback
+    def _async_changed(self, schedule_id: str) -> None:
+        """Record an updated schedule."""
+        self._changed.add(schedule_id)
+        self._removed.discard(schedule_id)
+        self._schedule_flush()
+
+    @callback
+    def _async_schedules_changed(self, added: set[str], removed: set[str]) -> None:
+        """Record added and removed schedules."""
+        self._changed |= added
+        self._changed -= removed
+        self._removed |= removed
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Send pending changes once the current loop iteration is done."""
+        if self._flush_handle is None:
+            self._flush_handle = self._hass.loop.call_soon(self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the fields that changed since they were last sent."""
+        self._flush_handle = None
+
+        changes: dict[str, dict[str, Any]] = {}
+        for schedule_id in self._changed:
+            schedule_state = self._coordinator.get_schedule_state(schedule_id)
+            if schedule_state is None:
+                continue
+
+            payload = _schedule_state_payload(
+                self._coordinator, schedule_state, self._slot_format
+            )
+            previous = self._sent.get(schedule_id)
+            delta = (
+                payload
+                if previous is None
+                else {
+                    key: value
+                    for key, value in payload.items()
+                    if previous.get(key) != value
+                }
+            )
+            if delta:
+                changes[schedule_id] = delta
+                self._sent[schedule_id] = payload
+
+        removed = [
+            schedule_id
+            for schedule_id in self._removed
+            if self._sent.pop(schedule_id, None) is not None
+        ]
+
+        self._changed.clear()
+        self._removed.clear()
+
+        if changes or removed:
+            self._connection.send_message(
+                websocket_api.event_message(
+                    self._msg_id, {"changes": changes, "removed": removed}
+                )
+            )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "timer24h/subscribe",
+        **SLOT_FORMAT_SCHEMA,
+    }
+)
+@callback
+def ws_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to a snapshot of all schedules followed by deltas."""
+    # Get coordinator from first entry
+    entries = hass.config_entries.async_entries(DOMAIN)
+    if not entries:
+        connection.send_error(
+            msg["id"], "integration_not_setup", "Timer 24H integration not set up"
+        )
+        return
+
+    coordinator = hass.data[DOMAIN][entries[0].entry_id]["coordinator"]
+
+    subscription = ScheduleSubscription(
+        hass,
+        connection,
+        msg["id"],
+        coordinator,
+        msg.get(CONF_SLOT_FORMAT, SLOT_FORMAT_LIST),
+    )
+    connection.subscriptions[msg["id"]] = subscription.async_stop
+    connection.send_result(msg["id"])
+    subscription.async_start()
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "timer24h/metrics",
+    }
+)
+@websocket_api.async_response
+async def ws_metrics(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Get the internal counters, duration histograms and sizes."""
+    # Get coordinator from first entry
+    entries = hass.config_entries.async_entries(DOMAIN)
+    if not entries:
+        connection.send_error(
+            msg["id"], "integration_not_setup", "Timer 24H integration not set up"
+        )
+        return
+
+    coordinator = hass.data[DOMAIN][entries[0].entry_id]["coordinator"]
+
+    connection.send_result(msg["id"], coordinator.get_metrics())
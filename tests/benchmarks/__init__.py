@@ -0,0 +1 @@
+"""Benchmarks for Timer 24H."""
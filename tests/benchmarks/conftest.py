@@ -0,0 +1,76 @@
+"""Fixtures for Timer 24H benchmarks.
+
+Benchmarks only run with ``--benchmark-only``; a plain test run skips them.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.timer24h.coordinator import Timer24HCoordinator
+from custom_components.timer24h.models import Timer24HData
+from custom_components.timer24h.storage import Timer24HStorage
+
+from ..synthetic import make_data, make_states
+
+SIZES = [100, 1_000, 10_000, 100_000]
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless they were asked for."""
+    if config.getoption("benchmark_only", False):
+        return
+
+    skip = pytest.mark.skip(reason="benchmarks run with --benchmark-only")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
+
+
+def make_hass(count: int) -> MagicMock:
+    """Build a mocked hass whose state machine holds every entity."""
+    states = make_states(count)
+    hass = MagicMock()
+    hass.services.async_call = AsyncMock()
+    hass.states.get.side_effect = lambda entity_id: SimpleNamespace(
+        state=states.get(entity_id, "off")
+    )
+    return hass
+
+
+@pytest.fixture
+def event_loop_runner():
+    """Run coroutines to completion on a private event loop."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture
+def make_coordinator(event_loop_runner):
+    """Set up a coordinator over a synthetic dataset with a mocked hass."""
+
+    def _make(count: int, **kwargs: Any) -> Timer24HCoordinator:
+        hass = make_hass(count)
+        storage = Timer24HStorage(hass)
+        storage._data = Timer24HData.from_dict(make_data(count))
+        storage._loaded = True
+
+        coordinator = Timer24HCoordinator(hass, storage, **kwargs)
+        event_loop_runner(coordinator.async_setup())
+        return coordinator
+
+    with (
+        patch(
+            "custom_components.timer24h.coordinator.async_track_point_in_time",
+            return_value=lambda: None,
+        ),
+        patch(
+            "custom_components.timer24h.coordinator.async_track_state_change_event",
+            return_value=lambda: None,
+        ),
+    ):
+        yield _make
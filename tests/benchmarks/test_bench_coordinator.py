@@ -0,0 +1,50 @@
+"""Benchmark the Timer 24H coordinator."""
+
+import pytest
+
+from .conftest import SIZES
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("count", SIZES)
+def test_reconcile_all(benchmark, count, make_coordinator, event_loop_runner):
+    """Benchmark a full reconcile pass where nothing needs to change."""
+    coordinator = make_coordinator(count, fire_events=False)
+
+    benchmark(lambda: event_loop_runner(coordinator.async_reconcile_all()))
+
+    assert len(coordinator.get_all_schedule_states()) == count
+
+
+@pytest.mark.parametrize("count", SIZES)
+def test_reconcile_all_actuating(benchmark, count, make_coordinator, event_loop_runner):
+    """Benchmark a full reconcile pass that actuates every target."""
+    coordinator = make_coordinator(count, fire_events=False)
+    calls = coordinator.hass.services.async_call
+
+    def forget_applied():
+        coordinator._last_applied_states.clear()
+        return (), {}
+
+    benchmark.pedantic(
+        lambda: event_loop_runner(coordinator.async_reconcile_all()),
+        setup=forget_applied,
+        rounds=5,
+    )
+
+    assert calls.await_count > 0
+
+
+@pytest.mark.parametrize("count", SIZES)
+def test_schedule_preview(benchmark, count, make_coordinator):
+    """Benchmark a 24 hour preview of every schedule."""
+    coordinator = make_coordinator(count)
+    schedule_ids = list(coordinator.get_all_schedule_states())
+
+    def preview_all():
+        return [coordinator.get_schedule_preview(sid) for sid in schedule_ids]
+
+    previews = benchmark(preview_all)
+
+    assert len(previews) == count
@@ -0,0 +1,44 @@
+"""Benchmark Timer 24H models."""
+
+import pytest
+
+from custom_components.timer24h.models import Timer24HData
+
+from ..synthetic import make_data, make_states
+from .conftest import SIZES
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("count", SIZES)
+def test_data_from_dict(benchmark, count):
+    """Benchmark loading stored data."""
+    stored = make_data(count)
+
+    data = benchmark(Timer24HData.from_dict, stored)
+
+    assert len(data.schedules) == count
+
+
+@pytest.mark.parametrize("count", SIZES)
+def test_data_to_dict(benchmark, count):
+    """Benchmark serializing data for storage."""
+    data = Timer24HData.from_dict(make_data(count))
+
+    stored = benchmark(data.to_dict, compact=True)
+
+    assert len(stored["schedules"]) == count
+
+
+@pytest.mark.parametrize("count", SIZES)
+def test_evaluate_conditions(benchmark, count):
+    """Benchmark evaluating the conditions of every schedule."""
+    schedules = list(Timer24HData.from_dict(make_data(count)).schedules.values())
+    states = make_states(count)
+
+    def evaluate_all():
+        return [schedule.evaluate_conditions(states) for schedule in schedules]
+
+    results = benchmark(evaluate_all)
+
+    assert len(results) == count
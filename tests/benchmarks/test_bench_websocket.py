@@ -0,0 +1,54 @@
+"""Benchmark the Timer 24H websocket payload builders."""
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.timer24h.websocket_api import (
+    _all_states_payload,
+    _list_payload,
+)
+
+from .conftest import SIZES
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("count", SIZES)
+def test_list_payload(benchmark, count, make_coordinator):
+    """Benchmark listing every schedule."""
+    coordinator = make_coordinator(count)
+    msg = {"id": 1, "type": "timer24h/list"}
+
+    result = benchmark(_list_payload, coordinator, msg)
+
+    assert len(result) == count
+
+
+@pytest.mark.parametrize("count", SIZES)
+def test_all_states_payload(benchmark, count, make_coordinator):
+    """Benchmark the state of every schedule with serialized schedules."""
+    coordinator = make_coordinator(count)
+    msg = {"id": 1, "type": "timer24h/get_all_states"}
+    now = dt_util.now()
+
+    result = benchmark(_all_states_payload, coordinator, msg, now)
+
+    assert len(result["schedules"]) == count
+
+
+@pytest.mark.parametrize("count", SIZES)
+def test_all_states_payload_page(benchmark, count, make_coordinator):
+    """Benchmark one filtered page of schedule states."""
+    coordinator = make_coordinator(count)
+    msg = {
+        "id": 1,
+        "type": "timer24h/get_all_states",
+        "limit": 100,
+        "target_domain": "light",
+        "fields": ["desired_state", "next_change_time"],
+    }
+    now = dt_util.now()
+
+    result = benchmark(_all_states_payload, coordinator, msg, now)
+
+    assert len(result["schedules"]) == min(100, count // 5)
@@ -1,4 +1,8 @@
 """Common fixtures for Timer 24H tests."""
+import asyncio
+from collections.abc import Coroutine
+from datetime import UTC, datetime
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
@@ -6,7 +10,14 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from custom_components.timer24h.const import DOMAIN
+from custom_components.timer24h.coordinator import Timer24HCoordinator
 from custom_components.timer24h.models import Condition, Schedule
+from custom_components.timer24h.storage import Timer24HStorage
+
+from .simulation.fake_hass import FakeHass
+
+# Monday 2026-01-05 06:00 UTC
+START = datetime(2026, 1, 5, 6, 0, tzinfo=UTC)
 
 
 @pytest.fixture
@@ -75,3 +86,45 @@ def mock_storage():
             }
         }
         yield mock_instance
+
+
+@pytest.fixture
+def fake_hass():
+    """Home Assistant stand-in on a virtual clock starting at START."""
+    hass = FakeHass(START)
+    with hass.patched():
+        yield hass
+
+
+@pytest.fixture
+def run(fake_hass):
+    """Run a coroutine and every task it starts on one loop for the test."""
+    loop = asyncio.new_event_loop()
+
+    def _run(coro: Coroutine[Any, Any, Any]) -> Any:
+        async def _until_done() -> Any:
+            result = await coro
+            await fake_hass.async_block_till_done()
+            return result
+
+        return loop.run_until_complete(_until_done())
+
+    yield _run
+    loop.close()
+
+
+@pytest.fixture
+def make_coordinator(fake_hass, run):
+    """Set up a coordinator over the given schedules on the stand-in."""
+
+    def _make(*schedules: Schedule, **kwargs: Any) -> Timer24HCoordinator:
+        storage = Timer24HStorage(fake_hass)
+        storage._loaded = True
+        for schedule in schedules:
+            storage.data.add_schedule(schedule)
+
+        coordinator = Timer24HCoordinator(fake_hass, storage, **kwargs)
+        run(coordinator.async_setup())
+        return coordinator
+
+    return _make
@@ -0,0 +1,4 @@
+"""Offline load simulation of the Timer 24H coordinator.
+
+Run ``python -m tests.simulation --help`` from the repository root.
+"""
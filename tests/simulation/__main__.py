@@ -0,0 +1,74 @@
+"""Command line entry point of the load simulation."""
+
+import argparse
+import json
+import logging
+from datetime import UTC, datetime, timedelta
+
+from homeassistant.util import dt as dt_util
+
+from .simulate import simulate
+
+
+def main() -> None:
+    """Parse arguments, run a simulation and print its report."""
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.simulation",
+        description="Simulate Timer 24H schedules against an in-process hass.",
+    )
+    parser.add_argument("--schedules", type=int, default=10_000)
+    parser.add_argument("--sensors", type=int, default=1_000)
+    parser.add_argument(
+        "--days", type=float, default=1, help="simulated days (7 for a week)"
+    )
+    parser.add_argument(
+        "--flap-interval",
+        type=float,
+        default=300,
+        help="mean seconds between toggles of each condition sensor",
+    )
+    parser.add_argument(
+        "--start",
+        type=datetime.fromisoformat,
+        default=datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0),
+        help="simulated start time (ISO 8601, default today 00:00 UTC)",
+    )
+    parser.add_argument("--time-zone", default="UTC", help="Home Assistant timezone")
+    parser.add_argument(
+        "--edit-interval",
+        type=float,
+        default=0,
+        help="mean seconds between bulk_set edits (0 for none)",
+    )
+    parser.add_argument(
+        "--edit-batch", type=int, default=10, help="schedules toggled per edit"
+    )
+    parser.add_argument("--no-events", action="store_true", help="disable bus events")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    dt_util.set_default_time_zone(dt_util.get_time_zone(args.time_zone))
+    start = args.start
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+    report = simulate(
+        schedules=args.schedules,
+        sensors=args.sensors,
+        duration=timedelta(days=args.days),
+        start=start,
+        flap_interval=timedelta(seconds=args.flap_interval),
+        fire_events=not args.no_events,
+        seed=args.seed,
+        edit_interval=(
+            timedelta(seconds=args.edit_interval) if args.edit_interval else None
+        ),
+        edit_batch=args.edit_batch,
+    )
+    print(json.dumps(report.summary(), indent=2) if args.json else report.format())
+
+
+if __name__ == "__main__":
+    main()
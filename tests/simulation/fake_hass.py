@@ -0,0 +1,342 @@
+"""In-process Home Assistant stand-in driven by a virtual clock.
+
+Only the parts the coordinator and storage touch are provided: a state
+machine, a service registry that records calls and switches targets, an event
+bus that counts events, point-in-time and state-change tracking, a
+loop clock for the store's delayed writes, and a temporary config directory
+for the store to write to. Time only moves when
+the simulation advances it, so a day runs as fast as the coordinator can
+process it.
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+from collections import Counter
+from collections.abc import Callable, Coroutine, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta, tzinfo
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any, TypeVar
+from unittest.mock import patch
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CoreState
+from homeassistant.util import dt as dt_util
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class FakeState:
+    """State of one entity."""
+
+    entity_id: str
+    state: str
+    last_changed: datetime
+
+
+@dataclass(order=True)
+class _Timer:
+    """A pending point-in-time callback."""
+
+    when: datetime
+    seq: int
+    action: Callable[[datetime], Any] = field(compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+
+@dataclass
+class _VirtualHandle:
+    """Handle of a callback scheduled on the virtual loop."""
+
+    _when: float
+    cancel: Callable[[], None]
+
+    def when(self) -> float:
+        """Return the loop time the callback is scheduled for."""
+        return self._when
+
+
+class VirtualLoop:
+    """The running event loop, with its clock following the virtual clock.
+
+    The store schedules delayed writes with time() and call_at(), so those run
+    on simulated time like every other timer; everything else is passed on to
+    the running loop.
+    """
+
+    def __init__(self, hass: "FakeHass") -> None:
+        """Initialize the loop view of a stand-in."""
+        self._hass = hass
+
+    def __getattr__(self, name: str) -> Any:
+        """Pass anything else on to the running loop."""
+        return getattr(asyncio.get_running_loop(), name)
+
+    def time(self) -> float:
+        """Return the virtual time as a POSIX timestamp."""
+        return self._hass.clock.now.timestamp()
+
+    def call_at(
+        self, when: float, callback: Callable[..., Any], *args: Any
+    ) -> _VirtualHandle:
+        """Call callback once the virtual clock reaches loop time when."""
+        point_in_time = datetime.fromtimestamp(when, UTC)
+        if point_in_time.timestamp() < when:
+            # Never fire before the requested time due to rounding
+            point_in_time += timedelta(microseconds=1)
+        cancel = self._hass.track_point_in_time(
+            lambda now: callback(*args), point_in_time
+        )
+        return _VirtualHandle(when, cancel)
+
+    def call_later(
+        self, delay: float, callback: Callable[..., Any], *args: Any
+    ) -> _VirtualHandle:
+        """Call callback after a virtual delay in seconds."""
+        return self.call_at(self.time() + delay, callback, *args)
+
+
+class FakeStates:
+    """State machine that tells state-change trackers about changes."""
+
+    def __init__(self, hass: "FakeHass") -> None:
+        """Initialize an empty state machine."""
+        self._hass = hass
+        self._states: dict[str, FakeState] = {}
+
+    def get(self, entity_id: str) -> FakeState | None:
+        """Return the state of an entity."""
+        return self._states.get(entity_id)
+
+    def async_entity_ids(self) -> list[str]:
+        """Return every entity ID."""
+        return list(self._states)
+
+    def async_set(self, entity_id: str, new_state: str) -> None:
+        """Set the state of an entity, firing state_changed if it changed."""
+        old = self._states.get(entity_id)
+        if old is not None and old.state == new_state:
+            return
+
+        new = FakeState(entity_id, new_state, self._hass.clock.now)
+        self._states[entity_id] = new
+        self._hass.bus.async_fire(
+            EVENT_STATE_CHANGED,
+            {"entity_id": entity_id, "old_state": old, "new_state": new},
+        )
+
+
+class FakeServices:
+    """Service registry that records calls and switches their targets."""
+
+    def __init__(self, hass: "FakeHass") -> None:
+        """Initialize the registry."""
+        self._hass = hass
+        self.calls: Counter[str] = Counter()
+        self.entities: Counter[str] = Counter()
+
+    async def async_call(
+        self,
+        domain: str,
+        service: str,
+        service_data: dict[str, Any] | None = None,
+        blocking: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Record a service call and apply turn_on/turn_off to its targets."""
+        key = f"{domain}.{service}"
+        entity_ids = (service_data or {}).get("entity_id", [])
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+
+        self.calls[key] += 1
+        self.entities[key] += len(entity_ids)
+
+        if service in ("turn_on", "turn_off"):
+            new_state = "on" if service == "turn_on" else "off"
+            for entity_id in entity_ids:
+                self._hass.states.async_set(entity_id, new_state)
+
+
+class FakeBus:
+    """Event bus that counts events and feeds listeners and state trackers."""
+
+    def __init__(self, hass: "FakeHass") -> None:
+        """Initialize the bus."""
+        self._hass = hass
+        self.events: Counter[str] = Counter()
+        self._listeners: dict[str, list[Callable[[Any], Any]]] = {}
+        self._state_listeners: dict[str, list[Callable[[Any], None]]] = {}
+
+    def async_fire(self, event_type: str, event_data: dict[str, Any] | None = None):
+        """Fire an event."""
+        self.events[event_type] += 1
+        event = SimpleNamespace(event_type=event_type, data=event_data or {})
+        for listener in list(self._listeners.get(event_type, ())):
+            result = listener(event)
+            if asyncio.iscoroutine(result):
+                self._hass.async_create_task(result)
+
+        if event_type != EVENT_STATE_CHANGED or not event_data:
+            return
+
+        listeners = self._state_listeners.get(event_data["entity_id"])
+        if listeners:
+            for action in list(listeners):
+                action(event)
+
+    def async_listen_once(
+        self, event_type: str, listener: Callable[[Any], Any]
+    ) -> Callable[[], None]:
+        """Call listener with the next event of a type only."""
+
+        def _once(event: Any) -> Any:
+            _remove()
+            return listener(event)
+
+        def _remove() -> None:
+            listeners = self._listeners.get(event_type, [])
+            if _once in listeners:
+                listeners.remove(_once)
+
+        self._listeners.setdefault(event_type, []).append(_once)
+        return _remove
+
+    def track_states(
+        self, entity_ids: Iterable[str], action: Callable[[Any], None]
+    ) -> Callable[[], None]:
+        """Call action with each state_changed event of the given entities."""
+        entity_ids = list(entity_ids)
+        for entity_id in entity_ids:
+            self._state_listeners.setdefault(entity_id, []).append(action)
+
+        def _remove() -> None:
+            for entity_id in entity_ids:
+                self._state_listeners[entity_id].remove(action)
+
+        return _remove
+
+
+class VirtualClock:
+    """Simulated UTC time."""
+
+    def __init__(self, start: datetime) -> None:
+        """Start the clock at an aware datetime."""
+        self.now = dt_util.as_utc(start)
+
+    def local(self, time_zone: tzinfo | None = None) -> datetime:
+        """Return the current time in a time zone (Home Assistant's default)."""
+        return self.now.astimezone(time_zone or dt_util.DEFAULT_TIME_ZONE)
+
+
+class FakeHass:
+    """Stand-in for the HomeAssistant object the coordinator is given."""
+
+    def __init__(self, start: datetime) -> None:
+        """Initialize the stand-in at a start time."""
+        self.clock = VirtualClock(start)
+        self.state = CoreState.running
+        self.data: dict[str, Any] = {}
+        self.bus = FakeBus(self)
+        self.states = FakeStates(self)
+        self.services = FakeServices(self)
+        self._loop = VirtualLoop(self)
+
+        # Stores write below a config directory that is removed with the hass
+        self._config_dir = TemporaryDirectory(prefix="timer24h-sim-")
+        self.config = SimpleNamespace(
+            path=lambda *parts: os.path.join(self._config_dir.name, *parts)
+        )
+
+        self._timers: list[_Timer] = []
+        self._seq = itertools.count()
+        self._tasks: set[asyncio.Task[Any]] = set()
+
+        self.timers_fired = 0
+        self.loop_lag: list[float] = []
+
+    @property
+    def loop(self) -> VirtualLoop:
+        """Return the running event loop on the virtual clock."""
+        return self._loop
+
+    def async_create_task(
+        self, target: Coroutine[Any, Any, _T], *args: Any, **kwargs: Any
+    ) -> asyncio.Task[_T]:
+        """Run a coroutine as a tracked task."""
+        task = self.loop.create_task(target)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def async_add_executor_job(self, target: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking function in the default executor."""
+        return await self.loop.run_in_executor(None, target, *args)
+
+    def track_point_in_time(
+        self, action: Callable[[datetime], Any], point_in_time: datetime
+    ) -> Callable[[], None]:
+        """Call action once the virtual clock reaches a point in time."""
+        timer = _Timer(dt_util.as_utc(point_in_time), next(self._seq), action)
+        heapq.heappush(self._timers, timer)
+
+        def _cancel() -> None:
+            timer.cancelled = True
+
+        return _cancel
+
+    @contextmanager
+    def patched(self) -> Iterator[None]:
+        """Route the coordinator's time and tracking helpers to this stand-in."""
+        with (
+            patch.object(dt_util, "now", self.clock.local),
+            patch.object(dt_util, "utcnow", lambda: self.clock.now),
+            patch(
+                "custom_components.timer24h.coordinator.async_track_point_in_time",
+                lambda hass, action, when: self.track_point_in_time(action, when),
+            ),
+            patch(
+                "custom_components.timer24h.coordinator.async_track_state_change_event",
+                lambda hass, entity_ids, action: self.bus.track_states(
+                    entity_ids, action
+                ),
+            ),
+        ):
+            yield
+
+    async def async_block_till_done(self) -> None:
+        """Run the loop until every tracked task is done, sampling loop lag.
+
+        Each pass of the loop is timed; that is how long any other callback
+        would have waited to run.
+        """
+        while self._tasks:
+            start = perf_counter()
+            await asyncio.sleep(0)
+            self.loop_lag.append(perf_counter() - start)
+
+    async def async_run_until(self, end: datetime) -> None:
+        """Advance the virtual clock to end, firing timers on the way."""
+        end = dt_util.as_utc(end)
+        timers = self._timers
+        while timers and timers[0].when <= end:
+            timer = heapq.heappop(timers)
+            if timer.cancelled:
+                continue
+
+            self.clock.now = max(self.clock.now, timer.when)
+            self.timers_fired += 1
+            start = perf_counter()
+            result = timer.action(timer.when)
+            if asyncio.iscoroutine(result):
+                self.async_create_task(result)
+            self.loop_lag.append(perf_counter() - start)
+            await self.async_block_till_done()
+
+        self.clock.now = max(self.clock.now, end)
@@ -0,0 +1,244 @@
+"""Drive the real coordinator through simulated time and report its load."""
+
+import asyncio
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Any
+
+from custom_components.timer24h.coordinator import Timer24HCoordinator
+from custom_components.timer24h.models import Timer24HData
+from custom_components.timer24h.storage import Timer24HStorage
+
+from ..synthetic import condition_entities, make_data, make_states, target_entities
+from .fake_hass import FakeHass
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of values (0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+@dataclass
+class SimulationReport:
+    """What the coordinator did during a simulation."""
+
+    schedules: int
+    sensors: int
+    simulated: timedelta
+    wall_time: float
+    setup_time: float
+    timer_wakeups: int
+    sensor_flaps: int
+    service_calls: dict[str, int]
+    entities_switched: dict[str, int]
+    bus_events: dict[str, int]
+    edits: int
+    storage_writes: int
+    reconcile_latency: list[float] = field(repr=False)
+    loop_lag: list[float] = field(repr=False)
+
+    def summary(self) -> dict[str, Any]:
+        """Return the report as plain numbers (times in milliseconds)."""
+        return {
+            "schedules": self.schedules,
+            "sensors": self.sensors,
+            "simulated_hours": self.simulated.total_seconds() / 3600,
+            "wall_time_s": round(self.wall_time, 3),
+            "setup_time_s": round(self.setup_time, 3),
+            "timer_wakeups": self.timer_wakeups,
+            "sensor_flaps": self.sensor_flaps,
+            "service_calls": sum(self.service_calls.values()),
+            "service_calls_by_service": dict(self.service_calls),
+            "entities_switched": sum(self.entities_switched.values()),
+            "bus_events": dict(self.bus_events),
+            "edits": self.edits,
+            "storage_writes": self.storage_writes,
+            "reconciles": len(self.reconcile_latency),
+            "reconcile_ms": _distribution(self.reconcile_latency),
+            "loop_lag_ms": _distribution(self.loop_lag),
+        }
+
+    def format(self) -> str:
+        """Return a human readable report."""
+        summary = self.summary()
+        lines = [
+            f"Simulated {summary['simulated_hours']:g} h of {self.schedules} "
+            f"schedules and {self.sensors} flapping sensors in "
+            f"{self.wall_time:.2f} s (setup {self.setup_time:.2f} s)",
+            f"Timer wakeups:     {self.timer_wakeups}",
+            f"Sensor flaps:      {self.sensor_flaps}",
+            f"Bulk edits:        {self.edits}",
+            f"Storage writes:    {self.storage_writes}",
+            f"Service calls:     {summary['service_calls']} "
+            f"({summary['entities_switched']} entities switched)",
+        ]
+        lines.extend(
+            f"  {service}: {count} calls, {self.entities_switched[service]} entities"
+            for service, count in sorted(self.service_calls.items())
+        )
+        lines.append("Bus events:")
+        lines.extend(
+            f"  {event_type}: {count}"
+            for event_type, count in sorted(self.bus_events.items())
+        )
+        for label, key in (("Reconcile", "reconcile_ms"), ("Loop lag", "loop_lag_ms")):
+            dist = summary[key]
+            lines.append(
+                f"{label + ' ms:':<18} p50 {dist['p50']:.3f}  p90 {dist['p90']:.3f}  "
+                f"p99 {dist['p99']:.3f}  max {dist['max']:.3f}  (n={dist['count']})"
+            )
+        return "\n".join(lines)
+
+
+def _distribution(values: list[float]) -> dict[str, float]:
+    """Summarize durations in seconds as millisecond percentiles."""
+    return {
+        "count": len(values),
+        "p50": percentile(values, 50) * 1000,
+        "p90": percentile(values, 90) * 1000,
+        "p99": percentile(values, 99) * 1000,
+        "max": max(values, default=0.0) * 1000,
+    }
+
+
+async def async_simulate(
+    schedules: int,
+    sensors: int,
+    duration: timedelta,
+    start: datetime,
+    flap_interval: timedelta = timedelta(minutes=5),
+    fire_events: bool = True,
+    seed: int = 0,
+    edit_interval: timedelta | None = None,
+    edit_batch: int = 10,
+) -> SimulationReport:
+    """Run the coordinator over a synthetic dataset for a simulated duration.
+
+    Each condition sensor toggles at random, on average once per
+    flap_interval. Targets start off and follow the service calls made. With
+    an edit_interval, a bulk_set toggling edit_batch random schedules runs on
+    average once per edit_interval, and pending writes are flushed at the end
+    as on unload.
+    """
+    rng = random.Random(seed)
+    hass = FakeHass(start)
+
+    for entity_id in target_entities(schedules):
+        hass.states.async_set(entity_id, "off")
+    for entity_id, state in make_states(schedules, sensors).items():
+        hass.states.async_set(entity_id, state)
+    hass.bus.events.clear()
+
+    flaps = 0
+    mean_gap = flap_interval.total_seconds()
+
+    def _schedule_flap(entity_id: str) -> None:
+        delay = timedelta(seconds=rng.expovariate(1 / mean_gap))
+
+        def _flap(now: datetime) -> None:
+            nonlocal flaps
+            flaps += 1
+            current = hass.states.get(entity_id)
+            hass.states.async_set(
+                entity_id, "off" if current and current.state == "on" else "on"
+            )
+            _schedule_flap(entity_id)
+
+        hass.track_point_in_time(_flap, hass.clock.now + delay)
+
+    edits = 0
+
+    def _schedule_edit(mean_gap: float) -> None:
+        delay = timedelta(seconds=rng.expovariate(1 / mean_gap))
+
+        async def _edit(now: datetime) -> None:
+            nonlocal edits
+            edits += 1
+            states = coordinator.get_all_schedule_states()
+            picked = rng.sample(sorted(states), min(edit_batch, len(states)))
+            await coordinator.async_bulk_set(
+                [
+                    {
+                        "schedule_id": schedule_id,
+                        "enabled": not states[schedule_id].schedule.enabled,
+                    }
+                    for schedule_id in picked
+                ]
+            )
+            _schedule_edit(mean_gap)
+
+        hass.track_point_in_time(_edit, hass.clock.now + delay)
+
+    with hass.patched():
+        storage = Timer24HStorage(hass)
+        storage._data = Timer24HData.from_dict(make_data(schedules, sensors))
+        storage._loaded = True
+
+        coordinator = Timer24HCoordinator(hass, storage, fire_events=fire_events)
+        latencies: list[float] = []
+        reconcile = coordinator.async_reconcile_schedules
+
+        async def _timed_reconcile(*args: Any, **kwargs: Any) -> None:
+            started = perf_counter()
+            try:
+                await reconcile(*args, **kwargs)
+            finally:
+                latencies.append(perf_counter() - started)
+
+        coordinator.async_reconcile_schedules = _timed_reconcile
+
+        setup_started = perf_counter()
+        await coordinator.async_setup()
+        setup_time = perf_counter() - setup_started
+
+        for entity_id in condition_entities(schedules, sensors):
+            _schedule_flap(entity_id)
+        if edit_interval is not None:
+            _schedule_edit(edit_interval.total_seconds())
+
+        # Measure only the simulated period, not setup
+        hass.services.calls.clear()
+        hass.services.entities.clear()
+        hass.bus.events.clear()
+        hass.loop_lag.clear()
+        hass.timers_fired = 0
+        latencies.clear()
+
+        started = perf_counter()
+        await hass.async_run_until(hass.clock.now + duration)
+        wall_time = perf_counter() - started
+
+        await coordinator.async_shutdown()
+        await storage.async_flush()
+        storage_counters = storage.metrics.counters
+
+    return SimulationReport(
+        schedules=schedules,
+        sensors=sensors,
+        simulated=duration,
+        wall_time=wall_time,
+        setup_time=setup_time,
+        timer_wakeups=hass.timers_fired - flaps,
+        sensor_flaps=flaps,
+        service_calls=dict(hass.services.calls),
+        entities_switched=dict(hass.services.entities),
+        bus_events={
+            event_type: count for event_type, count in hass.bus.events.items() if count
+        },
+        edits=edits,
+        storage_writes=storage_counters.get("saves", 0)
+        + storage_counters.get("delayed_saves", 0),
+        reconcile_latency=latencies,
+        loop_lag=hass.loop_lag,
+    )
+
+
+def simulate(*args: Any, **kwargs: Any) -> SimulationReport:
+    """Run async_simulate on a new event loop."""
+    return asyncio.run(async_simulate(*args, **kwargs))
@@ -0,0 +1,97 @@
+"""Synthetic Timer 24H datasets shared by benchmarks and load simulations."""
+
+import random
+from functools import cache
+from typing import Any
+
+from custom_components.timer24h.models import (
+    Condition,
+    Schedule,
+    SlotMask,
+    Timer24HData,
+    slots_per_day,
+)
+
+TARGET_DOMAINS = ["light", "switch", "fan", "climate", "input_boolean"]
+TIMEZONES = [None, None, None, "Europe/Berlin", "America/New_York"]
+POLICIES = ["skip", "force_off", "defer"]
+
+
+def _random_mask(rng: random.Random, size: int) -> SlotMask:
+    """Build a day mask with one or two on-runs."""
+    bits = 0
+    for _ in range(rng.randint(1, 2)):
+        start = rng.randrange(size)
+        length = rng.randint(1, size // 4)
+        bits |= ((1 << length) - 1) << start
+    return SlotMask(bits & ((1 << size) - 1), size)
+
+
+def condition_entities(count: int, sensors: int | None = None) -> list[str]:
+    """Return the condition entity pool, count / 100 entities by default."""
+    if sensors is None:
+        sensors = max(1, count // 100)
+    return [f"binary_sensor.bench_{i}" for i in range(sensors)]
+
+
+def target_entities(count: int) -> list[str]:
+    """Return the target entities of count schedules."""
+    return [
+        f"{TARGET_DOMAINS[i % len(TARGET_DOMAINS)]}.bench_{i // 2}"
+        for i in range(count)
+    ]
+
+
+@cache
+def make_data(count: int, sensors: int | None = None) -> dict[str, Any]:
+    """Build the stored form of count synthetic schedules.
+
+    Two schedules share each target, one in ten uses a 15 minute resolution,
+    one in twenty is weekly and three in ten have conditions on the pool of
+    condition entities.
+    """
+    rng = random.Random(count)
+    entities = condition_entities(count, sensors)
+    targets = target_entities(count)
+
+    data = Timer24HData()
+    for i in range(count):
+        resolution = 15 if i % 10 == 0 else 30
+        size = slots_per_day(resolution)
+
+        week = None
+        if i % 20 == 1:
+            week = SlotMask.from_days([_random_mask(rng, size) for _ in range(7)])
+
+        conditions = []
+        if i % 10 < 3:
+            conditions = [
+                Condition(
+                    entity_id=rng.choice(entities),
+                    expected="on",
+                    policy=rng.choice(POLICIES),
+                )
+                for _ in range(rng.randint(1, 2))
+            ]
+
+        data.add_schedule(
+            Schedule(
+                schedule_id=f"bench_{i:06d}",
+                target_entity_id=targets[i],
+                slots=_random_mask(rng, size),
+                timezone=TIMEZONES[i % len(TIMEZONES)],
+                conditions=conditions,
+                resolution=resolution,
+                week=week,
+            )
+        )
+
+    return data.to_dict(compact=True)
+
+
+def make_states(count: int, sensors: int | None = None) -> dict[str, str]:
+    """Build condition entity states, half of them on."""
+    return {
+        entity_id: "on" if i % 2 else "off"
+        for i, entity_id in enumerate(condition_entities(count, sensors))
+    }
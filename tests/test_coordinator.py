@@ -0,0 +1,888 @@
+"""Test the Timer 24H coordinator."""
+import asyncio
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.timer24h.const import RETRY_DELAY
+from custom_components.timer24h.coordinator import StateSnapshot
+from custom_components.timer24h.models import Condition, Schedule, SlotMask
+
+from .conftest import START
+
+MORNING = [["06:00", "12:00"]]
+DAYTIME = SlotMask.from_intervals([["06:00", "20:00"]], 48)
+
+
+class TestBulkSet:
+    """Test bulk_set validation."""
+
+    def test_coerces_values(self, fake_hass, make_coordinator, run):
+        """Test that items are coerced like the set_schedule service does."""
+        fake_hass.states.async_set("light.porch", "off")
+        coordinator = make_coordinator()
+
+        results = run(
+            coordinator.async_bulk_set(
+                [
+                    {
+                        "schedule_id": "porch",
+                        "target_entity_id": "light.porch",
+                        "intervals": MORNING,
+                        "enabled": "no",
+                        "resolution": "15",
+                    }
+                ]
+            )
+        )
+
+        assert results == [
+            {"schedule_id": "porch", "action": "create", "success": True, "error": None}
+        ]
+        schedule = coordinator.get_schedule_state("porch").schedule
+        assert schedule.enabled is False
+        assert schedule.resolution == 15
+        assert schedule.slots.active_count == 24
+
+    def test_invalid_items(self, fake_hass, make_coordinator, run):
+        """Test that invalid items are reported and the others still applied."""
+        fake_hass.states.async_set("light.porch", "off")
+        coordinator = make_coordinator()
+
+        results = run(
+            coordinator.async_bulk_set(
+                [
+                    "porch",
+                    {"schedule_id": "bad_conditions", "conditions": [{"policy": "x"}]},
+                    {"schedule_id": "bad_action", "action": "rename"},
+                    {"schedule_id": "bad_resolution", "resolution": "7"},
+                    {"schedule_id": "bad_timezone", "timezone": "Mars/Base"},
+                    {
+                        "schedule_id": "both",
+                        "slots": "0" * 12,
+                        "intervals": MORNING,
+                    },
+                    {
+                        "schedule_id": "porch",
+                        "target_entity_id": "light.porch",
+                        "intervals": MORNING,
+                        "conditions": [{"entity_id": "binary_sensor.home"}],
+                    },
+                ]
+            )
+        )
+
+        assert [result["success"] for result in results] == [False] * 6 + [True]
+        assert results[0]["schedule_id"] is None
+        assert results[1]["schedule_id"] == "bad_conditions"
+        assert all(result["error"] for result in results[:6])
+        assert set(coordinator.get_all_schedule_states()) == {"porch"}
+
+    def test_update_and_remove(self, fake_hass, make_coordinator, run):
+        """Test updating and removing existing schedules in one batch."""
+        fake_hass.states.async_set("light.porch", "off")
+        coordinator = make_coordinator(
+            Schedule(schedule_id="porch", target_entity_id="light.porch"),
+            Schedule(schedule_id="old", target_entity_id="light.porch"),
+        )
+
+        results = run(
+            coordinator.async_bulk_set(
+                [
+                    {"schedule_id": "porch", "intervals": MORNING},
+                    {"schedule_id": "old", "action": "remove"},
+                    {"schedule_id": "missing", "action": "remove"},
+                ]
+            )
+        )
+
+        assert [(r["action"], r["success"]) for r in results] == [
+            ("update", True),
+            ("remove", True),
+            ("remove", False),
+        ]
+        assert set(coordinator.get_all_schedule_states()) == {"porch"}
+        assert coordinator.storage.dirty
+
+    def test_week_reset(self, fake_hass, make_coordinator, run):
+        """Test that week None turns a weekly schedule back into a daily one."""
+        fake_hass.states.async_set("light.porch", "off")
+        coordinator = make_coordinator()
+        run(
+            coordinator.async_bulk_set(
+                [
+                    {
+                        "schedule_id": "porch",
+                        "target_entity_id": "light.porch",
+                        "intervals": MORNING,
+                        "week": {"weekend": []},
+                    }
+                ]
+            )
+        )
+        assert coordinator.get_schedule_state("porch").schedule.is_weekly
+
+        results = run(
+            coordinator.async_bulk_set([{"schedule_id": "porch", "week": None}])
+        )
+
+        assert results[0]["success"]
+        assert not coordinator.get_schedule_state("porch").schedule.is_weekly
+
+
+    def test_weekly_slots(self, fake_hass, make_coordinator, run):
+        """Test that new slots apply to the days of a week that followed them."""
+        fake_hass.states.async_set("light.porch", "off")
+        coordinator = make_coordinator()
+        run(
+            coordinator.async_bulk_set(
+                [
+                    {
+                        "schedule_id": "porch",
+                        "target_entity_id": "light.porch",
+                        "intervals": MORNING,
+                        "week": {"weekend": []},
+                    }
+                ]
+            )
+        )
+
+        results = run(
+            coordinator.async_bulk_set(
+                [{"schedule_id": "porch", "slots": DAYTIME.to_hex()}]
+            )
+        )
+
+        assert results[0]["success"]
+        schedule = coordinator.get_schedule_state("porch").schedule
+        assert schedule.is_weekly
+        assert schedule.get_day_slots(0) == DAYTIME
+        assert schedule.get_day_slots(4) == DAYTIME
+        assert schedule.get_day_slots(5) == SlotMask(0, 48)
+        assert schedule.get_day_slots(6) == SlotMask(0, 48)
+
+def pending_timers(fake_hass):
+    """Return the times of the timers still armed on the stand-in."""
+    return sorted(timer.when for timer in fake_hass._timers if not timer.cancelled)
+
+
+def change_state(fake_hass, run, entity_id, state):
+    """Change a state on the loop ten seconds later and wait for the fallout."""
+    when = fake_hass.clock.now + timedelta(seconds=10)
+    fake_hass.track_point_in_time(
+        lambda now: fake_hass.states.async_set(entity_id, state), when
+    )
+    run(fake_hass.async_run_until(when))
+
+
+class TestTransitionQueue:
+    """Test waking only at schedule transitions."""
+
+    def test_wakes_at_transitions(self, fake_hass, make_coordinator, run):
+        """Test that one timer is armed for the earliest transition."""
+        for entity_id in ("light.a", "light.b", "light.c"):
+            fake_hass.states.async_set(entity_id, "off")
+        morning = SlotMask.from_intervals(MORNING, 48)
+        coordinator = make_coordinator(
+            Schedule(schedule_id="a", target_entity_id="light.a", slots=morning),
+            Schedule(schedule_id="b", target_entity_id="light.b", slots=morning),
+            Schedule(
+                schedule_id="c",
+                target_entity_id="light.c",
+                slots=SlotMask.from_intervals([["08:00", "09:00"]], 48),
+            ),
+        )
+
+        noon = START.replace(hour=12)
+        assert coordinator._next_transitions == {
+            "a": noon,
+            "b": noon,
+            "c": START.replace(hour=8),
+        }
+        assert coordinator._transition_groups[noon] == {"a", "b"}
+        assert pending_timers(fake_hass) == [START.replace(hour=8)]
+
+        run(fake_hass.async_run_until(noon))
+
+        # 08:00, 09:00 and one tick for both schedules at noon
+        assert fake_hass.timers_fired == 3
+        assert coordinator.get_metrics()["counters"]["transition_ticks"] == 3
+        assert fake_hass.states.get("light.a").state == "off"
+        assert fake_hass.states.get("light.b").state == "off"
+        assert fake_hass.states.get("light.c").state == "off"
+        assert fake_hass.services.calls["light.turn_on"] == 2
+        assert pending_timers(fake_hass) == [START + timedelta(days=1)]
+
+    def test_removed_schedule(self, fake_hass, make_coordinator, run):
+        """Test that removing the earliest schedule re-arms the timer."""
+        fake_hass.states.async_set("light.a", "off")
+        coordinator = make_coordinator(
+            Schedule(
+                schedule_id="a",
+                target_entity_id="light.a",
+                slots=SlotMask.from_intervals(MORNING, 48),
+            ),
+            Schedule(
+                schedule_id="c",
+                target_entity_id="light.a",
+                slots=SlotMask.from_intervals([["08:00", "09:00"]], 48),
+            ),
+        )
+        assert pending_timers(fake_hass) == [START.replace(hour=8)]
+
+        run(coordinator.async_remove_schedule("c"))
+        # Write the edit so only the coordinator's timers remain
+        run(coordinator.storage.async_flush())
+
+        assert "c" not in coordinator._next_transitions
+        assert pending_timers(fake_hass) == [START.replace(hour=12)]
+
+    def test_never_flips(self, fake_hass, make_coordinator, run):
+        """Test that schedules without transitions arm no timer."""
+        fake_hass.states.async_set("light.a", "off")
+        coordinator = make_coordinator(
+            Schedule(schedule_id="a", target_entity_id="light.a"),
+            Schedule(
+                schedule_id="b",
+                target_entity_id="light.a",
+                slots=SlotMask.from_intervals(MORNING, 48),
+                enabled=False,
+            ),
+        )
+
+        assert coordinator._next_transitions == {}
+        assert pending_timers(fake_hass) == []
+
+
+class TestConditionIndex:
+    """Test reconciling only the schedules of a changed condition entity."""
+
+    @staticmethod
+    def _schedule(schedule_id, *entity_ids):
+        return Schedule(
+            schedule_id=schedule_id,
+            target_entity_id=f"light.{schedule_id}",
+            slots=DAYTIME,
+            conditions=[
+                Condition(entity_id=entity_id, expected="on", policy="force_off")
+                for entity_id in entity_ids
+            ],
+        )
+
+    def test_index(self, fake_hass, make_coordinator, run):
+        """Test that schedules are indexed under each condition entity."""
+        coordinator = make_coordinator(
+            self._schedule("a", "binary_sensor.home"),
+            self._schedule("b", "binary_sensor.home", "binary_sensor.dark"),
+            self._schedule("c"),
+        )
+
+        assert coordinator._condition_index == {
+            "binary_sensor.home": {"a", "b"},
+            "binary_sensor.dark": {"b"},
+        }
+        assert coordinator._condition_entities == {
+            "binary_sensor.home",
+            "binary_sensor.dark",
+        }
+
+    def test_reconciles_affected(self, fake_hass, make_coordinator, run):
+        """Test that a condition change reconciles only its schedules."""
+        for entity_id in ("light.a", "light.b", "light.c", "binary_sensor.home"):
+            fake_hass.states.async_set(entity_id, "on")
+        fake_hass.states.async_set("binary_sensor.dark", "on")
+        coordinator = make_coordinator(
+            self._schedule("a", "binary_sensor.home"),
+            self._schedule("b", "binary_sensor.dark"),
+            self._schedule("c"),
+        )
+        reconciled = coordinator.get_metrics()["counters"]["schedules_reconciled"]
+
+        change_state(fake_hass, run, "binary_sensor.home", "off")
+
+        counters = coordinator.get_metrics()["counters"]
+        assert counters["condition_changes"] == 1
+        assert counters["schedules_reconciled"] == reconciled + 1
+        assert fake_hass.states.get("light.a").state == "off"
+        assert fake_hass.states.get("light.b").state == "on"
+
+    def test_reindex(self, fake_hass, make_coordinator, run):
+        """Test that changing and removing conditions updates the index."""
+        fake_hass.states.async_set("binary_sensor.home", "on")
+        coordinator = make_coordinator(
+            self._schedule("a", "binary_sensor.home"),
+            self._schedule("b", "binary_sensor.home"),
+        )
+
+        run(
+            coordinator.async_set_conditions(
+                "a", [{"entity_id": "binary_sensor.dark", "expected": "on"}]
+            )
+        )
+        assert coordinator._condition_index == {
+            "binary_sensor.home": {"b"},
+            "binary_sensor.dark": {"a"},
+        }
+
+        run(coordinator.async_remove_schedule("b"))
+        assert coordinator._condition_index == {"binary_sensor.dark": {"a"}}
+        assert coordinator._condition_entities == {"binary_sensor.dark"}
+
+        # No longer a condition entity, so nothing is reconciled
+        change_state(fake_hass, run, "binary_sensor.home", "off")
+        assert "condition_changes" not in coordinator.get_metrics()["counters"]
+
+
+class TestStateSnapshot:
+    """Test sharing one lazy state snapshot per reconcile pass."""
+
+    def test_lazy_capture(self, fake_hass):
+        """Test that states are read on first lookup and then kept."""
+        fake_hass.states.async_set("binary_sensor.home", "on")
+        states = StateSnapshot(fake_hass)
+        assert len(states) == 0
+
+        assert states["binary_sensor.home"] == "on"
+        assert states["sensor.missing"] == "unknown"
+        fake_hass.states.async_set("binary_sensor.home", "off")
+
+        assert states["binary_sensor.home"] == "on"
+        assert dict(states) == {
+            "binary_sensor.home": "on",
+            "sensor.missing": "unknown",
+        }
+
+    def test_shared_by_pass(self, fake_hass, make_coordinator, run):
+        """Test that a pass reads a shared condition entity once."""
+        fake_hass.states.async_set("binary_sensor.home", "on")
+        coordinator = make_coordinator(
+            *(
+                TestConditionIndex._schedule(schedule_id, "binary_sensor.home")
+                for schedule_id in ("a", "b", "c")
+            )
+        )
+        get = fake_hass.states.get
+        reads = Counter()
+
+        def _counting_get(entity_id):
+            reads[entity_id] += 1
+            return get(entity_id)
+
+        fake_hass.states.get = _counting_get
+        run(coordinator.async_reconcile_all())
+
+        assert reads["binary_sensor.home"] == 1
+        assert all(
+            state.last_condition_evaluation == "All conditions met"
+            for state in coordinator.get_all_schedule_states().values()
+        )
+
+
+class TestActuation:
+    """Test batching service calls by domain and direction."""
+
+    def test_batches(self, fake_hass, make_coordinator, run):
+        """Test that changes are sent as one call per domain and direction."""
+        targets = {
+            "light.a": DAYTIME,
+            "light.b": DAYTIME,
+            "switch.c": DAYTIME,
+            "input_boolean.d": DAYTIME,
+            "light.e": SlotMask(0, 48),
+        }
+        for entity_id in targets:
+            fake_hass.states.async_set(
+                entity_id, "on" if entity_id == "light.e" else "off"
+            )
+        coordinator = make_coordinator(
+            *(
+                Schedule(
+                    schedule_id=entity_id.replace(".", "_"),
+                    target_entity_id=entity_id,
+                    slots=slots,
+                )
+                for entity_id, slots in targets.items()
+            )
+        )
+
+        assert fake_hass.services.calls == {
+            "light.turn_on": 1,
+            "switch.turn_on": 1,
+            "homeassistant.turn_on": 1,
+            "light.turn_off": 1,
+        }
+        assert fake_hass.services.entities["light.turn_on"] == 2
+        assert coordinator.get_metrics()["counters"]["entities_turned_on"] == 4
+
+        # Already applied, so nothing is called again
+        run(coordinator.async_reconcile_all())
+        assert sum(fake_hass.services.calls.values()) == 4
+
+    def test_shared_target(self, fake_hass, make_coordinator, run):
+        """Test that the later schedule in ID order wins a shared target."""
+        fake_hass.states.async_set("light.porch", "on")
+        make_coordinator(
+            Schedule(schedule_id="a", target_entity_id="light.porch", slots=DAYTIME),
+            Schedule(schedule_id="b", target_entity_id="light.porch"),
+        )
+
+        assert fake_hass.services.calls == {"light.turn_off": 1}
+        assert fake_hass.states.get("light.porch").state == "off"
+
+
+class TestTargetLocks:
+    """Test serializing actuation per target."""
+
+    def test_stale_pass(self, fake_hass, make_coordinator, run):
+        """Test that a pass superseded while waiting for the lock applies nothing."""
+        fake_hass.states.async_set("light.porch", "off")
+        fake_hass.states.async_set("binary_sensor.home", "off")
+        coordinator = make_coordinator(
+            TestConditionIndex._schedule("porch", "binary_sensor.home")
+        )
+        calls = sum(fake_hass.services.calls.values())
+
+        async def _race():
+            lock = coordinator._target_locks["light.porch"]
+            async with lock:
+                # Decided on, then off again before the first pass got the lock
+                fake_hass.states.async_set("binary_sensor.home", "on")
+                await asyncio.sleep(0)
+                fake_hass.states.async_set("binary_sensor.home", "off")
+                await asyncio.sleep(0)
+
+        run(_race())
+
+        assert sum(fake_hass.services.calls.values()) == calls
+        assert fake_hass.states.get("light.porch").state == "off"
+        assert coordinator.get_metrics()["counters"]["superseded_changes"] == 1
+        # Re-queued rather than dropped
+        assert coordinator._retry_schedules == {"porch": "light.porch"}
+
+    def test_skipped_schedule_on_shared_target(self, fake_hass, make_coordinator, run):
+        """Test that a schedule skipping a shared target supersedes nothing."""
+        fake_hass.states.async_set("light.porch", "off")
+        fake_hass.states.async_set("binary_sensor.home", "off")
+        fake_hass.states.async_set("binary_sensor.away", "off")
+        coordinator = make_coordinator(
+            Schedule(
+                schedule_id="a",
+                target_entity_id="light.porch",
+                slots=DAYTIME,
+                conditions=[
+                    Condition(
+                        entity_id="binary_sensor.home",
+                        expected="on",
+                        policy="force_off",
+                    )
+                ],
+            ),
+            Schedule(
+                schedule_id="b",
+                target_entity_id="light.porch",
+                slots=DAYTIME,
+                conditions=[
+                    Condition(
+                        entity_id="binary_sensor.away", expected="on", policy="skip"
+                    )
+                ],
+            ),
+        )
+
+        async def _race():
+            lock = coordinator._target_locks["light.porch"]
+            async with lock:
+                # a decides on, then a pass that only skips b runs meanwhile
+                fake_hass.states.async_set("binary_sensor.home", "on")
+                await asyncio.sleep(0)
+                fake_hass.states.async_set("binary_sensor.away", "unknown")
+                await asyncio.sleep(0)
+
+        run(_race())
+
+        assert fake_hass.states.get("light.porch").state == "on"
+        assert "superseded_changes" not in coordinator.get_metrics()["counters"]
+
+    def test_cleanup(self, fake_hass, make_coordinator, run):
+        """Test that locks of targets no schedule uses any more are dropped."""
+        for entity_id in ("light.a", "light.b", "light.c"):
+            fake_hass.states.async_set(entity_id, "off")
+        coordinator = make_coordinator(
+            Schedule(schedule_id="a", target_entity_id="light.a", slots=DAYTIME),
+            Schedule(schedule_id="a2", target_entity_id="light.a", slots=DAYTIME),
+            Schedule(schedule_id="b", target_entity_id="light.b", slots=DAYTIME),
+        )
+        assert set(coordinator._target_locks) == {"light.a", "light.b"}
+
+        # Still used by a2
+        run(coordinator.async_remove_schedule("a"))
+        assert set(coordinator._target_locks) == {"light.a", "light.b"}
+
+        run(coordinator.async_set_schedule("b", "light.c", DAYTIME))
+        assert set(coordinator._target_locks) == {"light.a", "light.c"}
+
+        run(
+            coordinator.async_bulk_set(
+                [
+                    {"schedule_id": "a2", "action": "remove"},
+                    {"schedule_id": "b", "target_entity_id": "light.b"},
+                ]
+            )
+        )
+        assert set(coordinator._target_locks) == {"light.b"}
+        assert set(coordinator._target_passes) == {"light.b"}
+
+
+class TestSlotDispatcher:
+    """Test the shared slot-boundary dispatcher."""
+
+    def test_shared_timer(self, fake_hass, make_coordinator, run):
+        """Test that one boundary timer notifies every listener."""
+        fake_hass.states.async_set("light.porch", "off")
+        coordinator = make_coordinator(
+            *(
+                Schedule(schedule_id=schedule_id, target_entity_id="light.porch")
+                for schedule_id in ("a", "b", "c")
+            )
+        )
+        calls = Counter()
+        for schedule_id in ("a", "b", "c"):
+            coordinator.async_add_slot_listener(
+                schedule_id, lambda schedule_id=schedule_id: calls.update([schedule_id])
+            )
+
+        assert pending_timers(fake_hass) == [START + timedelta(minutes=30)]
+
+        run(fake_hass.async_run_until(START.replace(hour=7)))
+
+        assert calls == {"a": 2, "b": 2, "c": 2}
+        assert fake_hass.timers_fired == 2
+        assert coordinator.get_metrics()["histograms"]["slot_boundary"]["count"] == 2
+
+    def test_only_changed(self, fake_hass, make_coordinator, run):
+        """Test that listeners are told only when their slot data changes."""
+        fake_hass.states.async_set("light.a", "off")
+        fake_hass.states.async_set("light.b", "off")
+        coordinator = make_coordinator(
+            Schedule(schedule_id="hourly", target_entity_id="light.a", resolution=60),
+            Schedule(schedule_id="half_hourly", target_entity_id="light.b"),
+        )
+        calls = Counter()
+        for schedule_id in ("hourly", "half_hourly"):
+            coordinator.async_add_slot_listener(
+                schedule_id, lambda schedule_id=schedule_id: calls.update([schedule_id])
+            )
+
+        run(fake_hass.async_run_until(START.replace(hour=8)))
+
+        assert calls == {"hourly": 2, "half_hourly": 4}
+
+    def test_finest_resolution(self, fake_hass, make_coordinator, run):
+        """Test that the tick follows the finest resolution with listeners."""
+        fake_hass.states.async_set("light.a", "off")
+        coordinator = make_coordinator(
+            Schedule(schedule_id="a", target_entity_id="light.a"),
+            Schedule(schedule_id="quarter", target_entity_id="light.a", resolution=15),
+        )
+        calls = Counter()
+        for schedule_id in ("a", "quarter"):
+            coordinator.async_add_slot_listener(
+                schedule_id, lambda schedule_id=schedule_id: calls.update([schedule_id])
+            )
+        assert pending_timers(fake_hass) == [START + timedelta(minutes=15)]
+
+        run(fake_hass.async_run_until(START.replace(hour=7)))
+        assert calls == {"a": 2, "quarter": 4}
+
+        # Switching to a finer resolution brings the next boundary forward
+        run(
+            coordinator.async_set_schedule(
+                "a", "light.a", SlotMask(0, 288), resolution=5
+            )
+        )
+        run(coordinator.storage.async_flush())
+        assert pending_timers(fake_hass) == [START.replace(hour=7, minute=5)]
+
+    def test_remove_listener(self, fake_hass, make_coordinator, run):
+        """Test that removed listeners are not called and stop the timer."""
+        fake_hass.states.async_set("light.porch", "off")
+        coordinator = make_coordinator(
+            Schedule(schedule_id="a", target_entity_id="light.porch")
+        )
+        calls = []
+        remove = coordinator.async_add_slot_listener("a", lambda: calls.append(1))
+        run(fake_hass.async_run_until(START + timedelta(minutes=30)))
+
+        remove()
+        run(fake_hass.async_run_until(START.replace(hour=8)))
+
+        assert calls == [1]
+        assert pending_timers(fake_hass) == []
+
+
+class TestListeners:
+    """Test keyed schedule listeners."""
+
+    def test_keyed(self, fake_hass, make_coordinator, run):
+        """Test that a reconcile wakes only the listeners of its schedules."""
+        fake_hass.states.async_set("light.porch", "off")
+        coordinator = make_coordinator(
+            Schedule(schedule_id="a", target_entity_id="light.porch"),
+            Schedule(schedule_id="b", target_entity_id="light.porch"),
+        )
+        calls = Counter()
+        changes = []
+        coordinator.async_add_listener("a", lambda: calls.update(["a"]))
+        coordinator.async_add_listener("b", lambda: calls.update(["b"]))
+        coordinator.async_add_change_listener(changes.append)
+
+        run(coordinator.async_reconcile_schedule("a"))
+
+        assert calls == {"a": 1}
+        assert changes == ["a"]
+
+    def test_remove(self, fake_hass, make_coordinator, run):
+        """Test that removed listeners are no longer called."""
+        fake_hass.states.async_set("light.porch", "off")
+        coordinator = make_coordinator(
+            Schedule(schedule_id="a", target_entity_id="light.porch")
+        )
+        calls = []
+        remove = coordinator.async_add_listener("a", lambda: calls.append("a"))
+        remove_change = coordinator.async_add_change_listener(calls.append)
+
+        remove()
+        remove_change()
+        # Removing twice is harmless
+        remove()
+        run(coordinator.async_reconcile_all())
+
+        assert calls == []
+        assert coordinator._update_listeners == {}
+
+
+class TestDataVersion:
+    """Test the data version and the serialized schedule cache."""
+
+    def test_version(self, fake_hass, make_coordinator, run):
+        """Test that the version moves only when schedules or states change."""
+        fake_hass.states.async_set("light.a", "off")
+        coordinator = make_coordinator(
+            Schedule(schedule_id="a", target_entity_id="light.a", slots=DAYTIME)
+        )
+        version = coordinator.data_version
+
+        run(coordinator.async_reconcile_all())
+        assert coordinator.data_version == version
+
+        run(coordinator.async_disable_schedule("a"))
+        assert coordinator.data_version > version
+        version = coordinator.data_version
+
+        run(coordinator.async_remove_schedule("a"))
+        assert coordinator.data_version > version
+
+    def test_serialized_cache(self, fake_hass, make_coordinator, run):
+        """Test that serialized schedules are reused until the schedule changes."""
+        fake_hass.states.async_set("light.a", "off")
+        coordinator = make_coordinator(
+            Schedule(schedule_id="a", target_entity_id="light.a", slots=DAYTIME)
+        )
+
+        serialized = coordinator.get_serialized_schedule("a")
+        assert coordinator.get_serialized_schedule("a") is serialized
+        assert coordinator.get_serialized_schedule("a", "hex")["slots"] == (
+            DAYTIME.to_hex()
+        )
+
+        run(coordinator.async_disable_schedule("a"))
+        updated = coordinator.get_serialized_schedule("a")
+        assert updated is not serialized
+        assert updated["enabled"] is False
+        assert coordinator.get_serialized_schedule("missing") is None
+
+
+class TestTimezones:
+    """Test transitions and slot boundaries in a schedule's timezone."""
+
+    @staticmethod
+    def _setup(fake_hass, make_coordinator, start, intervals):
+        """Set up a Berlin schedule with a slot listener at a start time."""
+        fake_hass.clock.now = start
+        fake_hass.states.async_set("light.a", "off")
+        coordinator = make_coordinator(
+            Schedule(
+                schedule_id="a",
+                target_entity_id="light.a",
+                timezone="Europe/Berlin",
+                slots=SlotMask.from_intervals(intervals, 48),
+            )
+        )
+        boundaries = []
+        coordinator.async_add_slot_listener(
+            "a", lambda: boundaries.append(fake_hass.clock.now)
+        )
+        fake_hass.services.calls.clear()
+        return coordinator, boundaries
+
+    def test_spring_forward(self, fake_hass, make_coordinator, run):
+        """Test that slots in the skipped hour never start."""
+        start = datetime(2026, 3, 29, 0, 0, tzinfo=UTC)  # 01:00 CET
+        coordinator, boundaries = self._setup(
+            fake_hass, make_coordinator, start, [["02:30", "05:00"]]
+        )
+
+        # 02:30 does not exist, so the schedule turns on at 03:00 CEST
+        assert coordinator._next_transitions["a"] == start.replace(hour=1)
+        assert pending_timers(fake_hass) == [
+            start.replace(minute=30),
+            start.replace(hour=1),
+        ]
+
+        run(fake_hass.async_run_until(start.replace(hour=3)))
+
+        assert fake_hass.states.get("light.a").state == "off"
+        assert fake_hass.services.calls == {"light.turn_on": 1, "light.turn_off": 1}
+        # No boundary at the missing 02:00 CET
+        assert boundaries == [
+            start.replace(minute=30),
+            start.replace(hour=1),
+            start.replace(hour=1, minute=30),
+            start.replace(hour=2),
+            start.replace(hour=2, minute=30),
+            start.replace(hour=3),
+        ]
+
+    def test_fall_back(self, fake_hass, make_coordinator, run):
+        """Test that no slot runs twice in the repeated hour."""
+        start = datetime(2026, 10, 24, 23, 0, tzinfo=UTC)  # 01:00 CEST
+        coordinator, boundaries = self._setup(
+            fake_hass, make_coordinator, start, [["02:00", "02:30"]]
+        )
+        midnight = datetime(2026, 10, 25, tzinfo=UTC)  # 02:00 CEST
+
+        # Compared in UTC, as the repeated hour makes 02:00 ambiguous
+        assert coordinator._next_transitions["a"].astimezone(UTC) == midnight
+
+        run(fake_hass.async_run_until(midnight.replace(hour=3)))
+
+        # On from 02:00 to 02:30 CEST only, not again at 02:00 CET
+        assert fake_hass.services.calls == {"light.turn_on": 1, "light.turn_off": 1}
+        assert coordinator._next_transitions["a"].astimezone(UTC) == (
+            midnight + timedelta(days=1, hours=1)
+        )
+        # 02:30 CEST lasts until 03:00 CET
+        assert boundaries == [
+            start.replace(minute=30),
+            midnight,
+            midnight.replace(minute=30),
+            midnight.replace(hour=2),
+            midnight.replace(hour=2, minute=30),
+            midnight.replace(hour=3),
+        ]
+
+    def test_prunes_past_days(self, fake_hass, make_coordinator, run):
+        """Test that timelines of days that have passed are dropped."""
+        coordinator, _ = self._setup(
+            fake_hass, make_coordinator, START, [["06:00", "12:00"]]
+        )
+
+        run(fake_hass.async_run_until(START + timedelta(days=3)))
+
+        days = {key[2] for key in coordinator._timelines}
+        assert min(days) == (START + timedelta(days=3)).date()
+
+
+class TestRetries:
+    """Test retrying changes that could not be applied."""
+
+    def test_missing_target(self, fake_hass, make_coordinator, run):
+        """Test that a target missing at setup is switched once it appears."""
+        coordinator = make_coordinator(
+            Schedule(schedule_id="porch", target_entity_id="light.porch", slots=DAYTIME)
+        )
+        assert fake_hass.services.calls["light.turn_on"] == 0
+        assert coordinator.get_metrics()["gauges"]["retry_schedules"] == 1
+
+        fake_hass.track_point_in_time(
+            lambda now: fake_hass.states.async_set("light.porch", "off"),
+            START + timedelta(seconds=10),
+        )
+        # Well before the retry timer, so the state change did it
+        run(fake_hass.async_run_until(START + timedelta(seconds=20)))
+
+        assert fake_hass.services.calls["light.turn_on"] == 1
+        assert fake_hass.states.get("light.porch").state == "on"
+        assert coordinator.get_metrics()["gauges"]["retry_schedules"] == 0
+
+    def test_failed_call(self, fake_hass, make_coordinator, run):
+        """Test that a failed service call is retried on the retry timer."""
+        fake_hass.states.async_set("light.porch", "off")
+        async_call = fake_hass.services.async_call
+        failures = [HomeAssistantError("Unavailable")]
+
+        async def _flaky_call(*args, **kwargs):
+            if failures:
+                raise failures.pop()
+            await async_call(*args, **kwargs)
+
+        fake_hass.services.async_call = _flaky_call
+        coordinator = make_coordinator(
+            Schedule(schedule_id="porch", target_entity_id="light.porch", slots=DAYTIME)
+        )
+        assert coordinator.get_metrics()["counters"]["service_call_errors"] == 1
+        assert fake_hass.states.get("light.porch").state == "off"
+
+        run(fake_hass.async_run_until(START + timedelta(seconds=RETRY_DELAY + 1)))
+
+        assert fake_hass.states.get("light.porch").state == "on"
+        assert coordinator.get_metrics()["gauges"]["retry_schedules"] == 0
+
+    def test_failed_target_in_batch(self, fake_hass, make_coordinator, run):
+        """Test that one failing target does not hold back the rest of a batch."""
+        fake_hass.states.async_set("light.bad", "off")
+        fake_hass.states.async_set("light.good", "off")
+        async_call = fake_hass.services.async_call
+
+        async def _failing_call(domain, service, service_data=None, **kwargs):
+            if "light.bad" in service_data["entity_id"]:
+                raise HomeAssistantError("Unavailable")
+            await async_call(domain, service, service_data, **kwargs)
+
+        fake_hass.services.async_call = _failing_call
+        coordinator = make_coordinator(
+            Schedule(schedule_id="bad", target_entity_id="light.bad", slots=DAYTIME),
+            Schedule(schedule_id="good", target_entity_id="light.good", slots=DAYTIME),
+        )
+
+        assert fake_hass.states.get("light.good").state == "on"
+        assert fake_hass.states.get("light.bad").state == "off"
+        assert coordinator._last_applied_states == {"light.good": True}
+        assert coordinator._retry_schedules == {"bad": "light.bad"}
+        # The batch, then one call per target
+        assert coordinator.get_metrics()["counters"]["service_calls"] == 3
+
+        # Only the failing target is retried
+        fake_hass.services.async_call = async_call
+        run(fake_hass.async_run_until(START + timedelta(seconds=RETRY_DELAY + 1)))
+
+        assert fake_hass.services.entities["light.turn_on"] == 2
+        assert fake_hass.states.get("light.bad").state == "on"
+        assert coordinator.get_metrics()["gauges"]["retry_schedules"] == 0
+
+    def test_removed_schedule(self, fake_hass, make_coordinator, run):
+        """Test that removing a schedule drops its pending retry."""
+        coordinator = make_coordinator(
+            Schedule(schedule_id="porch", target_entity_id="light.porch", slots=DAYTIME)
+        )
+
+        run(coordinator.async_remove_schedule("porch"))
+        fake_hass.track_point_in_time(
+            lambda now: fake_hass.states.async_set("light.porch", "off"),
+            START + timedelta(seconds=10),
+        )
+        run(fake_hass.async_run_until(START + timedelta(seconds=RETRY_DELAY + 1)))
+
+        assert fake_hass.services.calls["light.turn_on"] == 0
+        assert coordinator.get_metrics()["gauges"]["retry_schedules"] == 0
@@ -0,0 +1,198 @@
+"""Test Timer 24H schedule entities."""
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from custom_components.timer24h.const import DOMAIN
+from custom_components.timer24h.entity_schedule import (
+    Timer24HMetricsEntity,
+    Timer24HScheduleEntity,
+    async_setup_entry,
+)
+from custom_components.timer24h.models import Schedule, SlotMask
+
+from .conftest import START
+
+DAYTIME = SlotMask.from_intervals([["06:00", "20:00"]], 48)
+
+
+@pytest.fixture
+def entity_registry():
+    """Entity registry without any registered entities."""
+    registry = Mock()
+    registry.async_get.return_value = None
+    with patch(
+        "custom_components.timer24h.entity_schedule.er.async_get",
+        return_value=registry,
+    ):
+        yield registry
+
+
+@pytest.fixture
+def setup_entities(
+    fake_hass, make_coordinator, mock_config_entry, entity_registry, run
+):
+    """Set up the schedule platform over a coordinator's schedules."""
+
+    def _setup(*schedules):
+        for schedule in schedules:
+            fake_hass.states.async_set(schedule.target_entity_id, "off")
+        coordinator = make_coordinator(*schedules)
+        fake_hass.data[DOMAIN] = {
+            mock_config_entry.entry_id: {
+                "coordinator": coordinator,
+                "storage": coordinator.storage,
+            }
+        }
+        add_entities = Mock()
+        run(async_setup_entry(fake_hass, mock_config_entry, add_entities))
+        entities = fake_hass.data[DOMAIN][mock_config_entry.entry_id]["entities"]
+        return coordinator, add_entities, entities
+
+    return _setup
+
+
+class TestEntityLifecycle:
+    """Test following schedules being added and removed."""
+
+    def test_setup(self, setup_entities):
+        """Test that existing schedules get entities plus the metrics sensor."""
+        _, add_entities, entities = setup_entities(
+            Schedule(schedule_id="a", target_entity_id="light.a"),
+            Schedule(schedule_id="b", target_entity_id="light.b"),
+        )
+
+        added = add_entities.call_args.args[0]
+        assert [type(entity) for entity in added] == [
+            Timer24HScheduleEntity,
+            Timer24HScheduleEntity,
+            Timer24HMetricsEntity,
+        ]
+        assert set(entities) == {"a", "b"}
+
+    def test_unique_ids(self, setup_entities):
+        """Test that a schedule named metrics does not clash with the sensor."""
+        _, add_entities, _ = setup_entities(
+            Schedule(schedule_id="metrics", target_entity_id="light.a"),
+        )
+
+        schedule_entity, metrics_entity = add_entities.call_args.args[0]
+        assert schedule_entity.unique_id != metrics_entity.unique_id
+
+    def test_added(self, fake_hass, setup_entities, run):
+        """Test that an entity is created when a schedule is added."""
+        coordinator, add_entities, entities = setup_entities()
+        fake_hass.states.async_set("light.a", "off")
+
+        run(coordinator.async_set_schedule("a", "light.a", DAYTIME))
+        # Updating it does not add another entity
+        run(coordinator.async_set_schedule("a", "light.a", SlotMask(0, 48)))
+
+        assert add_entities.call_count == 2
+        (entity,) = add_entities.call_args.args[0]
+        assert entity.schedule_id == "a"
+        assert entities == {"a": entity}
+
+    def test_removed(self, entity_registry, setup_entities, run):
+        """Test that entities are removed with their schedules."""
+        coordinator, _, entities = setup_entities(
+            Schedule(schedule_id="a", target_entity_id="light.a"),
+            Schedule(schedule_id="b", target_entity_id="light.b"),
+        )
+        entity_a, entity_b = entities["a"], entities["b"]
+        entity_a.entity_id = "sensor.timer_24h_a"
+        entity_b.entity_id = "sensor.timer_24h_b"
+        entity_b.async_remove = AsyncMock()
+        entity_registry.async_get.side_effect = lambda entity_id: (
+            Mock() if entity_id == entity_a.entity_id else None
+        )
+
+        run(
+            coordinator.async_bulk_set(
+                [
+                    {"schedule_id": "a", "action": "remove"},
+                    {"schedule_id": "b", "action": "remove"},
+                ]
+            )
+        )
+
+        # Registered entities go through the registry, others remove themselves
+        entity_registry.async_remove.assert_called_once_with(entity_a.entity_id)
+        entity_b.async_remove.assert_awaited_once()
+        assert entities == {}
+
+
+class TestAttributeCache:
+    """Test caching the schedule sensor attributes."""
+
+    @staticmethod
+    def _entity(fake_hass, coordinator, schedule_id):
+        """Create an entity listening like it does once added to hass."""
+        entity = Timer24HScheduleEntity(coordinator, schedule_id)
+        entity.hass = fake_hass
+        entity.async_write_ha_state = Mock()
+        coordinator.async_add_listener(schedule_id, entity._async_handle_update)
+        coordinator.async_add_slot_listener(schedule_id, entity._async_handle_update)
+        return entity
+
+    def test_cached(self, fake_hass, make_coordinator):
+        """Test that attributes are built once until invalidated."""
+        fake_hass.states.async_set("light.a", "off")
+        coordinator = make_coordinator(
+            Schedule(schedule_id="a", target_entity_id="light.a", slots=DAYTIME)
+        )
+        entity = self._entity(fake_hass, coordinator, "a")
+
+        with patch.object(
+            entity, "_build_state_attributes", wraps=entity._build_state_attributes
+        ) as build:
+            attrs = entity.extra_state_attributes
+            assert entity.extra_state_attributes is attrs
+            assert build.call_count == 1
+
+        assert attrs["current_slot"] == 12
+        assert attrs["next_change_time"] == "2026-01-05T20:00:00+00:00"
+
+    def test_invalidated(self, fake_hass, make_coordinator, run):
+        """Test that reconciles and slot boundaries rebuild the attributes."""
+        fake_hass.states.async_set("light.a", "off")
+        coordinator = make_coordinator(
+            Schedule(schedule_id="a", target_entity_id="light.a", slots=DAYTIME)
+        )
+        entity = self._entity(fake_hass, coordinator, "a")
+        attrs = entity.extra_state_attributes
+
+        run(coordinator.async_reconcile_schedule("a"))
+        assert entity.async_write_ha_state.call_count == 1
+        reconciled = entity.extra_state_attributes
+        assert reconciled is not attrs
+        assert reconciled == attrs
+
+        run(fake_hass.async_run_until(START + timedelta(minutes=30)))
+        assert entity.async_write_ha_state.call_count == 2
+        assert entity.extra_state_attributes["current_slot"] == 13
+
+
+class TestAttributes:
+    """Test the schedule sensor attributes."""
+
+    def test_slots_of_local_day(self, fake_hass, make_coordinator):
+        """Test that today's slots are those of the schedule's local day."""
+        fake_hass.states.async_set("light.a", "off")
+        # Monday 06:00 UTC is still Sunday in Los Angeles
+        schedule = Schedule(
+            schedule_id="a",
+            target_entity_id="light.a",
+            timezone="America/Los_Angeles",
+            slots=DAYTIME,
+            week=Schedule.parse_week({"weekend": []}, DAYTIME, 48),
+        )
+        coordinator = make_coordinator(schedule)
+        entity = Timer24HScheduleEntity(coordinator, "a")
+        entity.hass = fake_hass
+
+        attrs = entity.extra_state_attributes
+
+        assert attrs["slots"] == [False] * 48
+        assert attrs["current_slot"] == 44
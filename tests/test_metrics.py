@@ -0,0 +1,66 @@
+"""Test Timer 24H metrics."""
+import pytest
+
+from custom_components.timer24h.metrics import DURATION_BUCKETS, Histogram, Metrics
+
+
+class TestHistogram:
+    """Test Histogram."""
+
+    def test_empty(self):
+        """Test an empty histogram."""
+        data = Histogram().as_dict()
+
+        assert data["count"] == 0
+        assert data["mean"] == 0.0
+        assert data["max"] == 0.0
+        assert set(data["buckets"]) == {*map(str, DURATION_BUCKETS), "+Inf"}
+        assert not any(data["buckets"].values())
+
+    def test_observe(self):
+        """Test durations land in cumulative buckets."""
+        histogram = Histogram()
+        for seconds in (0.0005, 0.001, 0.003, 0.2, 10.0):
+            histogram.observe(seconds)
+
+        data = histogram.as_dict()
+        assert data["count"] == 5
+        assert data["sum"] == pytest.approx(10.2045)
+        assert data["mean"] == pytest.approx(10.2045 / 5)
+        assert data["max"] == 10.0
+        assert data["last"] == 10.0
+        # Bucket bounds are inclusive
+        assert data["buckets"]["0.001"] == 2
+        assert data["buckets"]["0.005"] == 3
+        assert data["buckets"]["0.1"] == 3
+        assert data["buckets"]["0.5"] == 4
+        assert data["buckets"]["5.0"] == 4
+        assert data["buckets"]["+Inf"] == 5
+
+
+class TestMetrics:
+    """Test Metrics."""
+
+    def test_counters(self):
+        """Test counters start at zero and add up."""
+        metrics = Metrics()
+        metrics.increment("service_calls")
+        metrics.increment("entities_turned_on", 3)
+        metrics.increment("entities_turned_on", 2)
+
+        assert metrics.as_dict()["counters"] == {
+            "service_calls": 1,
+            "entities_turned_on": 5,
+        }
+
+    def test_timer(self):
+        """Test the timer records the block, even when it raises."""
+        metrics = Metrics()
+        with metrics.timer("reconcile"):
+            pass
+        with pytest.raises(RuntimeError), metrics.timer("reconcile"):
+            raise RuntimeError
+
+        histogram = metrics.as_dict()["histograms"]["reconcile"]
+        assert histogram["count"] == 2
+        assert histogram["max"] >= 0.0
@@ -1,7 +1,16 @@
 """Test Timer 24H models."""
+from datetime import UTC, date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
 import pytest
 
-from custom_components.timer24h.models import Condition, Schedule, Timer24HData
+from custom_components.timer24h.models import (
+    Condition,
+    Schedule,
+    SlotMask,
+    SlotTimeline,
+    Timer24HData,
+)
 
 
 class TestCondition:
@@ -114,6 +123,175 @@ class TestCondition:
         assert data == expected
 
 
+class TestSlotMask:
+    """Test SlotMask bitset."""
+
+    def test_from_list_round_trip(self):
+        """Test converting between lists and masks."""
+        slots = [i % 3 == 0 for i in range(48)]
+        mask = SlotMask.from_list(slots)
+
+        assert len(mask) == 48
+        assert mask.to_list() == slots
+        assert mask == slots
+        assert list(mask) == slots
+        assert mask[3] is True
+        assert mask[-1] is (47 % 3 == 0)
+        assert mask.active_count == sum(slots)
+
+    def test_is_active(self):
+        """Test bit tests including out of range indexes."""
+        mask = SlotMask(0b101)
+
+        assert mask.is_active(0) is True
+        assert mask.is_active(1) is False
+        assert mask.is_active(2) is True
+        assert mask.is_active(-1) is False
+        assert mask.is_active(48) is False
+
+    def test_hex_round_trip(self):
+        """Test the compact hex wire form."""
+        mask = SlotMask.from_list([True] + [False] * 46 + [True])
+
+        assert mask.to_hex() == "800000000001"
+        assert SlotMask.from_hex(mask.to_hex()) == mask
+        assert SlotMask.coerce("800000000001") == mask
+
+    def test_slots_until_change(self):
+        """Test transition lookups including wrap-around."""
+        slots = [False] * 48
+        slots[10:20] = [True] * 10
+        mask = SlotMask.from_list(slots)
+
+        assert mask.slots_until_change(0) == 10
+        assert mask.slots_until_change(9) == 1
+        assert mask.slots_until_change(10) == 10
+        assert mask.slots_until_change(20) == 38
+        assert mask.slots_until_change(47) == 11
+        assert SlotMask().slots_until_change(5) is None
+        assert SlotMask((1 << 48) - 1).slots_until_change(5) is None
+
+    def test_intervals_round_trip(self):
+        """Test conversion to and from on-intervals."""
+        slots = [False] * 48
+        slots[12:16] = [True] * 4  # 06:00-08:00
+        slots[36:43] = [True] * 7  # 18:00-21:30
+        mask = SlotMask.from_list(slots)
+
+        intervals = mask.to_intervals()
+        assert intervals == [["06:00", "08:00"], ["18:00", "21:30"]]
+        assert SlotMask.from_intervals(intervals) == mask
+
+    def test_intervals_wrap_midnight(self):
+        """Test intervals that cross midnight or cover the whole day."""
+        mask = SlotMask.from_intervals([["23:00", "01:00"]])
+
+        assert mask.to_list() == [True] * 2 + [False] * 44 + [True] * 2
+        assert mask.to_intervals() == [["23:00", "01:00"]]
+        assert SlotMask.from_intervals([["22:00", "24:00"]]).to_intervals() == [
+            ["22:00", "24:00"]
+        ]
+        assert SlotMask.from_intervals([["00:00", "24:00"]]).active_count == 48
+        assert SlotMask().to_intervals() == []
+
+    def test_invalid_intervals(self):
+        """Test validation of interval input."""
+        with pytest.raises(ValueError):
+            SlotMask.from_intervals([["18:15", "19:00"]])
+
+        with pytest.raises(ValueError):
+            SlotMask.from_intervals([["18:00", "18:00"]])
+
+        with pytest.raises(ValueError):
+            SlotMask.from_intervals([["18:00"]])
+
+        with pytest.raises(ValueError):
+            SlotMask.from_intervals([["25:00", "26:00"]])
+
+    def test_resample(self):
+        """Test converting a mask to another resolution."""
+        mask = SlotMask.from_intervals([["18:00", "21:30"]])
+
+        fine = mask.resample(288)
+        assert len(fine) == 288
+        assert fine.active_count == 42
+        assert fine.resample(48) == mask
+
+        with pytest.raises(ValueError):
+            mask.resample(24)
+
+    def test_invalid_values(self):
+        """Test validation of bits and hex input."""
+        with pytest.raises(ValueError):
+            SlotMask(1 << 48)
+
+        with pytest.raises(ValueError):
+            SlotMask.from_hex("not-hex")
+
+
+class TestSlotTimeline:
+    """Test SlotTimeline model."""
+
+    def test_regular_day(self):
+        """Test a day without DST changes."""
+        zone = ZoneInfo("Europe/Berlin")
+        timeline = SlotTimeline.build(date(2026, 6, 1), zone, 30)
+
+        assert timeline.slots == tuple(range(48))
+        assert timeline.starts[0] == datetime(2026, 5, 31, 22, 0, tzinfo=UTC)
+        assert timeline.end == datetime(2026, 6, 1, 22, 0, tzinfo=UTC)
+        assert timeline.slot_at(datetime(2026, 6, 1, 10, 15, tzinfo=UTC)) == 24
+        assert timeline.next_start(
+            datetime(2026, 6, 1, 21, 45, tzinfo=UTC)
+        ) == timeline.end
+
+    def test_spring_forward(self):
+        """Test that slots in the skipped hour are left out."""
+        zone = ZoneInfo("Europe/Berlin")
+        timeline = SlotTimeline.build(date(2026, 3, 29), zone, 30)
+
+        # 02:00 and 02:30 do not exist; 03:00 CEST follows 01:30 CET
+        assert len(timeline.slots) == 46
+        assert 4 not in timeline.slots
+        assert 5 not in timeline.slots
+        assert timeline.slot_at(datetime(2026, 3, 29, 0, 45, tzinfo=UTC)) == 3
+        assert timeline.next_start(
+            datetime(2026, 3, 29, 0, 45, tzinfo=UTC)
+        ) == datetime(2026, 3, 29, 1, 0, tzinfo=UTC)
+        assert timeline.slot_at(datetime(2026, 3, 29, 1, 0, tzinfo=UTC)) == 6
+
+        # A skipped slot starts with the next slot that exists
+        assert timeline.start_of(4) == timeline.start_of(6)
+        assert timeline.start_of(6) == datetime(2026, 3, 29, 1, 0, tzinfo=UTC)
+        assert timeline.end - timeline.starts[0] == timedelta(hours=23)
+
+    def test_fall_back(self):
+        """Test that slots in the repeated hour are not repeated."""
+        zone = ZoneInfo("Europe/Berlin")
+        timeline = SlotTimeline.build(date(2026, 10, 25), zone, 30)
+
+        assert timeline.slots == tuple(range(48))
+        assert timeline.start_of(4) == datetime(2026, 10, 25, 0, 0, tzinfo=UTC)
+        assert timeline.start_of(6) == datetime(2026, 10, 25, 2, 0, tzinfo=UTC)
+
+        # 02:30 CEST runs until 03:00 CET instead of restarting at 02:00 CET
+        assert timeline.slot_at(datetime(2026, 10, 25, 1, 15, tzinfo=UTC)) == 5
+        assert timeline.next_start(
+            datetime(2026, 10, 25, 0, 30, tzinfo=UTC)
+        ) == datetime(2026, 10, 25, 2, 0, tzinfo=UTC)
+        assert timeline.end - timeline.starts[0] == timedelta(hours=25)
+
+    def test_midnight_in_gap(self):
+        """Test a day that starts after a DST gap at midnight."""
+        zone = ZoneInfo("America/Santiago")
+        timeline = SlotTimeline.build(date(2026, 9, 6), zone, 60)
+
+        assert timeline.slots == tuple(range(1, 24))
+        assert timeline.starts[0] == datetime(2026, 9, 6, 4, 0, tzinfo=UTC)
+        previous = SlotTimeline.build(date(2026, 9, 5), zone, 60)
+        assert previous.end == timeline.starts[0]
+
+
 class TestSchedule:
     """Test Schedule model."""
 
@@ -194,6 +372,69 @@ class TestSchedule:
         schedule.enabled = False
         assert schedule.is_active_at_slot(0) is False
 
+    def test_get_next_change(self):
+        """Test next transition lookup on a schedule."""
+        slots = [False] * 48
+        slots[36:42] = [True] * 6  # 18:00-21:00
+        schedule = Schedule(
+            schedule_id="test",
+            target_entity_id="light.test",
+            slots=slots
+        )
+
+        change = schedule.get_next_change(30)
+        assert change.slot_index == 36
+        assert change.slots_ahead == 6
+        assert change.state is True
+
+        change = schedule.get_next_change(40)
+        assert change.slot_index == 42
+        assert change.state is False
+
+        # Replacing slots invalidates the transition table
+        schedule.slots = [True] * 48
+        assert schedule.get_next_change(30) is None
+
+        schedule.slots = slots
+        schedule.enabled = False
+        assert schedule.get_next_change(30) is None
+
+    def test_slots_assignment_is_coerced(self):
+        """Test that assigned slots are stored as a mask."""
+        schedule = Schedule(schedule_id="test", target_entity_id="light.test")
+
+        schedule.slots = [True] * 2 + [False] * 46
+        assert isinstance(schedule.slots, SlotMask)
+        assert schedule.active_slots_count == 2
+
+        schedule.slots = "000000000004"
+        assert schedule.slots.to_list() == [False] * 2 + [True] + [False] * 45
+
+    def test_resolution_assignment_resamples(self):
+        """Test that changing the resolution resamples the slots and week."""
+        schedule = Schedule(
+            schedule_id="test",
+            target_entity_id="light.test",
+            slots=SlotMask.from_intervals([["06:00", "07:00"]], 48),
+            week=SlotMask.from_days(
+                [SlotMask.from_intervals([["06:00", "07:00"]], 48)] * 5
+                + [SlotMask(0, 48)] * 2
+            ),
+        )
+
+        schedule.resolution = 15
+        assert len(schedule.slots) == 96
+        assert schedule.slots.to_intervals() == [["06:00", "07:00"]]
+        assert schedule.get_day_slots(0).to_intervals() == [["06:00", "07:00"]]
+        assert schedule.get_day_slots(6).active_count == 0
+
+        # Slots that do not fit a coarser resolution leave the schedule as is
+        schedule.slots = SlotMask.from_intervals([["06:15", "07:00"]], 96)
+        with pytest.raises(ValueError):
+            schedule.resolution = 60
+        assert schedule.resolution == 15
+        assert len(schedule.slots) == 96
+
     def test_evaluate_conditions_no_conditions(self):
         """Test condition evaluation with no conditions."""
         schedule = Schedule(
@@ -361,6 +602,147 @@ class TestSchedule:
         assert len(data["conditions"]) == 1
         assert data["conditions"][0]["entity_id"] == "sensor.test"
 
+    def test_to_dict_compact(self):
+        """Test compact serialization of slots."""
+        schedule = Schedule(
+            schedule_id="test",
+            target_entity_id="light.test",
+            slots=[True] * 4 + [False] * 44,
+        )
+
+        data = schedule.to_dict(compact=True)
+        assert data["slots"] == "00000000000f"
+        assert Schedule.from_dict(data).slots == schedule.slots
+
+    def test_to_dict_intervals(self):
+        """Test interval serialization of slots."""
+        schedule = Schedule.from_dict(
+            {
+                "schedule_id": "test",
+                "target_entity_id": "light.test",
+                "intervals": [["18:00", "21:30"]],
+            }
+        )
+
+        assert schedule.active_slots_count == 7
+        data = schedule.to_dict(intervals=True)
+        assert "slots" not in data
+        assert data["intervals"] == [["18:00", "21:30"]]
+        assert Schedule.from_dict(data).slots == schedule.slots
+
+    def test_resolution(self):
+        """Test schedules with a non-default resolution."""
+        schedule = Schedule.from_dict(
+            {
+                "schedule_id": "test",
+                "target_entity_id": "light.test",
+                "intervals": [["07:05", "07:20"]],
+                "resolution": 5,
+            }
+        )
+
+        assert len(schedule.slots) == 288
+        assert schedule.active_slots_count == 3
+        assert schedule.get_next_change(0).slot_index == 85
+
+        data = schedule.to_dict(compact=True)
+        assert data["resolution"] == 5
+        assert Schedule.from_dict(data).slots == schedule.slots
+
+        # An empty default mask adapts to the resolution
+        assert len(Schedule("test", "light.test", resolution=60).slots) == 24
+
+        with pytest.raises(ValueError):
+            Schedule("test", "light.test", resolution=7)
+
+        with pytest.raises(ValueError):
+            Schedule("test", "light.test", slots=[True] * 48, resolution=60)
+
+    def test_resolution_slot_forms(self):
+        """Test that slots in any form are read at the given resolution."""
+        schedule = Schedule(
+            "test", "light.test", slots="f" + "0" * 23, resolution=15
+        )
+        assert len(schedule.slots) == 96
+        assert schedule.active_slots_count == 4
+
+        schedule = Schedule(
+            "test", "light.test", slots=[["07:15", "07:45"]], resolution=15
+        )
+        assert schedule.active_slots_count == 2
+        assert schedule.get_next_change(0).slot_index == 29
+
+        schedule = Schedule(
+            "test", "light.test", week=[False] * 96 * 7, resolution=15
+        )
+        assert len(schedule.week) == 96 * 7
+
+    def test_from_dict_without_resolution(self):
+        """Test that schedules stored before resolutions load as 30 minutes."""
+        schedule = Schedule.from_dict(
+            {
+                "schedule_id": "test",
+                "target_entity_id": "light.test",
+                "slots": [True] * 2 + [False] * 46,
+            }
+        )
+
+        assert schedule.resolution == 30
+        assert schedule.active_slots_count == 2
+
+    def test_weekly_schedule(self):
+        """Test weekday and weekend patterns in one week mask."""
+        schedule = Schedule.from_dict(
+            {
+                "schedule_id": "test",
+                "target_entity_id": "light.test",
+                "week": {
+                    "weekdays": [["06:00", "08:00"]],
+                    "weekend": [["09:00", "12:00"]],
+                    "wed": [],
+                },
+            }
+        )
+
+        assert schedule.is_weekly
+        assert len(schedule.mask) == 336
+        assert schedule.get_day_slots(0).to_intervals() == [["06:00", "08:00"]]
+        assert schedule.get_day_slots(2).active_count == 0
+        assert schedule.get_day_slots(6).to_intervals() == [["09:00", "12:00"]]
+
+        data = schedule.to_dict(compact=True)
+        assert data["week"]["sat"] == schedule.get_day_slots(5).to_hex()
+        assert Schedule.from_dict(data).week == schedule.week
+
+        with pytest.raises(ValueError):
+            Schedule.from_dict(
+                {
+                    "schedule_id": "test",
+                    "target_entity_id": "light.test",
+                    "week": {"someday": []},
+                }
+            )
+
+    def test_weekly_next_change_wraps_week(self):
+        """Test that transitions are found across midnight and the week end."""
+        schedule = Schedule.from_dict(
+            {
+                "schedule_id": "test",
+                "target_entity_id": "light.test",
+                "week": {"mon": [["06:00", "08:00"]]},
+            }
+        )
+
+        # Sunday 23:30 is the last slot of the week; next flip is Monday 06:00
+        change = schedule.get_next_change(6 * 48 + 47)
+        assert change.slot_index == 12
+        assert change.slots_ahead == 13
+        assert change.state is True
+
+        change = schedule.get_next_change(13)
+        assert change.slot_index == 16
+        assert change.state is False
+
 
 class TestTimer24HData:
     """Test Timer24HData container."""
@@ -0,0 +1,125 @@
+"""Test the Timer 24H load simulation."""
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+
+from custom_components.timer24h.const import EVENT_SCHEDULE_UPDATED, STORAGE_KEY
+from custom_components.timer24h.models import Schedule
+from custom_components.timer24h.storage import Timer24HStorage
+
+from .simulation.fake_hass import FakeHass
+from .simulation.simulate import percentile, simulate
+
+
+def test_percentile():
+    """Test nearest-rank percentiles."""
+    values = [0.4, 0.1, 0.3, 0.2]
+
+    assert percentile(values, 50) == 0.2
+    assert percentile(values, 99) == 0.4
+    assert percentile([], 50) == 0.0
+
+
+def test_fake_hass_timers():
+    """Test that timers fire in order and can be cancelled."""
+    start = datetime(2026, 1, 5, tzinfo=UTC)
+    hass = FakeHass(start)
+    fired = []
+
+    hass.track_point_in_time(fired.append, start + timedelta(minutes=2))
+    hass.track_point_in_time(fired.append, start + timedelta(minutes=1))
+    cancel = hass.track_point_in_time(fired.append, start + timedelta(minutes=3))
+    cancel()
+
+    asyncio.run(hass.async_run_until(start + timedelta(hours=1)))
+
+    assert fired == [start + timedelta(minutes=1), start + timedelta(minutes=2)]
+    assert hass.clock.now == start + timedelta(hours=1)
+
+
+def test_fake_hass_listen_once():
+    """Test that a one-off listener only sees the first event."""
+    hass = FakeHass(datetime(2026, 1, 5, tzinfo=UTC))
+    seen = []
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, seen.append)
+    remove = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, seen.append)
+    remove()
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+
+    assert len(seen) == 1
+
+
+def test_fake_hass_store():
+    """Test that delayed saves of the storage work against the stand-in."""
+    hass = FakeHass(datetime(2026, 1, 5, tzinfo=UTC))
+
+    async def run() -> None:
+        storage = Timer24HStorage(hass)
+        await storage.async_load()
+        await storage.async_add_schedule(
+            Schedule(schedule_id="porch", target_entity_id="light.porch")
+        )
+        assert storage.dirty
+
+        # The delayed save runs once the virtual clock passes its delay
+        await hass.async_run_until(hass.clock.now + timedelta(seconds=5))
+        assert storage.dirty
+        await hass.async_run_until(hass.clock.now + timedelta(seconds=10))
+        assert not storage.dirty
+
+        # The final write on shutdown flushes a pending delayed save
+        await storage.async_add_schedule(
+            Schedule(schedule_id="garden", target_entity_id="light.garden")
+        )
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+    asyncio.run(run())
+
+    with open(hass.config.path(".storage", STORAGE_KEY), encoding="utf-8") as file:
+        stored = json.load(file)
+    assert list(stored["data"]["schedules"]) == ["porch", "garden"]
+
+
+def test_simulate_day():
+    """Test a simulated day of schedules with flapping condition sensors."""
+    report = simulate(
+        schedules=200,
+        sensors=10,
+        duration=timedelta(days=1),
+        start=datetime(2026, 1, 5, tzinfo=UTC),
+        flap_interval=timedelta(minutes=30),
+    )
+    summary = report.summary()
+
+    assert summary["simulated_hours"] == 24
+    assert report.timer_wakeups > 0
+    assert report.sensor_flaps > 0
+    assert summary["service_calls"] > 0
+    assert summary["reconciles"] >= report.timer_wakeups
+    assert report.bus_events[EVENT_SCHEDULE_UPDATED] > 0
+    assert summary["reconcile_ms"]["p50"] <= summary["reconcile_ms"]["max"]
+    assert "Service calls:" in report.format()
+
+
+def test_simulate_edits():
+    """Test a simulation with bulk edits of schedules during the run."""
+    report = simulate(
+        schedules=100,
+        sensors=5,
+        duration=timedelta(hours=6),
+        start=datetime(2026, 1, 5, tzinfo=UTC),
+        flap_interval=timedelta(minutes=30),
+        edit_interval=timedelta(minutes=20),
+        edit_batch=5,
+    )
+
+    assert report.edits > 0
+    # Edits well apart are each written once the save delay has passed
+    assert 1 < report.storage_writes <= report.edits + 1
+    assert report.summary()["edits"] == report.edits
+    assert "Bulk edits:" in report.format()
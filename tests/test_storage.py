@@ -0,0 +1,122 @@
+"""Test Timer 24H storage."""
+import json
+import os
+from unittest.mock import AsyncMock, Mock
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+
+from custom_components.timer24h import async_unload_entry
+from custom_components.timer24h.const import DOMAIN, STORAGE_KEY, STORAGE_VERSION
+from custom_components.timer24h.models import Schedule, SlotMask
+from custom_components.timer24h.storage import Timer24HStorage
+
+
+def read_stored(hass):
+    """Return the schedule IDs written to the store file."""
+    with open(hass.config.path(".storage", STORAGE_KEY), encoding="utf-8") as file:
+        return list(json.load(file)["data"]["schedules"])
+
+
+async def add_schedules(storage, *schedule_ids):
+    """Load the storage and add a schedule for each ID."""
+    await storage.async_load()
+    for schedule_id in schedule_ids:
+        await storage.async_add_schedule(
+            Schedule(schedule_id=schedule_id, target_entity_id="light.porch")
+        )
+
+
+class TestWriteBehind:
+    """Test coalescing writes behind a dirty flag."""
+
+    def test_coalesced_save(self, fake_hass, run):
+        """Test that many changes are written once by the delayed save."""
+        storage = Timer24HStorage(fake_hass)
+        run(add_schedules(storage, "a", "b", "c"))
+
+        assert storage.dirty
+        assert storage.get_metrics()["counters"] == {"save_requests": 3}
+
+        async def _final_write():
+            fake_hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+
+        run(_final_write())
+
+        assert not storage.dirty
+        assert storage.get_metrics()["counters"]["delayed_saves"] == 1
+        assert read_stored(fake_hass) == ["a", "b", "c"]
+
+    def test_flush(self, fake_hass, run):
+        """Test that flushing writes pending changes once."""
+        storage = Timer24HStorage(fake_hass)
+        run(add_schedules(storage, "a", "b"))
+
+        run(storage.async_flush())
+        run(storage.async_flush())
+
+        assert not storage.dirty
+        assert storage.get_metrics()["counters"]["saves"] == 1
+        assert read_stored(fake_hass) == ["a", "b"]
+
+    def test_flush_on_unload(self, fake_hass, mock_config_entry, run):
+        """Test that unloading the entry writes pending changes."""
+        storage = Timer24HStorage(fake_hass)
+        run(add_schedules(storage, "a"))
+        coordinator = Mock(async_shutdown=AsyncMock())
+        fake_hass.config_entries = Mock(
+            async_unload_platforms=AsyncMock(return_value=True)
+        )
+        fake_hass.data[DOMAIN] = {
+            mock_config_entry.entry_id: {
+                "coordinator": coordinator,
+                "storage": storage,
+            }
+        }
+
+        assert run(async_unload_entry(fake_hass, mock_config_entry))
+
+        coordinator.async_shutdown.assert_awaited_once()
+        assert not storage.dirty
+        assert read_stored(fake_hass) == ["a"]
+        assert fake_hass.data[DOMAIN] == {}
+
+
+class TestMigration:
+    """Test migrating data stored by older versions."""
+
+    def test_slot_lists(self, fake_hass, run):
+        """Test that version 1 boolean slot lists are migrated to hex."""
+        slots = [index % 2 == 0 for index in range(48)]
+        path = fake_hass.config.path(".storage", STORAGE_KEY)
+        os.makedirs(os.path.dirname(path))
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "version": 1,
+                    "key": STORAGE_KEY,
+                    "data": {
+                        "schedules": {
+                            "porch": {
+                                "schedule_id": "porch",
+                                "target_entity_id": "light.porch",
+                                "slots": slots,
+                                "enabled": True,
+                                "timezone": None,
+                                "conditions": [],
+                            }
+                        }
+                    },
+                },
+                file,
+            )
+
+        storage = Timer24HStorage(fake_hass)
+        run(storage.async_load())
+
+        schedule = run(storage.async_get_schedule("porch"))
+        assert schedule.slots == SlotMask.coerce(slots, 48)
+
+        with open(path, encoding="utf-8") as file:
+            stored = json.load(file)
+        assert stored["version"] == STORAGE_VERSION
+        assert stored["data"]["schedules"]["porch"]["slots"] == schedule.slots.to_hex()
@@ -0,0 +1,371 @@
+"""Test the Timer 24H websocket API."""
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+import voluptuous as vol
+
+from custom_components.timer24h.const import DOMAIN
+from custom_components.timer24h.models import Condition, Schedule, SlotMask
+from custom_components.timer24h.websocket_api import (
+    ws_get_all_states,
+    ws_list_schedules,
+    ws_preview_schedule,
+    ws_subscribe,
+)
+
+DAYTIME = SlotMask.from_intervals([["06:00", "20:00"]], 48)
+
+
+def daytime_schedule(schedule_id, *entity_ids):
+    """Schedule of light.<schedule_id>, forced off by its condition entities."""
+    return Schedule(
+        schedule_id=schedule_id,
+        target_entity_id=f"light.{schedule_id}",
+        slots=DAYTIME,
+        conditions=[
+            Condition(entity_id=entity_id, expected="on", policy="force_off")
+            for entity_id in entity_ids
+        ],
+    )
+
+
+@pytest.fixture
+def ws_client(fake_hass, make_coordinator, mock_config_entry, run):
+    """Set up a coordinator and return a function calling a command on it."""
+    fake_hass.config_entries = Mock()
+    fake_hass.config_entries.async_entries.return_value = [mock_config_entry]
+
+    def _setup(*schedules):
+        for schedule in schedules:
+            fake_hass.states.async_set(schedule.target_entity_id, "off")
+        coordinator = make_coordinator(*schedules)
+        fake_hass.data[DOMAIN] = {
+            mock_config_entry.entry_id: {
+                "coordinator": coordinator,
+                "storage": coordinator.storage,
+            }
+        }
+
+        def _call(handler, **msg):
+            """Validate and handle a message, returning the connection."""
+            connection = Mock(subscriptions={})
+            msg = handler._ws_schema({"id": 1, "type": handler._ws_command, **msg})
+            # Skip the async_response wrapper, which needs a real hass
+            result = getattr(handler, "__wrapped__", handler)(
+                fake_hass, connection, msg
+            )
+            if asyncio.iscoroutine(result):
+                run(result)
+            return connection
+
+        return coordinator, _call
+
+    return _setup
+
+
+def result(connection):
+    """Return the result sent over a connection."""
+    connection.send_error.assert_not_called()
+    return connection.send_result.call_args.args[1]
+
+
+def events(connection):
+    """Return the event payloads sent over a connection."""
+    return [call.args[0]["event"] for call in connection.send_message.call_args_list]
+
+
+class TestSubscribe:
+    """Test timer24h/subscribe."""
+
+    def test_snapshot_then_deltas(self, fake_hass, ws_client, run):
+        """Test that only fields that changed are sent after the snapshot."""
+        fake_hass.states.async_set("binary_sensor.home", "on")
+        coordinator, call = ws_client(
+            daytime_schedule("a", "binary_sensor.home"), daytime_schedule("b")
+        )
+
+        connection = call(ws_subscribe)
+        connection.send_result.assert_called_once_with(1)
+        (snapshot,) = events(connection)
+        assert set(snapshot["snapshot"]) == {"a", "b"}
+        assert snapshot["snapshot"]["a"]["desired_state"] is True
+
+        async def _changes():
+            fake_hass.states.async_set("binary_sensor.home", "off")
+            await fake_hass.async_block_till_done()
+            # Reconciling without changes sends nothing
+            await coordinator.async_reconcile_schedule("b")
+            await asyncio.sleep(0)
+
+        run(_changes())
+
+        assert events(connection)[1:] == [
+            {
+                "changes": {
+                    "a": {
+                        "desired_state": False,
+                        "last_applied_state": False,
+                        "last_condition_evaluation": "Force off: binary_sensor.home",
+                    }
+                },
+                "removed": [],
+            }
+        ]
+
+    def test_coalesced(self, fake_hass, ws_client, run):
+        """Test that changes in one loop iteration are sent as one message."""
+        fake_hass.states.async_set("binary_sensor.home", "on")
+        _, call = ws_client(
+            daytime_schedule("a", "binary_sensor.home"),
+            daytime_schedule("b", "binary_sensor.home"),
+        )
+        connection = call(ws_subscribe)
+
+        async def _changes():
+            fake_hass.states.async_set("binary_sensor.home", "off")
+            await fake_hass.async_block_till_done()
+            await asyncio.sleep(0)
+
+        run(_changes())
+
+        (_, message) = events(connection)
+        assert set(message["changes"]) == {"a", "b"}
+        assert message["changes"]["a"]["desired_state"] is False
+
+    def test_added_and_removed(self, fake_hass, ws_client, run):
+        """Test that added schedules are sent whole and removals listed."""
+        coordinator, call = ws_client(daytime_schedule("a"))
+        fake_hass.states.async_set("light.b", "off")
+        connection = call(ws_subscribe)
+
+        async def _changes():
+            await coordinator.async_bulk_set(
+                [
+                    {"schedule_id": "a", "action": "remove"},
+                    {"schedule_id": "b", "target_entity_id": "light.b"},
+                ]
+            )
+            await asyncio.sleep(0)
+
+        run(_changes())
+
+        (_, message, *_) = events(connection)
+        assert message["removed"] == ["a"]
+        assert set(message["changes"]["b"]) == {
+            "desired_state",
+            "last_applied_state",
+            "last_condition_evaluation",
+            "schedule",
+        }
+
+    def test_unsubscribe(self, fake_hass, ws_client, run):
+        """Test that nothing is sent once the subscription is stopped."""
+        coordinator, call = ws_client(daytime_schedule("a"))
+        connection = call(ws_subscribe)
+
+        connection.subscriptions[1]()
+
+        async def _changes():
+            await coordinator.async_disable_schedule("a")
+            await asyncio.sleep(0)
+
+        run(_changes())
+        assert len(events(connection)) == 1
+
+
+class TestListing:
+    """Test timer24h/list and timer24h/get_all_states."""
+
+    @pytest.fixture
+    def call(self, fake_hass, ws_client):
+        """Set up schedules of several domains, states and conditions."""
+        fake_hass.states.async_set("switch.c", "off")
+        fake_hass.states.async_set("binary_sensor.home", "off")
+        self.coordinator, call = ws_client(
+            daytime_schedule("a"),
+            daytime_schedule("b", "binary_sensor.home"),
+            Schedule(schedule_id="c", target_entity_id="switch.c", enabled=False),
+            daytime_schedule("d"),
+        )
+        return call
+
+    def test_plain_list(self, call):
+        """Test that the list keeps its plain shape without listing options."""
+        schedules = result(call(ws_list_schedules))
+
+        assert [row["schedule_id"] for row in schedules] == ["a", "b", "c", "d"]
+        assert schedules[0]["state"]["desired_state"] is True
+
+        # Projection alone keeps the plain list
+        schedules = result(call(ws_list_schedules, fields=["enabled"]))
+        assert schedules[2] == {"schedule_id": "c", "enabled": False}
+
+    def test_if_version(self, call, run):
+        """Test that an unchanged version is answered without schedules."""
+        version = self.coordinator.data_version
+        assert result(call(ws_list_schedules, if_version=version)) == {
+            "version": version,
+            "not_modified": True,
+        }
+
+        payload = result(call(ws_list_schedules, if_version=version - 1))
+        assert payload["version"] == version
+        assert payload["not_modified"] is False
+        assert len(payload["schedules"]) == 4
+
+        run(self.coordinator.async_disable_schedule("a"))
+        payload = result(call(ws_list_schedules, if_version=version))
+        assert payload["version"] > version
+        assert payload["not_modified"] is False
+
+        payload = result(call(ws_get_all_states, if_version=payload["version"]))
+        assert payload["not_modified"] is True
+        assert "schedules" not in payload
+        assert payload["current_slot"] == 12
+
+    def test_cursor(self, call):
+        """Test walking every page with the returned cursors."""
+        pages = []
+        cursor = None
+        while True:
+            options = {"limit": 3} if cursor is None else {"limit": 3, "cursor": cursor}
+            payload = result(call(ws_list_schedules, **options))
+            pages.append([row["schedule_id"] for row in payload["schedules"]])
+            cursor = payload["next_cursor"]
+            if cursor is None:
+                break
+
+        assert pages == [["a", "b", "c"], ["d"]]
+
+        payload = result(call(ws_get_all_states, limit=2, cursor="a"))
+        assert list(payload["schedules"]) == ["b", "c"]
+        assert payload["next_cursor"] == "c"
+
+    @pytest.mark.parametrize(
+        ("options", "expected"),
+        [
+            ({"target_domain": "switch"}, ["c"]),
+            ({"enabled": False}, ["c"]),
+            ({"has_conditions": True}, ["b"]),
+            ({"desired_state": True}, ["a", "d"]),
+            ({"desired_state": False}, ["b", "c"]),
+            ({"target_domain": "light", "has_conditions": False}, ["a", "d"]),
+        ],
+    )
+    def test_filters(self, call, options, expected):
+        """Test the listing filters, alone and combined."""
+        payload = result(call(ws_list_schedules, **options))
+        assert [row["schedule_id"] for row in payload["schedules"]] == expected
+
+        payload = result(call(ws_get_all_states, fields=["desired_state"], **options))
+        assert list(payload["schedules"]) == expected
+        assert all(
+            set(row) == {"desired_state"} for row in payload["schedules"].values()
+        )
+
+    def test_last_page(self, call):
+        """Test that a page ending on the last match has no next cursor."""
+        payload = result(call(ws_list_schedules, limit=2, target_domain="light"))
+        assert payload["next_cursor"] == "b"
+
+        payload = result(
+            call(ws_list_schedules, limit=2, cursor="b", target_domain="light")
+        )
+        assert [row["schedule_id"] for row in payload["schedules"]] == ["d"]
+        assert payload["next_cursor"] is None
+
+        payload = result(call(ws_list_schedules, cursor="z"))
+        assert payload["schedules"] == []
+        assert payload["next_cursor"] is None
+
+    def test_fields(self, call):
+        """Test projecting rows onto the requested fields."""
+        payload = result(
+            call(ws_get_all_states, limit=1, fields=["next_change_time", "unknown"])
+        )
+        assert payload["schedules"] == {
+            "a": {"next_change_time": "2026-01-05T20:00:00+00:00"}
+        }
+
+        payload = result(call(ws_list_schedules, limit=1, fields=[]))
+        assert payload["schedules"] == [{"schedule_id": "a"}]
+
+    def test_invalid_options(self, call):
+        """Test that invalid listing options are rejected by the schema."""
+        with pytest.raises(vol.Invalid):
+            call(ws_list_schedules, limit=0)
+        with pytest.raises(vol.Invalid):
+            call(ws_get_all_states, enabled="yes")
+
+
+class TestPreview:
+    """Test timer24h/preview."""
+
+    @pytest.fixture
+    def call(self, fake_hass, ws_client):
+        """Set up a daytime schedule and one forced off by its condition."""
+        fake_hass.states.async_set("binary_sensor.home", "off")
+        _, call = ws_client(
+            daytime_schedule("a"), daytime_schedule("b", "binary_sensor.home")
+        )
+        return call
+
+    def test_intervals(self, call):
+        """Test the merged on-intervals of one schedule."""
+        payload = result(call(ws_preview_schedule, schedule_id="a", hours=48))
+
+        assert payload == {
+            "schedule_id": "a",
+            "hours": 48,
+            "format": "intervals",
+            "start": "2026-01-05T06:00:00+00:00",
+            "intervals": [
+                ["2026-01-05T06:00:00+00:00", "2026-01-05T20:00:00+00:00"],
+                ["2026-01-06T06:00:00+00:00", "2026-01-06T20:00:00+00:00"],
+            ],
+        }
+
+    def test_slots(self, call):
+        """Test one row per slot with the slots format."""
+        payload = result(
+            call(ws_preview_schedule, schedule_id="a", hours=24, format="slots")
+        )
+
+        rows = payload["slots"]
+        assert len(rows) == 48
+        assert rows[0] == {
+            "slot_index": 12,
+            "time": "2026-01-05T06:00:00+00:00",
+            "hour": 6,
+            "minute": 0,
+            "active": True,
+        }
+        assert [row["active"] for row in rows].count(True) == 28
+        assert rows[-1]["slot_index"] == 11
+
+    def test_many(self, call):
+        """Test previewing several schedules, including unknown ones."""
+        payload = result(
+            call(ws_preview_schedule, schedule_ids=["a", "b", "missing"], hours=1)
+        )
+
+        assert payload["schedules"] == {
+            "a": {
+                "intervals": [
+                    ["2026-01-05T06:00:00+00:00", "2026-01-05T07:00:00+00:00"]
+                ]
+            },
+            "b": {"intervals": []},
+            "missing": None,
+        }
+
+    def test_errors(self, call):
+        """Test unknown schedules and requests without a schedule."""
+        connection = call(ws_preview_schedule, schedule_id="missing")
+        assert connection.send_error.call_args.args[1] == "schedule_not_found"
+
+        with pytest.raises(vol.Invalid):
+            call(ws_preview_schedule, hours=24)
+        with pytest.raises(vol.Invalid):
+            call(ws_preview_schedule, schedule_id="a", schedule_ids=["a"])